@@ -38,9 +38,6 @@ __version__ = "0.1.0"
 # Authentication (no external dependencies)
 from prismiq.auth import AuthContext, SimpleAuthContext, create_header_auth_dependency
 
-# Calculated fields (no external dependencies)
-from prismiq.calculated_fields import ExpressionParser
-
 # Dashboard store interface (no external dependencies)
 from prismiq.dashboard_store import DashboardStore, InMemoryDashboardStore
 
@@ -190,6 +187,8 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "QueryExecutor": ("prismiq.executor", "QueryExecutor"),
     # Schema introspector (requires asyncpg)
     "SchemaIntrospector": ("prismiq.schema", "SchemaIntrospector"),
+    # Calculated field expression parser (only needed by calculated fields)
+    "ExpressionParser": ("prismiq.calculated_fields", "ExpressionParser"),
     # Query builder (requires asyncpg for schema validation)
     "QueryBuilder": ("prismiq.query", "QueryBuilder"),
     "ValidationError": ("prismiq.query", "ValidationError"),
@@ -285,6 +284,7 @@ if TYPE_CHECKING:
         RedisCache,
         SchemaCache,
     )
+    from prismiq.calculated_fields import ExpressionParser
     from prismiq.engine import PrismiqEngine
     from prismiq.executor import QueryExecutor
     from prismiq.logging import (
@@ -377,7 +377,7 @@ __all__ = [
     "EnhancedColumnSchema",
     "EnhancedDatabaseSchema",
     "EnhancedTableSchema",
-    # Calculated fields (lightweight)
+    # Calculated fields (lazy)
     "ExpressionParser",
     "FilterDefinition",
     "FilterOperator",
@@ -0,0 +1,25 @@
+"""Cell value coercion shared by the result-processing modules."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def as_float(value: Any) -> float:
+    """Coerce a cell to float for summing; nulls and non-numeric values count as 0."""
+    if value is None:
+        return 0.0
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def as_float_or_none(value: Any) -> float | None:
+    """Coerce a cell to float, or None if it is null or non-numeric."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
@@ -8,9 +8,11 @@ from __future__ import annotations
 
 import fnmatch
 import hashlib
+import heapq
 import json
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict
@@ -89,38 +91,66 @@ class CacheBackend(ABC):
 class InMemoryCache(CacheBackend):
     """In-memory cache for development and testing.
 
-    Stores values with optional TTL-based expiration. Not suitable for
-    production use with multiple processes.
+    Stores values with optional TTL-based expiration and optional LRU
+    eviction once max_size entries are held. Expired entries are reclaimed
+    from a deadline heap, and prefix patterns such as "schema:org_123:*" are
+    cleared through a prefix index instead of scanning every key. Not
+    suitable for production use with multiple processes.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty cache."""
-        # Store (value, expiration_time) tuples
-        self._cache: dict[str, tuple[Any, float | None]] = {}
+    def __init__(self, max_size: int | None = None) -> None:
+        """Initialize empty cache.
+
+        Args:
+            max_size: Maximum number of entries. When exceeded, the least
+                recently used entry is evicted. None means unbounded.
+        """
+        self._max_size = max_size
+        # Store (value, expiration_time) tuples in least-recently-used order
+        self._cache: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        # Min-heap of (expiration_time, key); entries may be stale after overwrites
+        self._deadlines: list[tuple[float, str]] = []
+        # "a:" and "a:b:" -> keys starting with that colon-delimited prefix
+        self._prefix_index: dict[str, set[str]] = {}
 
     async def get(self, key: str) -> Any | None:
         """Get a value from cache."""
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             return None
 
-        value, expires_at = self._cache[key]
+        value, expires_at = entry
 
         # Check expiration
         if expires_at is not None and time.time() > expires_at:
-            del self._cache[key]
+            self._remove(key)
             return None
 
+        self._cache.move_to_end(key)
         return value
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """Set a value in cache."""
+        self._purge_expired()
+
         expires_at = time.time() + ttl if ttl is not None else None
+        if key not in self._cache:
+            for prefix in _key_prefixes(key):
+                self._prefix_index.setdefault(prefix, set()).add(key)
         self._cache[key] = (value, expires_at)
+        self._cache.move_to_end(key)
+
+        if expires_at is not None:
+            heapq.heappush(self._deadlines, (expires_at, key))
+
+        if self._max_size is not None:
+            while len(self._cache) > self._max_size:
+                self._remove(next(iter(self._cache)))
 
     async def delete(self, key: str) -> bool:
         """Delete a key from cache."""
         if key in self._cache:
-            del self._cache[key]
+            self._remove(key)
             return True
         return False
 
@@ -132,7 +162,7 @@ class InMemoryCache(CacheBackend):
         _, expires_at = self._cache[key]
 
         if expires_at is not None and time.time() > expires_at:
-            del self._cache[key]
+            self._remove(key)
             return False
 
         return True
@@ -142,26 +172,65 @@ class InMemoryCache(CacheBackend):
         if pattern is None:
             count = len(self._cache)
             self._cache.clear()
+            self._deadlines.clear()
+            self._prefix_index.clear()
             return count
 
-        # Find keys matching pattern
-        keys_to_delete = [key for key in self._cache if fnmatch.fnmatch(key, pattern)]
+        # "prefix:*" patterns are answered from the prefix index
+        prefix = pattern[:-1]
+        if pattern.endswith(":*") and not any(c in prefix for c in "*?["):
+            keys_to_delete = list(self._prefix_index.get(prefix, ()))
+        else:
+            keys_to_delete = [key for key in self._cache if fnmatch.fnmatch(key, pattern)]
 
         for key in keys_to_delete:
-            del self._cache[key]
+            self._remove(key)
 
         return len(keys_to_delete)
 
+    def _remove(self, key: str) -> None:
+        """Remove a key and its prefix-index entries (heap entries go stale)."""
+        del self._cache[key]
+        for prefix in _key_prefixes(key):
+            keys = self._prefix_index.get(prefix)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._prefix_index[prefix]
+
+    def _purge_expired(self) -> None:
+        """Pop due deadlines off the heap, removing entries that are still expired."""
+        current_time = time.time()
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] < current_time:
+            expires_at, key = heapq.heappop(deadlines)
+            entry = self._cache.get(key)
+            # Skip heap entries left behind by overwrites or deletes
+            if entry is not None and entry[1] == expires_at:
+                self._remove(key)
+
+        # Drop stale heap entries if overwrites have let the heap outgrow the cache
+        if len(deadlines) > 2 * len(self._cache) + 64:
+            self._deadlines = [
+                (expires_at, key)
+                for key, (_, expires_at) in self._cache.items()
+                if expires_at is not None
+            ]
+            heapq.heapify(self._deadlines)
+
     def _cleanup_expired(self) -> None:
         """Remove expired entries (for testing/maintenance)."""
-        current_time = time.time()
-        keys_to_delete = [
-            key
-            for key, (_, expires_at) in self._cache.items()
-            if expires_at is not None and current_time > expires_at
-        ]
-        for key in keys_to_delete:
-            del self._cache[key]
+        self._purge_expired()
+
+
+def _key_prefixes(key: str) -> list[str]:
+    """Colon-delimited prefixes of a cache key ("a:b:c" -> ["a:", "a:b:"])."""
+    prefixes: list[str] = []
+    idx = key.find(":")
+    while idx != -1:
+        prefixes.append(key[: idx + 1])
+        idx = key.find(":", idx + 1)
+    return prefixes
 
 
 class RedisCache(CacheBackend):
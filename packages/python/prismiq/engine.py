@@ -339,7 +339,11 @@ class PrismiqEngine:
             await self._llm_provider.shutdown()
             self._llm_provider = None
 
+        if self._introspector:
+            await self._introspector.close()
+
         if self._pool:
+            SchemaIntrospector.unbind_pool(self._pool)
             await self._pool.close()
             self._pool = None
 
@@ -6,15 +6,18 @@ parameterized SQL queries from QueryDefinition objects.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from difflib import get_close_matches
+from functools import cache
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict
 
-from prismiq.calculated_fields import ExpressionParser
 from prismiq.types import (
     AggregationType,
+    ColumnSchema,
     ColumnSelection,
     DatabaseSchema,
     FilterDefinition,
@@ -69,6 +72,86 @@ ERROR_CIRCULAR_JOIN = "CIRCULAR_JOIN"
 ERROR_AMBIGUOUS_COLUMN = "AMBIGUOUS_COLUMN"
 ERROR_INVALID_TIME_SERIES = "INVALID_TIME_SERIES"
 
+# Opening SQL fragment for each aggregation function (NONE is not present).
+_AGGREGATION_SQL_PREFIX: dict[AggregationType, str] = {
+    AggregationType.SUM: "SUM(",
+    AggregationType.AVG: "AVG(",
+    AggregationType.COUNT: "COUNT(",
+    AggregationType.COUNT_DISTINCT: "COUNT(DISTINCT ",
+    AggregationType.MIN: "MIN(",
+    AggregationType.MAX: "MAX(",
+}
+
+# Nullable side(s) of each join type: bit 0 is the from-table, bit 1 the to-table.
+_NULLABLE_SIDE_MASK: dict[JoinType, int] = {
+    JoinType.INNER: 0b00,
+    JoinType.LEFT: 0b10,
+    JoinType.RIGHT: 0b01,
+    JoinType.FULL: 0b11,
+}
+
+# Aggregations that only make sense on numeric columns.
+_NUMERIC_AGGREGATIONS = frozenset({AggregationType.SUM, AggregationType.AVG})
+
+# Substrings that mark a PostgreSQL data type as numeric (matched against the
+# lowercased type, so parameterized types like 'numeric(10,2)' count too).
+_NUMERIC_TYPE_MARKERS = (
+    "integer",
+    "bigint",
+    "smallint",
+    "numeric",
+    "decimal",
+    "real",
+    "double precision",
+)
+
+# Substrings that mark a data type as a date/timestamp ('timestamp' also covers
+# 'timestamp with time zone' and 'timestamptz').
+_DATE_TYPE_MARKERS = ("date", "timestamp")
+
+
+@cache
+def _is_numeric_type(data_type: str) -> bool:
+    """Check whether a column data type is numeric.
+
+    Cached per type string: a schema only has a handful of distinct types.
+    """
+    data_type_lower = data_type.lower()
+    return any(marker in data_type_lower for marker in _NUMERIC_TYPE_MARKERS)
+
+
+# Value shape required by operators that take a list: operator -> (check, requirement).
+_OPERATOR_VALUE_SHAPES: dict[FilterOperator, tuple[Callable[[Any], bool], str]] = {
+    FilterOperator.IN: (lambda v: isinstance(v, list), "a list value"),
+    FilterOperator.NOT_IN: (lambda v: isinstance(v, list), "a list value"),
+    FilterOperator.BETWEEN: (
+        lambda v: isinstance(v, list | tuple) and len(v) == 2,
+        "a list/tuple of exactly 2 values",
+    ),
+}
+
+
+@dataclass(slots=True)
+class _BuildContext:
+    """Mutable state threaded through the clause writers of a single build()."""
+
+    table_refs: dict[str, str]
+    """table_id -> quoted table reference (alias or name)."""
+
+    table_map: dict[str, str]
+    """table_id -> table name, for schema lookups."""
+
+    calc_sql_map: dict[str, str]
+    """Calculated field name -> SQL expression."""
+
+    params: list[Any] = field(default_factory=list)
+    """Bound parameters, in placeholder order."""
+
+    def bind(self, value: Any) -> str:
+        """Append a parameter and return its $N placeholder."""
+        self.params.append(value)
+        return f"${len(self.params)}"
+
 
 class QueryBuilder:
     """Builds parameterized SQL queries from QueryDefinition objects.
@@ -107,6 +190,17 @@ class QueryBuilder:
         self._schema_name = schema_name
         self._fiscal_year_start_month = fiscal_year_start_month
 
+        # Table name -> column name -> column, built once so validation and
+        # building do dict hits instead of rescanning the schema lists.
+        # The first table/column with a given name wins, as in get_table().
+        self._columns_by_table: dict[str, dict[str, ColumnSchema]] = {}
+        for table in schema.tables:
+            if table.name not in self._columns_by_table:
+                columns: dict[str, ColumnSchema] = {}
+                for col in table.columns:
+                    columns.setdefault(col.name, col)
+                self._columns_by_table[table.name] = columns
+
     def validate(self, query: QueryDefinition) -> list[str]:
         """Validate a query definition against the schema.
 
@@ -140,11 +234,11 @@ class QueryBuilder:
             table_map[qt.id] = qt.name
 
         # Get all available table names for suggestions
-        available_tables = self._schema.table_names()
+        available_tables = list(self._columns_by_table)
 
         # Validate tables exist in schema
         for i, qt in enumerate(query.tables):
-            if not self._schema.has_table(qt.name):
+            if qt.name not in self._columns_by_table:
                 suggestion = self._suggest_similar(qt.name, available_tables)
                 errors.append(
                     ValidationError(
@@ -162,18 +256,19 @@ class QueryBuilder:
         for i, col in enumerate(query.columns):
             table_name = table_map.get(col.table_id)
             if table_name:
-                table = self._schema.get_table(table_name)
-                if table:
+                columns = self._columns_by_table.get(table_name)
+                if columns is not None:
                     # Allow "*" for COUNT(*) - this is a valid SQL pattern
-                    if col.column == "*" and col.aggregation == AggregationType.COUNT:
+                    if col.column == "*" and col.aggregation is AggregationType.COUNT:
                         continue  # Skip further validation for COUNT(*)
 
                     # Allow references to calculated fields - they're defined in calculated_fields
                     if col.column in calculated_field_names:
                         continue  # Skip further validation for calculated field references
 
-                    if not table.has_column(col.column):
-                        available_columns = [c.name for c in table.columns]
+                    column_schema = columns.get(col.column)
+                    if column_schema is None:
+                        available_columns = list(columns)
                         suggestion = self._suggest_similar(col.column, available_columns)
                         errors.append(
                             ValidationError(
@@ -185,32 +280,30 @@ class QueryBuilder:
                         )
                     else:
                         # Validate aggregation is valid for column type
-                        if col.aggregation != AggregationType.NONE:
-                            column_schema = table.get_column(col.column)
-                            if column_schema:
-                                agg_error = self._validate_aggregation(
-                                    col.aggregation, column_schema.data_type, col.column
-                                )
-                                if agg_error:
-                                    errors.append(
-                                        ValidationError(
-                                            code=ERROR_INVALID_AGGREGATION,
-                                            message=agg_error,
-                                            field=f"columns[{i}].aggregation",
-                                            suggestion=self._suggest_aggregation(
-                                                column_schema.data_type
-                                            ),
-                                        )
+                        if col.aggregation is not AggregationType.NONE:
+                            agg_error = self._validate_aggregation(
+                                col.aggregation, column_schema.data_type, col.column
+                            )
+                            if agg_error:
+                                errors.append(
+                                    ValidationError(
+                                        code=ERROR_INVALID_AGGREGATION,
+                                        message=agg_error,
+                                        field=f"columns[{i}].aggregation",
+                                        suggestion=self._suggest_aggregation(
+                                            column_schema.data_type
+                                        ),
                                     )
+                                )
 
         # Validate join columns
         for i, join in enumerate(query.joins):
             # From column
             from_table_name = table_map.get(join.from_table_id)
             if from_table_name:
-                from_table = self._schema.get_table(from_table_name)
-                if from_table and not from_table.has_column(join.from_column):
-                    available_columns = [c.name for c in from_table.columns]
+                from_columns = self._columns_by_table.get(from_table_name)
+                if from_columns is not None and join.from_column not in from_columns:
+                    available_columns = list(from_columns)
                     suggestion = self._suggest_similar(join.from_column, available_columns)
                     errors.append(
                         ValidationError(
@@ -224,9 +317,9 @@ class QueryBuilder:
             # To column
             to_table_name = table_map.get(join.to_table_id)
             if to_table_name:
-                to_table = self._schema.get_table(to_table_name)
-                if to_table and not to_table.has_column(join.to_column):
-                    available_columns = [c.name for c in to_table.columns]
+                to_columns = self._columns_by_table.get(to_table_name)
+                if to_columns is not None and join.to_column not in to_columns:
+                    available_columns = list(to_columns)
                     suggestion = self._suggest_similar(join.to_column, available_columns)
                     errors.append(
                         ValidationError(
@@ -241,14 +334,15 @@ class QueryBuilder:
         for i, f in enumerate(query.filters):
             table_name = table_map.get(f.table_id)
             if table_name:
-                table = self._schema.get_table(table_name)
-                if table:
+                columns = self._columns_by_table.get(table_name)
+                if columns is not None:
                     # Allow references to calculated fields - they're defined in calculated_fields
                     if f.column in calculated_field_names:
                         continue  # Skip further validation for calculated field references
 
-                    if not table.has_column(f.column):
-                        available_columns = [c.name for c in table.columns]
+                    column_schema = columns.get(f.column)
+                    if column_schema is None:
+                        available_columns = list(columns)
                         suggestion = self._suggest_similar(f.column, available_columns)
                         errors.append(
                             ValidationError(
@@ -260,8 +354,7 @@ class QueryBuilder:
                         )
                     else:
                         # Validate filter value type matches column type
-                        column_schema = table.get_column(f.column)
-                        if column_schema and f.value is not None:
+                        if f.value is not None:
                             type_error = self._validate_filter_type(
                                 f.operator, f.value, column_schema.data_type, f.column
                             )
@@ -283,9 +376,9 @@ class QueryBuilder:
 
             table_name = table_map.get(o.table_id)
             if table_name:
-                table = self._schema.get_table(table_name)
-                if table and not table.has_column(o.column):
-                    available_columns = [c.name for c in table.columns]
+                columns = self._columns_by_table.get(table_name)
+                if columns is not None and o.column not in columns:
+                    available_columns = list(columns)
                     suggestion = self._suggest_similar(o.column, available_columns)
                     errors.append(
                         ValidationError(
@@ -331,13 +424,14 @@ class QueryBuilder:
             )
             return errors
 
-        table = self._schema.get_table(table_name)
-        if not table:
+        columns = self._columns_by_table.get(table_name)
+        if columns is None:
             return errors
 
         # Validate date column exists
-        if not table.has_column(ts.date_column):
-            available_columns = [c.name for c in table.columns]
+        column_schema = columns.get(ts.date_column)
+        if column_schema is None:
+            available_columns = list(columns)
             suggestion = self._suggest_similar(ts.date_column, available_columns)
             errors.append(
                 ValidationError(
@@ -349,25 +443,16 @@ class QueryBuilder:
             )
         else:
             # Validate column is a date/timestamp type
-            column_schema = table.get_column(ts.date_column)
-            if column_schema:
-                date_types = {
-                    "date",
-                    "timestamp",
-                    "timestamp without time zone",
-                    "timestamp with time zone",
-                    "timestamptz",
-                }
-                is_date_type = any(dt in column_schema.data_type.lower() for dt in date_types)
-                if not is_date_type:
-                    errors.append(
-                        ValidationError(
-                            code=ERROR_INVALID_TIME_SERIES,
-                            message=f"Column '{ts.date_column}' is not a date/timestamp type (found: {column_schema.data_type})",
-                            field="time_series.date_column",
-                            suggestion="Use a column with date, timestamp, or timestamptz type",
-                        )
+            data_type_lower = column_schema.data_type.lower()
+            if not any(marker in data_type_lower for marker in _DATE_TYPE_MARKERS):
+                errors.append(
+                    ValidationError(
+                        code=ERROR_INVALID_TIME_SERIES,
+                        message=f"Column '{ts.date_column}' is not a date/timestamp type (found: {column_schema.data_type})",
+                        field="time_series.date_column",
+                        suggestion="Use a column with date, timestamp, or timestamptz type",
                     )
+                )
 
         return errors
 
@@ -375,17 +460,15 @@ class QueryBuilder:
         self, name: str, candidates: list[str], max_suggestions: int = 3
     ) -> str | None:
         """Find similar names for suggestions."""
-        matches = get_close_matches(
-            name.lower(), [c.lower() for c in candidates], n=max_suggestions, cutoff=0.6
-        )
+        # Lowercased name -> original spelling (first one wins), so matches map
+        # back to their original case with a dict hit instead of a rescan
+        originals: dict[str, str] = {}
+        for candidate in candidates:
+            originals.setdefault(candidate.lower(), candidate)
+
+        matches = get_close_matches(name.lower(), originals, n=max_suggestions, cutoff=0.6)
         if matches:
-            # Map back to original case
-            original_matches = []
-            for match in matches:
-                for candidate in candidates:
-                    if candidate.lower() == match:
-                        original_matches.append(candidate)
-                        break
+            original_matches = [originals[match] for match in matches]
             if len(original_matches) == 1:
                 return f"Did you mean '{original_matches[0]}'?"
             elif len(original_matches) > 1:
@@ -396,42 +479,14 @@ class QueryBuilder:
         self, agg: AggregationType, data_type: str, column_name: str
     ) -> str | None:
         """Validate that an aggregation is valid for a data type."""
-        # Numeric aggregations
-        numeric_aggs = {AggregationType.SUM, AggregationType.AVG}
-        numeric_types = {
-            "integer",
-            "bigint",
-            "smallint",
-            "numeric",
-            "decimal",
-            "real",
-            "double precision",
-        }
-
-        if agg in numeric_aggs:
-            # Check if type is numeric-ish
-            data_type_lower = data_type.lower()
-            is_numeric = any(nt in data_type_lower for nt in numeric_types)
-            if not is_numeric:
-                return f"Aggregation '{agg.value}' is not valid for column '{column_name}' of type '{data_type}'"
+        if agg in _NUMERIC_AGGREGATIONS and not _is_numeric_type(data_type):
+            return f"Aggregation '{agg.value}' is not valid for column '{column_name}' of type '{data_type}'"
 
         return None
 
     def _suggest_aggregation(self, data_type: str) -> str | None:
         """Suggest valid aggregations for a data type."""
-        data_type_lower = data_type.lower()
-        numeric_types = {
-            "integer",
-            "bigint",
-            "smallint",
-            "numeric",
-            "decimal",
-            "real",
-            "double precision",
-        }
-
-        is_numeric = any(nt in data_type_lower for nt in numeric_types)
-        if is_numeric:
+        if _is_numeric_type(data_type):
             return "Valid aggregations for this column: sum, avg, min, max, count"
         else:
             return "Valid aggregations for this column: min, max, count"
@@ -440,31 +495,17 @@ class QueryBuilder:
         self, operator: FilterOperator, value: Any, data_type: str, column_name: str
     ) -> str | None:
         """Validate that a filter value is compatible with the column type."""
-        data_type_lower = data_type.lower()
-
-        # Check for list operators - combined condition
-        if operator in (FilterOperator.IN, FilterOperator.NOT_IN) and not isinstance(value, list):
-            return f"Operator '{operator.value}' requires a list value for column '{column_name}'"
-
-        # Check for between operator - combined condition
-        if operator == FilterOperator.BETWEEN and (
-            not isinstance(value, list | tuple) or len(value) != 2
-        ):
-            return f"Operator 'between' requires a list/tuple of exactly 2 values for column '{column_name}'"
+        # Check the value shape for list operators (IN, NOT_IN, BETWEEN)
+        shape = _OPERATOR_VALUE_SHAPES.get(operator)
+        if shape is not None:
+            check, requirement = shape
+            if not check(value):
+                return (
+                    f"Operator '{operator.value}' requires {requirement} for column '{column_name}'"
+                )
 
         # Basic numeric type checking
-        numeric_types = {
-            "integer",
-            "bigint",
-            "smallint",
-            "numeric",
-            "decimal",
-            "real",
-            "double precision",
-        }
-        is_numeric_column = any(nt in data_type_lower for nt in numeric_types)
-
-        if is_numeric_column and operator not in (
+        if _is_numeric_type(data_type) and operator not in (
             FilterOperator.IS_NULL,
             FilterOperator.IS_NOT_NULL,
         ):
@@ -477,7 +518,7 @@ class QueryBuilder:
                 for v in value:
                     if v is not None and not isinstance(v, int | float):
                         return f"Column '{column_name}' is numeric but received non-numeric value in list"
-            elif operator == FilterOperator.BETWEEN and isinstance(value, list | tuple):
+            elif operator is FilterOperator.BETWEEN and isinstance(value, list | tuple):
                 for v in value:
                     if not isinstance(v, int | float):
                         return f"Column '{column_name}' is numeric but received non-numeric value in range"
@@ -535,8 +576,8 @@ class QueryBuilder:
                 # Unknown table_id - skip this filter
                 continue
 
-            table = self._schema.get_table(table_name)
-            if not table:
+            columns = self._columns_by_table.get(table_name)
+            if columns is None:
                 # Unknown table - skip this filter
                 continue
 
@@ -546,7 +587,7 @@ class QueryBuilder:
                 continue
 
             # Check if column exists in table
-            if table.has_column(f.column):
+            if f.column in columns:
                 valid_filters.append(f)
             # else: column doesn't exist - skip this filter silently
 
@@ -565,8 +606,6 @@ class QueryBuilder:
         Returns:
             Tuple of (sql_string, parameters) where parameters use $1, $2 placeholders.
         """
-        params: list[Any] = []
-
         # Build table_id -> table_name mapping for schema lookup
         table_map: dict[str, str] = {}
         for qt in query.tables:
@@ -578,6 +617,8 @@ class QueryBuilder:
         # Build calculated field SQL map (shared across SELECT, WHERE, ORDER BY)
         calc_sql_map = self._build_calc_sql_map(query)
 
+        ctx = _BuildContext(table_refs, table_map, calc_sql_map)
+
         # SELECT clause - with time series support
         select_clause = self._build_select(query, table_refs, calc_sql_map)
 
@@ -585,14 +626,10 @@ class QueryBuilder:
         on_filters, where_filters = self._partition_filters(query, calc_sql_map)
 
         # FROM clause (ON-clause params come first: $1, $2, ...)
-        from_clause, params = self._build_from(
-            query, table_refs, table_map, on_filters, calc_sql_map, params
-        )
+        from_clause = self._build_from(query, on_filters, ctx)
 
         # WHERE clause (params continue: $N+1, ...)
-        where_clause, params = self._build_where(
-            where_filters, table_refs, table_map, calc_sql_map, params, query
-        )
+        where_clause = self._build_where(where_filters, ctx, query)
 
         # GROUP BY clause - with time series support
         group_by_clause = self._build_group_by(query, table_refs, calc_sql_map)
@@ -603,13 +640,11 @@ class QueryBuilder:
         # LIMIT and OFFSET
         limit_clause = ""
         if query.limit is not None:
-            params.append(query.limit)
-            limit_clause = f" LIMIT ${len(params)}"
+            limit_clause = f" LIMIT {ctx.bind(query.limit)}"
 
         offset_clause = ""
         if query.offset is not None:
-            params.append(query.offset)
-            offset_clause = f" OFFSET ${len(params)}"
+            offset_clause = f" OFFSET {ctx.bind(query.offset)}"
 
         # Combine all clauses
         sql = f"SELECT {select_clause} FROM {from_clause}"
@@ -621,7 +656,7 @@ class QueryBuilder:
             sql += f" ORDER BY {order_by_clause}"
         sql += limit_clause + offset_clause
 
-        return sql, params
+        return sql, ctx.params
 
     def _build_calc_sql_map(self, query: QueryDefinition) -> dict[str, str]:
         """Build mapping from calculated field names to their SQL expressions.
@@ -659,6 +694,10 @@ class QueryBuilder:
                 # Fall back to parsing on-demand. This is a secondary code path
                 # that won't resolve inter-field references correctly. Prefer
                 # providing sql_expression pre-computed with inter-field deps resolved.
+                # Imported lazily so queries without calculated fields never
+                # load the expression parser.
+                from prismiq.calculated_fields import ExpressionParser
+
                 try:
                     parser = ExpressionParser()
                     ast = parser.parse(cf.expression)
@@ -710,14 +749,14 @@ class QueryBuilder:
             table_ref = table_refs[col.table_id]
 
             # Handle COUNT(*) specially - don't quote the asterisk
-            if col.column == "*" and col.aggregation == AggregationType.COUNT:
+            if col.column == "*" and col.aggregation is AggregationType.COUNT:
                 col_ref = "COUNT(*)"
             # Handle column with inline sql_expression (e.g., calculated field)
             elif col.sql_expression:
                 col_ref = f"({col.sql_expression})"
 
                 # Apply aggregation if specified
-                if col.aggregation != AggregationType.NONE:
+                if col.aggregation is not AggregationType.NONE:
                     col_ref = self._apply_aggregation(col_ref, col.aggregation)
             # Handle calculated field references - expand to SQL expression
             elif col.column in calc_sql_map:
@@ -725,7 +764,7 @@ class QueryBuilder:
                 col_ref = f"({calc_sql_map[col.column]})"
 
                 # Apply aggregation if specified
-                if col.aggregation != AggregationType.NONE:
+                if col.aggregation is not AggregationType.NONE:
                     col_ref = self._apply_aggregation(col_ref, col.aggregation)
             else:
                 col_ref = f"{table_ref}.{self._quote_identifier(col.column)}"
@@ -735,7 +774,7 @@ class QueryBuilder:
                     col_ref = f"date_trunc('{col.date_trunc}', {col_ref})"
 
                 # Apply aggregation if specified
-                if col.aggregation != AggregationType.NONE:
+                if col.aggregation is not AggregationType.NONE:
                     col_ref = self._apply_aggregation(col_ref, col.aggregation)
 
             # Apply alias if specified
@@ -748,23 +787,10 @@ class QueryBuilder:
 
     def _apply_aggregation(self, col_ref: str, agg: AggregationType) -> str:
         """Apply aggregation function to column reference."""
-        agg_map = {
-            AggregationType.SUM: "SUM",
-            AggregationType.AVG: "AVG",
-            AggregationType.COUNT: "COUNT",
-            AggregationType.COUNT_DISTINCT: "COUNT_DISTINCT",
-            AggregationType.MIN: "MIN",
-            AggregationType.MAX: "MAX",
-        }
-
-        if agg == AggregationType.COUNT_DISTINCT:
-            return f"COUNT(DISTINCT {col_ref})"
-
-        func = agg_map.get(agg, "")
-        if func:
-            return f"{func}({col_ref})"
-
-        return col_ref
+        prefix = _AGGREGATION_SQL_PREFIX.get(agg)
+        if prefix is None:
+            return col_ref
+        return f"{prefix}{col_ref})"
 
     def _partition_filters(
         self,
@@ -783,62 +809,45 @@ class QueryBuilder:
         if not query.joins or not query.filters:
             return {}, list(query.filters)
 
-        # Build a map of table_id -> set of join indices where that table is
-        # on the nullable side.
-        nullable_side: dict[str, set[int]] = {}
+        # Build a map of table_id -> index of the first join where that table
+        # is on the nullable side. A table can appear on the nullable side of
+        # multiple joins (e.g., two FULL JOINs), but we must not duplicate the
+        # filter or params will be corrupted, so only the lowest index is kept.
+        nullable_side: dict[str, int] = {}
         for i, join in enumerate(query.joins):
-            match join.join_type:
-                case JoinType.LEFT:
-                    nullable_side.setdefault(join.to_table_id, set()).add(i)
-                case JoinType.RIGHT:
-                    nullable_side.setdefault(join.from_table_id, set()).add(i)
-                case JoinType.FULL:
-                    nullable_side.setdefault(join.to_table_id, set()).add(i)
-                    nullable_side.setdefault(join.from_table_id, set()).add(i)
-                case JoinType.INNER:
-                    pass
+            mask = _NULLABLE_SIDE_MASK[join.join_type]
+            if mask & 0b01:
+                nullable_side.setdefault(join.from_table_id, i)
+            if mask & 0b10:
+                nullable_side.setdefault(join.to_table_id, i)
 
         on_filters: dict[int, list[FilterDefinition]] = {}
         where_filters: list[FilterDefinition] = []
 
         for f in query.filters:
-            # Exceptions: always stay in WHERE
-            if f.sql_expression or f.column in calc_sql_map:
+            idx = nullable_side.get(f.table_id)
+            # Exceptions: sql_expression and calculated field filters always stay in WHERE
+            if idx is None or f.sql_expression or f.column in calc_sql_map:
                 where_filters.append(f)
-                continue
-
-            join_indices = nullable_side.get(f.table_id)
-            if join_indices:
-                # Place on the first (lowest-index) matching join's ON clause.
-                # A table can appear on the nullable side of multiple joins
-                # (e.g., two FULL JOINs), but we must not duplicate the filter
-                # or params will be corrupted.
-                idx = min(join_indices)
-                on_filters.setdefault(idx, []).append(f)
             else:
-                where_filters.append(f)
+                on_filters.setdefault(idx, []).append(f)
 
         return on_filters, where_filters
 
     def _build_from(
         self,
         query: QueryDefinition,
-        table_refs: dict[str, str],
-        table_map: dict[str, str],
         on_filters: dict[int, list[FilterDefinition]],
-        calc_sql_map: dict[str, str],
-        params: list[Any],
-    ) -> tuple[str, list[Any]]:
+        ctx: _BuildContext,
+    ) -> str:
         """Build the FROM clause including JOINs.
 
         Uses schema-qualified table names if schema_name is set.
-        ON-clause filters are appended to the appropriate JOIN conditions.
-
-        Returns:
-            Tuple of (from_clause_sql, params).
+        ON-clause filters are appended to the appropriate JOIN conditions,
+        binding their parameters into ctx.
         """
         if not query.tables:
-            return "", params
+            return ""
 
         # Track which tables are already in the FROM clause
         tables_in_from: set[str] = set()
@@ -858,8 +867,8 @@ class QueryBuilder:
                 continue
 
             join_type = self._join_type_sql(join.join_type)
-            from_ref = table_refs[join.from_table_id]
-            to_ref = table_refs[join.to_table_id]
+            from_ref = ctx.table_refs[join.from_table_id]
+            to_ref = ctx.table_refs[join.to_table_id]
 
             table_sql = self._quote_table(to_table.name)
             if to_table.alias:
@@ -873,11 +882,8 @@ class QueryBuilder:
 
             # Append ON-clause filters for this join
             for f in on_filters.get(i, []):
-                col_ref, data_type = self._resolve_filter_col_ref(
-                    f, table_refs, table_map, calc_sql_map
-                )
-                condition, params = self._build_condition(col_ref, f, data_type, params)
-                sql += f" AND {condition}"
+                col_ref, data_type = self._resolve_filter_col_ref(f, ctx)
+                sql += f" AND {self._build_condition(col_ref, f, data_type, ctx)}"
 
             tables_in_from.add(join.to_table_id)
 
@@ -890,7 +896,7 @@ class QueryBuilder:
                 sql += f", {table_sql}"
                 tables_in_from.add(qt.id)
 
-        return sql, params
+        return sql
 
     def _join_type_sql(self, join_type: JoinType) -> str:
         """Convert JoinType enum to SQL keyword."""
@@ -904,9 +910,7 @@ class QueryBuilder:
     def _resolve_filter_col_ref(
         self,
         f: FilterDefinition,
-        table_refs: dict[str, str],
-        table_map: dict[str, str],
-        calc_sql_map: dict[str, str],
+        ctx: _BuildContext,
     ) -> tuple[str, str | None]:
         """Resolve a filter to its column reference SQL and data type.
 
@@ -916,35 +920,30 @@ class QueryBuilder:
         """
         if f.sql_expression:
             return f"({f.sql_expression})", None
-        if f.column in calc_sql_map:
-            return f"({calc_sql_map[f.column]})", None
+        if f.column in ctx.calc_sql_map:
+            return f"({ctx.calc_sql_map[f.column]})", None
 
-        table_ref = table_refs[f.table_id]
+        table_ref = ctx.table_refs[f.table_id]
         col_ref = f"{table_ref}.{self._quote_identifier(f.column)}"
 
         data_type: str | None = None
-        table_name = table_map.get(f.table_id)
+        table_name = ctx.table_map.get(f.table_id)
         if table_name:
-            table = self._schema.get_table(table_name)
-            if table:
-                column = table.get_column(f.column)
-                if column:
-                    data_type = column.data_type
+            column = self._columns_by_table.get(table_name, {}).get(f.column)
+            if column:
+                data_type = column.data_type
 
         return col_ref, data_type
 
     def _build_where(
         self,
         filters: list[FilterDefinition],
-        table_refs: dict[str, str],
-        table_map: dict[str, str],
-        calc_sql_map: dict[str, str],
-        params: list[Any],
+        ctx: _BuildContext,
         query: QueryDefinition | None = None,
-    ) -> tuple[str, list[Any]]:
+    ) -> str:
         """Build the WHERE clause."""
         if not filters:
-            return "", params
+            return ""
 
         conditions: list[str] = []
         for f in filters:
@@ -954,30 +953,24 @@ class QueryBuilder:
                 query
                 and f.operator in (FilterOperator.NEQ, FilterOperator.NOT_IN)
                 and not f.sql_expression
-                and f.column not in calc_sql_map
+                and f.column not in ctx.calc_sql_map
             ):
-                result = self._build_negation_subquery(f, query, table_refs, table_map, params)
-                if result is not None:
-                    condition, params = result
+                condition = self._build_negation_subquery(f, query, ctx)
+                if condition is not None:
                     conditions.append(condition)
                     continue
 
-            col_ref, data_type = self._resolve_filter_col_ref(
-                f, table_refs, table_map, calc_sql_map
-            )
-            condition, params = self._build_condition(col_ref, f, data_type, params)
-            conditions.append(condition)
+            col_ref, data_type = self._resolve_filter_col_ref(f, ctx)
+            conditions.append(self._build_condition(col_ref, f, data_type, ctx))
 
-        return " AND ".join(conditions), params
+        return " AND ".join(conditions)
 
     def _build_negation_subquery(
         self,
         f: FilterDefinition,
         query: QueryDefinition,
-        table_refs: dict[str, str],
-        table_map: dict[str, str],
-        params: list[Any],
-    ) -> tuple[str, list[Any]] | None:
+        ctx: _BuildContext,
+    ) -> str | None:
         """Build a NOT IN subquery for NEQ/NOT_IN filters on joined tables.
 
         When a negation filter is on a column from a joined table (not the base
@@ -989,7 +982,7 @@ class QueryBuilder:
             )
 
         Returns:
-            (condition_sql, params) if the filter is on a joined table,
+            The condition SQL if the filter is on a joined table,
             None if it's on the base table (use normal row-level filter).
         """
         if not query.tables:
@@ -1025,59 +1018,48 @@ class QueryBuilder:
 
         # Get column data type for value coercion
         data_type: str | None = None
-        table_name = table_map.get(f.table_id)
+        table_name = ctx.table_map.get(f.table_id)
         if table_name:
-            table = self._schema.get_table(table_name)
-            if table:
-                column = table.get_column(f.column)
-                if column:
-                    data_type = column.data_type
+            column = self._columns_by_table.get(table_name, {}).get(f.column)
+            if column:
+                data_type = column.data_type
 
         coerced_value = self._coerce_value(f.value, data_type)
 
         # Build references
-        from_ref = table_refs[join.from_table_id]
+        from_ref = ctx.table_refs[join.from_table_id]
         from_col = self._quote_identifier(join.from_column)
         subquery_table = self._quote_table(joined_table.name)
         subquery_join_col = self._quote_identifier(join.to_column)
         subquery_filter_col = self._quote_identifier(f.column)
 
-        if f.operator == FilterOperator.NEQ:
+        if f.operator is FilterOperator.NEQ:
             if coerced_value is None:
                 return (
                     f"{from_ref}.{from_col} NOT IN ("
                     f"SELECT {subquery_join_col} FROM {subquery_table} "
-                    f"WHERE {subquery_filter_col} IS NULL AND {subquery_join_col} IS NOT NULL)",
-                    params,
+                    f"WHERE {subquery_filter_col} IS NULL AND {subquery_join_col} IS NOT NULL)"
                 )
-            params.append(coerced_value)
             return (
                 f"{from_ref}.{from_col} NOT IN ("
                 f"SELECT {subquery_join_col} FROM {subquery_table} "
-                f"WHERE {subquery_filter_col} = ${len(params)} AND {subquery_join_col} IS NOT NULL)",
-                params,
+                f"WHERE {subquery_filter_col} = {ctx.bind(coerced_value)} AND {subquery_join_col} IS NOT NULL)"
             )
 
-        if f.operator == FilterOperator.NOT_IN:
+        if f.operator is FilterOperator.NOT_IN:
             if isinstance(coerced_value, list):
                 if not coerced_value:
-                    return "TRUE", params
-                placeholders: list[str] = []
-                for v in coerced_value:
-                    params.append(v)
-                    placeholders.append(f"${len(params)}")
+                    return "TRUE"
+                placeholders = [ctx.bind(v) for v in coerced_value]
                 return (
                     f"{from_ref}.{from_col} NOT IN ("
                     f"SELECT {subquery_join_col} FROM {subquery_table} "
-                    f"WHERE {subquery_filter_col} IN ({', '.join(placeholders)}) AND {subquery_join_col} IS NOT NULL)",
-                    params,
+                    f"WHERE {subquery_filter_col} IN ({', '.join(placeholders)}) AND {subquery_join_col} IS NOT NULL)"
                 )
-            params.append(coerced_value)
             return (
                 f"{from_ref}.{from_col} NOT IN ("
                 f"SELECT {subquery_join_col} FROM {subquery_table} "
-                f"WHERE {subquery_filter_col} IN (${len(params)}) AND {subquery_join_col} IS NOT NULL)",
-                params,
+                f"WHERE {subquery_filter_col} IN ({ctx.bind(coerced_value)}) AND {subquery_join_col} IS NOT NULL)"
             )
 
         return None
@@ -1186,31 +1168,27 @@ class QueryBuilder:
         col_ref: str,
         f: FilterDefinition,
         data_type: str | None,
-        params: list[Any],
-    ) -> tuple[str, list[Any]]:
-        """Build a single filter condition."""
+        ctx: _BuildContext,
+    ) -> str:
+        """Build a single filter condition, binding its parameters into ctx."""
         op = f.operator
 
         # Handle date-relative operators before coercion (values are int/dict, not date strings)
-        if op == FilterOperator.DATE_RELATIVE:
+        if op is FilterOperator.DATE_RELATIVE:
             days = int(f.value) if f.value is not None else 0
             start_date, end_date = self._resolve_date_relative(days)
-            params.append(start_date)
-            p1 = len(params)
-            params.append(end_date)
-            p2 = len(params)
-            return f"{col_ref} BETWEEN ${p1} AND ${p2}", params
+            p1 = ctx.bind(start_date)
+            p2 = ctx.bind(end_date)
+            return f"{col_ref} BETWEEN {p1} AND {p2}"
 
-        if op == FilterOperator.NOT_DATE_RELATIVE:
+        if op is FilterOperator.NOT_DATE_RELATIVE:
             days = int(f.value) if f.value is not None else 0
             start_date, end_date = self._resolve_date_relative(days)
-            params.append(start_date)
-            p1 = len(params)
-            params.append(end_date)
-            p2 = len(params)
-            return f"({col_ref} < ${p1} OR {col_ref} > ${p2})", params
+            p1 = ctx.bind(start_date)
+            p2 = ctx.bind(end_date)
+            return f"({col_ref} < {p1} OR {col_ref} > {p2})"
 
-        if op == FilterOperator.DATE_WINDOW:
+        if op is FilterOperator.DATE_WINDOW:
             if not isinstance(f.value, dict):
                 raise ValueError(
                     f"DATE_WINDOW filter on column '{f.column}' requires "
@@ -1221,68 +1199,52 @@ class QueryBuilder:
             start_date, end_date = self._resolve_date_window(
                 period, offset, self._fiscal_year_start_month
             )
-            params.append(start_date)
-            p1 = len(params)
-            params.append(end_date)
-            p2 = len(params)
-            return f"{col_ref} BETWEEN ${p1} AND ${p2}", params
+            p1 = ctx.bind(start_date)
+            p2 = ctx.bind(end_date)
+            return f"{col_ref} BETWEEN {p1} AND {p2}"
 
         # Coerce the filter value to the appropriate Python type
         coerced_value = self._coerce_value(f.value, data_type)
 
-        if op == FilterOperator.EQ:
+        if op is FilterOperator.EQ:
             if coerced_value is None:
-                return f"{col_ref} IS NULL", params
-            params.append(coerced_value)
-            return f"{col_ref} = ${len(params)}", params
+                return f"{col_ref} IS NULL"
+            return f"{col_ref} = {ctx.bind(coerced_value)}"
 
-        if op == FilterOperator.NEQ:
+        if op is FilterOperator.NEQ:
             if coerced_value is None:
-                return f"{col_ref} IS NOT NULL", params
-            params.append(coerced_value)
-            return f"{col_ref} <> ${len(params)}", params
+                return f"{col_ref} IS NOT NULL"
+            return f"{col_ref} <> {ctx.bind(coerced_value)}"
 
-        if op == FilterOperator.GT:
-            params.append(coerced_value)
-            return f"{col_ref} > ${len(params)}", params
+        if op is FilterOperator.GT:
+            return f"{col_ref} > {ctx.bind(coerced_value)}"
 
-        if op == FilterOperator.GTE:
-            params.append(coerced_value)
-            return f"{col_ref} >= ${len(params)}", params
+        if op is FilterOperator.GTE:
+            return f"{col_ref} >= {ctx.bind(coerced_value)}"
 
-        if op == FilterOperator.LT:
-            params.append(coerced_value)
-            return f"{col_ref} < ${len(params)}", params
+        if op is FilterOperator.LT:
+            return f"{col_ref} < {ctx.bind(coerced_value)}"
 
-        if op == FilterOperator.LTE:
-            params.append(coerced_value)
-            return f"{col_ref} <= ${len(params)}", params
+        if op is FilterOperator.LTE:
+            return f"{col_ref} <= {ctx.bind(coerced_value)}"
 
-        if op == FilterOperator.IN:
+        if op is FilterOperator.IN:
             if isinstance(coerced_value, list):
                 if not coerced_value:
-                    return "FALSE", params
-                placeholders: list[str] = []
-                for v in coerced_value:
-                    params.append(v)
-                    placeholders.append(f"${len(params)}")
-                return f"{col_ref} IN ({', '.join(placeholders)})", params
-            params.append(coerced_value)
-            return f"{col_ref} IN (${len(params)})", params
-
-        if op == FilterOperator.NOT_IN:
+                    return "FALSE"
+                placeholders = [ctx.bind(v) for v in coerced_value]
+                return f"{col_ref} IN ({', '.join(placeholders)})"
+            return f"{col_ref} IN ({ctx.bind(coerced_value)})"
+
+        if op is FilterOperator.NOT_IN:
             if isinstance(coerced_value, list):
                 if not coerced_value:
-                    return "TRUE", params
-                placeholders = []
-                for v in coerced_value:
-                    params.append(v)
-                    placeholders.append(f"${len(params)}")
-                return f"{col_ref} NOT IN ({', '.join(placeholders)})", params
-            params.append(coerced_value)
-            return f"{col_ref} NOT IN (${len(params)})", params
-
-        if op == FilterOperator.IN_OR_NULL:
+                    return "TRUE"
+                placeholders = [ctx.bind(v) for v in coerced_value]
+                return f"{col_ref} NOT IN ({', '.join(placeholders)})"
+            return f"{col_ref} NOT IN ({ctx.bind(coerced_value)})"
+
+        if op is FilterOperator.IN_OR_NULL:
             # Handle mixed selection of concrete values AND NULL
             # Generates: (col IN (...) OR col IS NULL)
             if isinstance(coerced_value, list):
@@ -1290,45 +1252,32 @@ class QueryBuilder:
                 concrete_values = [v for v in coerced_value if v is not None]
                 if not concrete_values:
                     # No concrete values (empty list or list of only None values)
-                    return f"{col_ref} IS NULL", params
-                placeholders = []
-                for v in concrete_values:
-                    params.append(v)
-                    placeholders.append(f"${len(params)}")
-                return (
-                    f"({col_ref} IN ({', '.join(placeholders)}) OR {col_ref} IS NULL)",
-                    params,
-                )
+                    return f"{col_ref} IS NULL"
+                placeholders = [ctx.bind(v) for v in concrete_values]
+                return f"({col_ref} IN ({', '.join(placeholders)}) OR {col_ref} IS NULL)"
             # Single non-list value
             if coerced_value is None:
                 # Single None value - just IS NULL
-                return f"{col_ref} IS NULL", params
-            params.append(coerced_value)
-            return f"({col_ref} IN (${len(params)}) OR {col_ref} IS NULL)", params
+                return f"{col_ref} IS NULL"
+            return f"({col_ref} IN ({ctx.bind(coerced_value)}) OR {col_ref} IS NULL)"
 
-        if op == FilterOperator.LIKE:
-            params.append(coerced_value)
-            return f"{col_ref} LIKE ${len(params)}", params
+        if op is FilterOperator.LIKE:
+            return f"{col_ref} LIKE {ctx.bind(coerced_value)}"
 
-        if op == FilterOperator.ILIKE:
-            params.append(coerced_value)
-            return f"{col_ref} ILIKE ${len(params)}", params
+        if op is FilterOperator.ILIKE:
+            return f"{col_ref} ILIKE {ctx.bind(coerced_value)}"
 
-        if op == FilterOperator.NOT_LIKE:
-            params.append(coerced_value)
-            return f"{col_ref} NOT LIKE ${len(params)}", params
+        if op is FilterOperator.NOT_LIKE:
+            return f"{col_ref} NOT LIKE {ctx.bind(coerced_value)}"
 
-        if op == FilterOperator.NOT_ILIKE:
-            params.append(coerced_value)
-            return f"{col_ref} NOT ILIKE ${len(params)}", params
+        if op is FilterOperator.NOT_ILIKE:
+            return f"{col_ref} NOT ILIKE {ctx.bind(coerced_value)}"
 
-        if op == FilterOperator.BETWEEN:
+        if op is FilterOperator.BETWEEN:
             if isinstance(coerced_value, list | tuple) and len(coerced_value) == 2:
-                params.append(coerced_value[0])
-                p1 = len(params)
-                params.append(coerced_value[1])
-                p2 = len(params)
-                return f"{col_ref} BETWEEN ${p1} AND ${p2}", params
+                p1 = ctx.bind(coerced_value[0])
+                p2 = ctx.bind(coerced_value[1])
+                return f"{col_ref} BETWEEN {p1} AND {p2}"
             # Invalid BETWEEN value - raise error instead of silent fallback
             value_desc = (
                 f"{len(coerced_value)} values"
@@ -1339,13 +1288,13 @@ class QueryBuilder:
                 f"BETWEEN filter on column '{f.column}' requires exactly 2 values, got {value_desc}"
             )
 
-        if op == FilterOperator.IS_NULL:
-            return f"{col_ref} IS NULL", params
+        if op is FilterOperator.IS_NULL:
+            return f"{col_ref} IS NULL"
 
-        if op == FilterOperator.IS_NOT_NULL:
-            return f"{col_ref} IS NOT NULL", params
+        if op is FilterOperator.IS_NOT_NULL:
+            return f"{col_ref} IS NOT NULL"
 
-        if op == FilterOperator.IN_SUBQUERY:
+        if op is FilterOperator.IN_SUBQUERY:
             # For subquery filters (used in RLS filtering).
             # SECURITY: The SQL in value["sql"] is interpolated directly without
             # parameterization. Callers MUST ensure the SQL is safely generated
@@ -1364,7 +1313,7 @@ class QueryBuilder:
             subquery_sql = f.value["sql"].strip()
             if not subquery_sql:
                 raise ValueError(f"IN_SUBQUERY filter on column '{f.column}' has empty SQL")
-            return f"{col_ref} IN ({subquery_sql})", params
+            return f"{col_ref} IN ({subquery_sql})"
 
         # Unknown operator - raise error instead of silent fallback
         raise ValueError(f"Unknown filter operator: {op}")
@@ -1447,7 +1396,7 @@ class QueryBuilder:
         column_lookup: dict[tuple[str, str], ColumnSelection] = {
             (col.table_id, col.column): col
             for col in query.columns
-            if col.aggregation == AggregationType.NONE
+            if col.aggregation is AggregationType.NONE
         }
 
         # If time series is present and no explicit order by, order by date bucket
@@ -1494,19 +1443,10 @@ class QueryBuilder:
 
         data_type_lower = data_type.lower()
 
-        # Check if this is a date/timestamp column
-        date_types = {"date"}
-        timestamp_types = {
-            "timestamp",
-            "timestamp without time zone",
-            "timestamp with time zone",
-            "timestamptz",
-        }
-
-        is_date = (
-            any(dt in data_type_lower for dt in date_types) and "timestamp" not in data_type_lower
-        )
-        is_timestamp = any(dt in data_type_lower for dt in timestamp_types)
+        # Check if this is a date/timestamp column (every timestamp spelling,
+        # including timestamptz, contains "timestamp")
+        is_timestamp = "timestamp" in data_type_lower
+        is_date = "date" in data_type_lower and not is_timestamp
 
         if not is_date and not is_timestamp:
             return value
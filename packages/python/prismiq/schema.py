@@ -6,7 +6,13 @@ metadata from PostgreSQL's information_schema.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import hashlib
+import json
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from prismiq.types import (
     ColumnSchema,
@@ -22,6 +28,242 @@ if TYPE_CHECKING:
     from prismiq.cache import CacheBackend
 
 
+# Every catalog fact needed to build a DatabaseSchema, fetched in one round-trip
+# as JSON documents: one compact array of arrays per kind of fact, each in a
+# fixed positional layout. $2 is the exposed-tables list, or NULL to expose
+# every table in the schema. Row counts (pg_class.reltuples, which autovacuum and
+# ANALYZE update constantly) come back in their own column, so the structural
+# "catalog" document only changes when the schema itself does.
+_CATALOG_BUNDLE_QUERY = """
+    SELECT json_build_object(
+        'tables', (
+            SELECT COALESCE(json_agg(table_name ORDER BY table_name), '[]')
+            FROM information_schema.tables
+            WHERE table_schema = $1
+                AND table_type IN ('BASE TABLE', 'VIEW')
+                AND ($2::text[] IS NULL OR table_name = ANY($2::text[]))
+        ),
+        'columns', (
+            SELECT COALESCE(json_agg(
+                json_build_array(table_name, column_name, data_type, is_nullable, column_default)
+                ORDER BY table_name, ordinal_position
+            ), '[]')
+            FROM information_schema.columns
+            WHERE table_schema = $1
+                AND ($2::text[] IS NULL OR table_name = ANY($2::text[]))
+        ),
+        'primary_keys', (
+            SELECT COALESCE(json_agg(
+                json_build_array(tc.table_name, kcu.column_name)
+                ORDER BY tc.table_name, kcu.ordinal_position
+            ), '[]')
+            FROM information_schema.table_constraints tc
+            JOIN information_schema.key_column_usage kcu
+                ON tc.constraint_name = kcu.constraint_name
+                AND tc.table_schema = kcu.table_schema
+            WHERE tc.constraint_type = 'PRIMARY KEY'
+                AND tc.table_schema = $1
+                AND ($2::text[] IS NULL OR tc.table_name = ANY($2::text[]))
+        ),
+        'relationships', (
+            SELECT COALESCE(json_agg(
+                json_build_array(tc.table_name, kcu.column_name, ccu.table_name, ccu.column_name)
+                ORDER BY tc.table_name
+            ), '[]')
+            FROM information_schema.table_constraints tc
+            JOIN information_schema.key_column_usage kcu
+                ON tc.constraint_name = kcu.constraint_name
+                AND tc.table_schema = kcu.table_schema
+            JOIN information_schema.constraint_column_usage ccu
+                ON ccu.constraint_name = tc.constraint_name
+                AND ccu.table_schema = tc.table_schema
+            WHERE tc.constraint_type = 'FOREIGN KEY'
+                AND tc.table_schema = $1
+                AND ($2::text[] IS NULL OR (
+                    tc.table_name = ANY($2::text[]) AND ccu.table_name = ANY($2::text[])
+                ))
+        )
+    )::text AS catalog,
+    (
+        SELECT COALESCE(json_agg(json_build_array(c.relname, c.reltuples::bigint)), '[]')
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = $1
+            AND c.relkind = 'r'
+            AND ($2::text[] IS NULL OR c.relname = ANY($2::text[]))
+    )::text AS row_counts
+"""
+
+
+# Schema caches shared by every introspector on a pool, keyed by id(pool).
+# asyncpg pools support neither weak references nor extra attributes, so the
+# pool itself is kept alongside its cache (guarding against id reuse) until
+# SchemaIntrospector.unbind_pool() is called.
+_POOL_CACHES: dict[int, tuple[Any, CacheBackend]] = {}
+
+
+@dataclass
+class _CatalogBundle:
+    """Catalog facts for one schema, partitioned by kind.
+
+    The raw structural catalog document is kept so a refresh that returns an
+    identical document can reuse this bundle, together with the frozen models
+    already built from it (only row counts are refreshed in that case).
+    """
+
+    raw: str = ""
+    table_names: list[str] = field(default_factory=list)
+    known_tables: frozenset[str] = frozenset()
+    columns: dict[str, list[ColumnSchema]] = field(default_factory=dict)
+    primary_keys: dict[str, set[str]] = field(default_factory=dict)
+    row_counts: dict[str, int] = field(default_factory=dict)
+    relationships: list[Relationship] = field(default_factory=list)
+    # Relationships indexed by referencing (from) and referenced (to) table
+    relationships_from: dict[str, tuple[Relationship, ...]] = field(default_factory=dict)
+    relationships_to: dict[str, tuple[Relationship, ...]] = field(default_factory=dict)
+    table_schemas: dict[str, TableSchema] = field(default_factory=dict)
+    schema: DatabaseSchema | None = None
+
+
+def _consume_task_exception(task: asyncio.Task[Any]) -> None:
+    """Retrieve a background task's exception so a failed refresh isn't reported as unhandled.
+
+    Awaiting callers still see the exception; a failed background refresh
+    leaves the cached schema in place for the next caller to retry.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+# Cache entries use a compact positional layout rather than model_dump() dicts,
+# so field names aren't repeated for every column in JSON-serializing backends:
+#   table:  [name, schema_name, row_count,
+#            [[name, data_type, is_nullable, is_primary_key, default_value], ...]]
+#   schema: [[table, ...], [[from_table, from_column, to_table, to_column], ...]]
+# They live under their own key prefix, so they never collide with the dicts that
+# cache.SchemaCache (and older versions of this module) keep under "schema:...".
+# Compact entries are only ever written by _schema_to_cache/_table_to_cache, so
+# decoding builds models with model_construct() instead of re-validating them.
+_CACHE_KEY_PREFIX = "schema-v2"
+
+
+def _table_to_cache(table: TableSchema) -> list[Any]:
+    """Encode a TableSchema in the compact cache layout."""
+    return [
+        table.name,
+        table.schema_name,
+        table.row_count,
+        [
+            [col.name, col.data_type, col.is_nullable, col.is_primary_key, col.default_value]
+            for col in table.columns
+        ],
+    ]
+
+
+def _table_from_cache(value: Any) -> TableSchema:
+    """Decode a TableSchema from the compact cache layout."""
+    name, schema_name, row_count, columns = value
+    return TableSchema.model_construct(
+        name=name,
+        schema_name=schema_name,
+        row_count=row_count,
+        columns=[
+            ColumnSchema.model_construct(
+                name=col_name,
+                data_type=data_type,
+                is_nullable=is_nullable,
+                is_primary_key=is_primary_key,
+                default_value=default_value,
+            )
+            for col_name, data_type, is_nullable, is_primary_key, default_value in columns
+        ],
+    )
+
+
+def _schema_to_cache(schema: DatabaseSchema) -> list[Any]:
+    """Encode a DatabaseSchema in the compact cache layout."""
+    return [
+        [_table_to_cache(table) for table in schema.tables],
+        [
+            [rel.from_table, rel.from_column, rel.to_table, rel.to_column]
+            for rel in schema.relationships
+        ],
+    ]
+
+
+def _schema_from_cache(value: Any) -> DatabaseSchema:
+    """Decode a DatabaseSchema from the compact cache layout."""
+    tables, relationships = value
+    return DatabaseSchema.model_construct(
+        tables=[_table_from_cache(table) for table in tables],
+        relationships=[
+            Relationship.model_construct(
+                from_table=from_table,
+                from_column=from_column,
+                to_table=to_table,
+                to_column=to_column,
+            )
+            for from_table, from_column, to_table, to_column in relationships
+        ],
+    )
+
+
+def _table_from_cached_schema(value: Any, table_name: str) -> TableSchema | None:
+    """Decode just one table from a cached DatabaseSchema, or None if absent."""
+    for table in value[0]:
+        if table[0] == table_name:
+            return _table_from_cache(table)
+    return None
+
+
+def _changed_tables(old: _CatalogBundle, new: _CatalogBundle) -> list[str]:
+    """Names of tables added, removed or redefined between two catalog bundles.
+
+    Only structural facts count: row counts are estimates that drift on their
+    own, and relationships aren't part of the per-table cache entries (the
+    full-schema entry is evicted on any change).
+    """
+    return [
+        name
+        for name in old.known_tables | new.known_tables
+        if old.columns.get(name) != new.columns.get(name)
+        or old.primary_keys.get(name) != new.primary_keys.get(name)
+        or (name in old.known_tables) != (name in new.known_tables)
+    ]
+
+
+def _exposure_token(exposed: frozenset[str] | None) -> str:
+    """Stable cache-key component for an exposed-tables set ("all" if unrestricted)."""
+    if exposed is None:
+        return "all"
+    return hashlib.sha256("\n".join(sorted(exposed)).encode()).hexdigest()[:16]
+
+
+def _parse_row_counts(raw: str) -> dict[str, int]:
+    """Decode the row-counts column of the catalog query."""
+    # reltuples can be -1 if never analyzed, treat as 0
+    return {table_name: max(0, count) for table_name, count in json.loads(raw)}
+
+
+def _refresh_row_counts(bundle: _CatalogBundle, row_counts: dict[str, int]) -> None:
+    """Update a bundle's row counts in place, keeping its other built models."""
+    bundle.row_counts = row_counts
+    for table_name, table in list(bundle.table_schemas.items()):
+        row_count = row_counts.get(table_name)
+        if table.row_count != row_count:
+            bundle.table_schemas[table_name] = table.model_copy(update={"row_count": row_count})
+    # The DatabaseSchema embeds the tables, so it is rebuilt from the updated ones
+    bundle.schema = None
+
+
+def _pool_cache(pool: Any) -> CacheBackend | None:
+    """Return the schema cache bound to a pool, if any."""
+    entry = _POOL_CACHES.get(id(pool))
+    if entry is None or entry[0] is not pool:
+        return None
+    return entry[1]
+
+
 class SchemaIntrospector:
     """Introspects PostgreSQL database schema.
 
@@ -53,6 +295,8 @@ class SchemaIntrospector:
         schema_name: str = "public",
         cache: CacheBackend | None = None,
         cache_ttl: int = 3600,
+        cache_refresh_ahead: float = 0.2,
+        dedicated_connection: bool = False,
     ) -> None:
         """Initialize the schema introspector.
 
@@ -61,25 +305,90 @@ class SchemaIntrospector:
             exposed_tables: List of table names to expose. If None, all tables
                 in the schema are exposed.
             schema_name: PostgreSQL schema to introspect (default: "public").
-            cache: Optional cache backend for caching schema data.
+            cache: Optional cache backend for caching schema data. If None and
+                the pool was bound with bind_to_pool(), the pool's shared cache
+                is used.
             cache_ttl: TTL for cached schema in seconds (default: 1 hour).
+            cache_refresh_ahead: Fraction of cache_ttl before expiry at which a
+                cached schema is refreshed in the background (default: 0.2).
+                Set to 0 to disable refresh-ahead.
+            dedicated_connection: If True, catalog queries run on one pool
+                connection held for the introspector's lifetime instead of
+                acquiring per query. Call close() to release it.
         """
         self._pool = pool
         self._exposed_tables = exposed_tables
+        self._exposed_set = frozenset(exposed_tables) if exposed_tables is not None else None
         self._schema_name = schema_name
-        self._cache = cache
+        self._cache = cache if cache is not None else _pool_cache(pool)
+        # The full-schema entry depends on which tables are exposed, so introspectors
+        # sharing a cache with different exposures each get their own entry.
+        # Per-table entries don't: a table's definition is the same in every view.
+        self._full_key = self._cache_key(f"full:{_exposure_token(self._exposed_set)}")
         self._cache_ttl = cache_ttl
+        self._cache_refresh_ahead = cache_refresh_ahead
+        # When this process last stored the full schema, to decide on refresh-ahead
+        self._full_cached_at: float | None = None
+        self._refresh_task: asyncio.Task[DatabaseSchema] | None = None
+        # Last (cached value, decoded schema) pair, reused while the backend returns that object
+        self._decoded_full: tuple[Any, DatabaseSchema] | None = None
+        # Schema-wide catalog bundle shared by get_schema/get_table, reused for cache_ttl
+        self._catalog_bundle: _CatalogBundle | None = None
+        self._catalog_bundle_loaded_at = 0.0
+        self._bundle_task: asyncio.Task[_CatalogBundle] | None = None
+        # Bumped by schema-change notifications; a catalog bundle loaded under an
+        # older version is stale and is reloaded (evicting changed tables) on next use
+        self._schema_version = 0
+        self._bundle_version = 0
+        self._listen_conn: Any = None
+        self._listen_channel: str | None = None
+        self._dedicated_connection = dedicated_connection
+        self._meta_conn: Any = None
+        self._meta_lock = asyncio.Lock()
+
+    @classmethod
+    def bind_to_pool(cls, pool: Pool, cache: CacheBackend | None = None) -> CacheBackend:
+        """Share one schema cache between all introspectors created for a pool.
+
+        Introspectors constructed without an explicit cache then reuse each
+        other's results instead of re-introspecting per instance. Full-schema
+        entries are keyed by exposed_tables, so introspectors with different
+        exposures on the same pool never see each other's table sets. Calling
+        this again for the same pool returns the already-bound cache.
+
+        Args:
+            pool: asyncpg connection pool to bind.
+            cache: Cache backend to share (default: a new InMemoryCache).
+
+        Returns:
+            The cache backend bound to the pool.
+        """
+        shared = _pool_cache(pool)
+        if shared is None:
+            if cache is None:
+                from prismiq.cache import InMemoryCache
+
+                cache = InMemoryCache()
+            shared = cache
+            _POOL_CACHES[id(pool)] = (pool, shared)
+        return shared
+
+    @classmethod
+    def unbind_pool(cls, pool: Pool) -> None:
+        """Forget the shared schema cache bound to a pool (e.g. when closing it)."""
+        if _pool_cache(pool) is not None:
+            del _POOL_CACHES[id(pool)]
 
     def _cache_key(self, suffix: str) -> str:
         """Generate schema-qualified cache key for tenant isolation.
 
         Args:
-            suffix: Cache key suffix (e.g., "full", "table:users").
+            suffix: Cache key suffix (e.g., "full:all", "table:users").
 
         Returns:
-            Cache key with schema prefix (e.g., "schema:org_123:full").
+            Cache key with schema prefix (e.g., "schema-v2:org_123:full:all").
         """
-        return f"schema:{self._schema_name}:{suffix}"
+        return f"{_CACHE_KEY_PREFIX}:{self._schema_name}:{suffix}"
 
     async def get_schema(self, force_refresh: bool = False) -> DatabaseSchema:
         """Get the complete database schema.
@@ -90,33 +399,180 @@ class SchemaIntrospector:
         Returns:
             DatabaseSchema containing all exposed tables and their relationships.
         """
+        await self._apply_schema_change()
+
         # Try cache first (using schema-qualified key for tenant isolation)
         if self._cache and not force_refresh:
-            cached = await self._cache.get(self._cache_key("full"))
+            cached = await self._cache.get(self._full_key)
             if cached is not None:
-                return DatabaseSchema.model_validate(cached)
+                self._maybe_refresh_ahead()
+                # In-process backends hand back the same object: skip re-decoding it
+                if self._decoded_full is not None and self._decoded_full[0] is cached:
+                    return self._decoded_full[1]
+                schema = _schema_from_cache(cached)
+                self._decoded_full = (cached, schema)
+                return schema
 
         # Introspect from database
         schema = await self._introspect_schema()
 
         # Store in cache (using schema-qualified key)
         if self._cache:
-            await self._cache.set(self._cache_key("full"), schema.model_dump(), self._cache_ttl)
+            encoded = _schema_to_cache(schema)
+            await self._cache.set(self._full_key, encoded, self._cache_ttl)
+            self._full_cached_at = time.monotonic()
+            self._decoded_full = (encoded, schema)
 
         return schema
 
-    async def _introspect_schema(self) -> DatabaseSchema:
-        """Introspect schema from database."""
-        table_names = await self._get_table_names()
-        tables: list[TableSchema] = []
+    def _maybe_refresh_ahead(self) -> None:
+        """Start a background refresh if the cached schema is close to expiring.
 
-        for table_name in table_names:
-            table = await self._get_table_schema(table_name)
-            tables.append(table)
+        Keeps the re-introspection off the request path: callers keep getting
+        the cached schema while at most one refresh task runs.
+        """
+        if self._full_cached_at is None or self._cache_refresh_ahead <= 0:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
 
-        relationships = await self.detect_relationships()
+        age = time.monotonic() - self._full_cached_at
+        if age < (1 - self._cache_refresh_ahead) * self._cache_ttl:
+            return
 
-        return DatabaseSchema(tables=tables, relationships=relationships)
+        self._refresh_task = asyncio.create_task(self.get_schema(force_refresh=True))
+        self._refresh_task.add_done_callback(_consume_task_exception)
+
+    async def _introspect_schema(self) -> DatabaseSchema:
+        """Introspect schema from database in a single round-trip."""
+        bundle = await self._load_catalog_bundle(force_refresh=True)
+
+        if bundle.schema is None:
+            # The catalog query already restricts everything to exposed tables
+            tables = [
+                self._build_table_schema(bundle, table_name) for table_name in bundle.table_names
+            ]
+            bundle.schema = DatabaseSchema.model_construct(
+                tables=tables, relationships=bundle.relationships
+            )
+        return bundle.schema
+
+    def _fresh_catalog_bundle(self) -> _CatalogBundle | None:
+        """Return the memoized catalog bundle unless it is missing, stale or superseded."""
+        if (
+            self._bundle_version != self._schema_version
+            or time.monotonic() - self._catalog_bundle_loaded_at > self._cache_ttl
+        ):
+            return None
+        return self._catalog_bundle
+
+    async def _load_catalog_bundle(self, force_refresh: bool = False) -> _CatalogBundle:
+        """Return the schema-wide catalog bundle, fetching it if missing or stale."""
+        bundle = None if force_refresh else self._fresh_catalog_bundle()
+        if bundle is not None:
+            return bundle
+
+        # Single-flight: concurrent callers await the scan already in progress
+        if self._bundle_task is None:
+            self._bundle_task = asyncio.create_task(self._refresh_catalog_bundle())
+            self._bundle_task.add_done_callback(_consume_task_exception)
+        return await asyncio.shield(self._bundle_task)
+
+    async def _refresh_catalog_bundle(self) -> _CatalogBundle:
+        """Fetch and memoize the catalog bundle (run as the single in-flight task).
+
+        When the new catalog differs from the memoized one, only the cache
+        entries of tables whose definition changed are evicted (plus the
+        full-schema entry), so unchanged tables stay warm.
+        """
+        try:
+            version = self._schema_version
+            previous = self._catalog_bundle
+            bundle = await self._fetch_catalog_bundle()
+            self._catalog_bundle = bundle
+            self._catalog_bundle_loaded_at = time.monotonic()
+            self._bundle_version = version
+            if previous is not None and bundle is not previous:
+                await self._evict_tables(_changed_tables(previous, bundle))
+            return bundle
+        finally:
+            self._bundle_task = None
+
+    async def _fetch_catalog_bundle(self) -> _CatalogBundle:
+        """Fetch tables, columns, primary keys, row counts and foreign keys at once."""
+        rows = await self._fetch(
+            _CATALOG_BUNDLE_QUERY, self._schema_name, self._exposed_table_list()
+        )
+        raw: str = rows[0][0]
+        row_counts = _parse_row_counts(rows[0][1])
+
+        # Unchanged structure: keep the previous bundle and the models built from
+        # it, refreshing only the row counts if they drifted
+        previous = self._catalog_bundle
+        if previous is not None and previous.raw == raw:
+            if row_counts != previous.row_counts:
+                _refresh_row_counts(previous, row_counts)
+            return previous
+
+        # One json.loads for the whole catalog; each fact is unpacked positionally.
+        # The catalog's types are fixed by the query, so models are built with
+        # model_construct() and skip per-field validation.
+        catalog = json.loads(raw)
+        bundle = _CatalogBundle(raw=raw, table_names=catalog["tables"], row_counts=row_counts)
+        for table_name, column_name, data_type, is_nullable, column_default in catalog["columns"]:
+            bundle.columns.setdefault(table_name, []).append(
+                ColumnSchema.model_construct(
+                    name=column_name,
+                    data_type=data_type,
+                    is_nullable=is_nullable == "YES",
+                    default_value=column_default,
+                )
+            )
+        for table_name, column_name in catalog["primary_keys"]:
+            bundle.primary_keys.setdefault(table_name, set()).add(column_name)
+        bundle.relationships = [
+            Relationship.model_construct(
+                from_table=from_table,
+                from_column=from_column,
+                to_table=to_table,
+                to_column=to_column,
+            )
+            for from_table, from_column, to_table, to_column in catalog["relationships"]
+        ]
+        from_index: dict[str, list[Relationship]] = {}
+        to_index: dict[str, list[Relationship]] = {}
+        for rel in bundle.relationships:
+            from_index.setdefault(rel.from_table, []).append(rel)
+            to_index.setdefault(rel.to_table, []).append(rel)
+        bundle.relationships_from = {name: tuple(rels) for name, rels in from_index.items()}
+        bundle.relationships_to = {name: tuple(rels) for name, rels in to_index.items()}
+
+        bundle.known_tables = frozenset(bundle.table_names)
+        return bundle
+
+    def _exposed_table_list(self) -> list[str] | None:
+        """Exposed tables as a query parameter (None exposes every table)."""
+        return list(self._exposed_set) if self._exposed_set is not None else None
+
+    def _build_table_schema(self, bundle: _CatalogBundle, table_name: str) -> TableSchema:
+        """Assemble a TableSchema for one table from a catalog bundle (memoized per bundle)."""
+        table = bundle.table_schemas.get(table_name)
+        if table is not None:
+            return table
+
+        primary_key_set = bundle.primary_keys.get(table_name, set())
+        columns = [
+            col.model_copy(update={"is_primary_key": True}) if col.name in primary_key_set else col
+            for col in bundle.columns.get(table_name, [])
+        ]
+        table = TableSchema.model_construct(
+            name=table_name,
+            schema_name=self._schema_name,
+            columns=columns,
+            row_count=bundle.row_counts.get(table_name),
+        )
+        bundle.table_schemas[table_name] = table
+        return table
 
     async def get_table(self, table_name: str, force_refresh: bool = False) -> TableSchema:
         """Get schema information for a single table.
@@ -132,7 +588,14 @@ class SchemaIntrospector:
             TableNotFoundError: If the table doesn't exist or isn't exposed.
         """
         # Check if table is exposed
-        if self._exposed_tables is not None and table_name not in self._exposed_tables:
+        if self._exposed_set is not None and table_name not in self._exposed_set:
+            raise TableNotFoundError(table_name)
+
+        await self._apply_schema_change()
+
+        # While the catalog is fresh, unknown names are rejected without any lookup
+        bundle = None if force_refresh else self._fresh_catalog_bundle()
+        if bundle is not None and table_name not in bundle.known_tables:
             raise TableNotFoundError(table_name)
 
         # Try cache first (using schema-qualified key for tenant isolation)
@@ -140,35 +603,207 @@ class SchemaIntrospector:
         if self._cache and not force_refresh:
             cached = await self._cache.get(cache_key)
             if cached is not None:
-                return TableSchema.model_validate(cached)
-
-        # Check if table exists in database
-        table_names = await self._get_table_names()
-        if table_name not in table_names:
+                return _table_from_cache(cached)
+
+            # A warm full-schema entry usually holds the table already; on a miss
+            # (e.g. a table created since it was cached) fall through to the catalog
+            cached_schema = await self._cache.get(self._full_key)
+            if cached_schema is not None:
+                table = _table_from_cached_schema(cached_schema, table_name)
+                if table is not None:
+                    return table
+
+        # Slice the table out of the schema-wide catalog (one query for all tables)
+        bundle = await self._load_catalog_bundle(force_refresh=force_refresh)
+        if table_name not in bundle.known_tables:
             raise TableNotFoundError(table_name)
 
-        # Introspect from database
-        table = await self._get_table_schema(table_name)
+        table = self._build_table_schema(bundle, table_name)
 
         # Store in cache (using schema-qualified key)
         if self._cache:
-            await self._cache.set(cache_key, table.model_dump(), self._cache_ttl)
+            await self._cache.set(cache_key, _table_to_cache(table), self._cache_ttl)
 
         return table
 
-    async def invalidate_cache(self) -> int:
-        """Invalidate all cached schema data for this schema.
+    async def invalidate_cache(self, changed_tables: Iterable[str] | None = None) -> int:
+        """Invalidate cached schema data for this schema.
 
         Only invalidates cache entries for this schema (tenant isolation).
 
+        Args:
+            changed_tables: If given, only these tables' entries (and the
+                full-schema entry) are evicted; other tables stay cached.
+
         Returns:
             Number of cache entries cleared.
         """
+        self._catalog_bundle = None
+
+        if changed_tables is not None:
+            return await self._evict_tables(changed_tables)
+
+        self._full_cached_at = None
+        self._decoded_full = None
+
         if self._cache is None:
             return 0
 
         # Only clear cache entries for this specific schema
-        return await self._cache.clear(f"schema:{self._schema_name}:*")
+        return await self._cache.clear(self._cache_key("*"))
+
+    async def invalidate_table(self, table_name: str) -> int:
+        """Invalidate cached data for a single table.
+
+        Args:
+            table_name: Name of the table whose definition changed.
+
+        Returns:
+            Number of cache entries cleared.
+        """
+        return await self.invalidate_cache(changed_tables=[table_name])
+
+    async def _evict_tables(self, table_names: Iterable[str]) -> int:
+        """Delete the cache entries of the given tables and every full-schema entry."""
+        self._full_cached_at = None
+        self._decoded_full = None
+
+        if self._cache is None:
+            return 0
+
+        deleted = 0
+        for name in table_names:
+            if await self._cache.delete(self._cache_key(f"table:{name}")):
+                deleted += 1
+        # Full-schema entries of other exposures embed the same tables
+        deleted += await self._cache.clear(self._cache_key("full:*"))
+        return deleted
+
+    async def listen_for_schema_changes(self, channel: str = "prismiq_schema_changed") -> None:
+        """Invalidate cached schema whenever a notification arrives on a channel.
+
+        Holds one pool connection and LISTENs on ``channel``. Each notification
+        bumps the schema version, so the next ``get_schema``/``get_table`` call
+        re-reads the catalog and evicts cache entries of the tables that changed.
+        Between notifications, cache hits cost no round-trips. The database must publish DDL changes,
+        e.g. with an event trigger:
+
+            CREATE FUNCTION prismiq_notify_schema_change() RETURNS event_trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                PERFORM pg_notify('prismiq_schema_changed', current_schema());
+            END $$;
+
+            CREATE EVENT TRIGGER prismiq_schema_changed ON ddl_command_end
+                EXECUTE FUNCTION prismiq_notify_schema_change();
+
+        ``invalidate_cache`` remains available as a manual override.
+
+        Args:
+            channel: Notification channel to listen on.
+        """
+        if self._listen_conn is not None:
+            return
+
+        conn = await self._pool.acquire()
+        try:
+            await conn.add_listener(channel, self._on_schema_change)
+        except BaseException:
+            await self._pool.release(conn)
+            raise
+        self._listen_conn = conn
+        self._listen_channel = channel
+
+    async def close(self) -> None:
+        """Release every connection held by this introspector.
+
+        Covers the dedicated catalog connection and the schema-change listener.
+        The introspector stays usable; a later query re-acquires as needed.
+        """
+        await self.stop_listening()
+        async with self._meta_lock:
+            await self._release_meta_conn()
+
+    async def _fetch(self, query: str, *args: Any) -> list[Record]:
+        """Run a catalog query on a pooled or the dedicated metadata connection."""
+        if not self._dedicated_connection:
+            async with self._pool.acquire() as conn:
+                return await conn.fetch(query, *args)
+
+        async with self._meta_lock:
+            if self._meta_conn is None:
+                self._meta_conn = await self._pool.acquire()
+            try:
+                return await self._meta_conn.fetch(query, *args)
+            except Exception:
+                if not self._meta_conn.is_closed():
+                    raise
+                # The held connection died (server restart, idle timeout): reconnect once
+                await self._release_meta_conn()
+                self._meta_conn = await self._pool.acquire()
+                return await self._meta_conn.fetch(query, *args)
+
+    async def _release_meta_conn(self) -> None:
+        """Return the dedicated metadata connection to the pool (caller holds the lock)."""
+        conn, self._meta_conn = self._meta_conn, None
+        if conn is not None:
+            await self._pool.release(conn)
+
+    async def stop_listening(self) -> None:
+        """Stop listening for schema-change notifications and release the connection."""
+        conn, channel = self._listen_conn, self._listen_channel
+        if conn is None or channel is None:
+            return
+
+        self._listen_conn = None
+        self._listen_channel = None
+        try:
+            await conn.remove_listener(channel, self._on_schema_change)
+        finally:
+            await self._pool.release(conn)
+
+    def _on_schema_change(self, _conn: Any, _pid: int, _channel: str, _payload: str) -> None:
+        """Listener callback: mark the memoized catalog as superseded."""
+        self._schema_version += 1
+
+    async def _apply_schema_change(self) -> None:
+        """Catch up with schema-change notifications received since the catalog was loaded.
+
+        Reloads the catalog, which evicts the cache entries of changed tables.
+        Without a memoized catalog to compare against, every entry for this
+        schema is evicted instead.
+        """
+        if self._bundle_version == self._schema_version:
+            return
+        if self._catalog_bundle is None:
+            self._bundle_version = self._schema_version
+            await self.invalidate_cache()
+        else:
+            await self._load_catalog_bundle(force_refresh=True)
+
+    async def get_relationships_from(self, table_name: str) -> tuple[Relationship, ...]:
+        """Get the foreign keys declared on a table (it is the referencing side).
+
+        Args:
+            table_name: Name of the referencing table.
+
+        Returns:
+            Relationships whose from_table is table_name (empty if none).
+        """
+        bundle = await self._load_catalog_bundle()
+        return bundle.relationships_from.get(table_name, ())
+
+    async def get_relationships_to(self, table_name: str) -> tuple[Relationship, ...]:
+        """Get the foreign keys that reference a table.
+
+        Args:
+            table_name: Name of the referenced table.
+
+        Returns:
+            Relationships whose to_table is table_name (empty if none).
+        """
+        bundle = await self._load_catalog_bundle()
+        return bundle.relationships_to.get(table_name, ())
 
     async def detect_relationships(self) -> list[Relationship]:
         """Detect foreign key relationships between exposed tables.
@@ -176,158 +811,37 @@ class SchemaIntrospector:
         Returns:
             List of Relationship objects representing foreign keys.
         """
-        async with self._pool.acquire() as conn:
-            # Query foreign key constraints
-            query = """
-                SELECT
-                    tc.table_name AS from_table,
-                    kcu.column_name AS from_column,
-                    ccu.table_name AS to_table,
-                    ccu.column_name AS to_column
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                    AND tc.table_schema = kcu.table_schema
-                JOIN information_schema.constraint_column_usage ccu
-                    ON ccu.constraint_name = tc.constraint_name
-                    AND ccu.table_schema = tc.table_schema
-                WHERE tc.constraint_type = 'FOREIGN KEY'
-                    AND tc.table_schema = $1
-            """
-            rows: list[Record] = await conn.fetch(query, self._schema_name)
-
-        relationships: list[Relationship] = []
-        exposed_set = set(self._exposed_tables) if self._exposed_tables else None
-
-        for row in rows:
-            from_table = row["from_table"]
-            to_table = row["to_table"]
-
-            # Filter to only include relationships between exposed tables
-            if exposed_set is not None and (
-                from_table not in exposed_set or to_table not in exposed_set
-            ):
-                continue
-
-            relationships.append(
-                Relationship(
-                    from_table=from_table,
-                    from_column=row["from_column"],
-                    to_table=to_table,
-                    to_column=row["to_column"],
-                )
-            )
-
-        return relationships
-
-    async def _get_table_names(self) -> list[str]:
-        """Get list of table names in the schema."""
-        async with self._pool.acquire() as conn:
-            query = """
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = $1
-                    AND table_type IN ('BASE TABLE', 'VIEW')
-                ORDER BY table_name
-            """
-            rows: list[Record] = await conn.fetch(query, self._schema_name)
-
-        table_names = [row["table_name"] for row in rows]
-
-        # Filter to exposed tables if specified
-        if self._exposed_tables is not None:
-            exposed_set = set(self._exposed_tables)
-            table_names = [t for t in table_names if t in exposed_set]
-
-        return table_names
-
-    async def _get_table_schema(self, table_name: str) -> TableSchema:
-        """Get schema for a single table."""
-        columns = await self._get_columns(table_name)
-        primary_keys = await self._get_primary_keys(table_name)
-        row_count = await self._get_row_count(table_name)
-        primary_key_set = set(primary_keys)
-
-        # Mark primary key columns
-        for col in columns:
-            if col.name in primary_key_set:
-                # Create new column with is_primary_key=True
-                # (Pydantic models are immutable by default in strict mode)
-                col_dict = col.model_dump()
-                col_dict["is_primary_key"] = True
-                columns[columns.index(col)] = ColumnSchema(**col_dict)
-
-        return TableSchema(
-            name=table_name,
-            schema_name=self._schema_name,
-            columns=columns,
-            row_count=row_count,
-        )
-
-    async def _get_columns(self, table_name: str) -> list[ColumnSchema]:
-        """Get column information for a table."""
-        async with self._pool.acquire() as conn:
-            query = """
-                SELECT
-                    column_name,
-                    data_type,
-                    is_nullable,
-                    column_default
-                FROM information_schema.columns
-                WHERE table_schema = $1
-                    AND table_name = $2
-                ORDER BY ordinal_position
-            """
-            rows: list[Record] = await conn.fetch(query, self._schema_name, table_name)
+        if self._exposed_set is not None and not self._exposed_set:
+            return []
+
+        # Query foreign key constraints between exposed tables ($2 NULL = all tables)
+        query = """
+            SELECT
+                tc.table_name AS from_table,
+                kcu.column_name AS from_column,
+                ccu.table_name AS to_table,
+                ccu.column_name AS to_column
+            FROM information_schema.table_constraints tc
+            JOIN information_schema.key_column_usage kcu
+                ON tc.constraint_name = kcu.constraint_name
+                AND tc.table_schema = kcu.table_schema
+            JOIN information_schema.constraint_column_usage ccu
+                ON ccu.constraint_name = tc.constraint_name
+                AND ccu.table_schema = tc.table_schema
+            WHERE tc.constraint_type = 'FOREIGN KEY'
+                AND tc.table_schema = $1
+                AND ($2::text[] IS NULL OR (
+                    tc.table_name = ANY($2::text[]) AND ccu.table_name = ANY($2::text[])
+                ))
+        """
+        rows = await self._fetch(query, self._schema_name, self._exposed_table_list())
 
         return [
-            ColumnSchema(
-                name=row["column_name"],
-                data_type=row["data_type"],
-                is_nullable=row["is_nullable"] == "YES",
-                default_value=row["column_default"],
+            Relationship.model_construct(
+                from_table=from_table,
+                from_column=from_column,
+                to_table=to_table,
+                to_column=to_column,
             )
-            for row in rows
+            for from_table, from_column, to_table, to_column in rows
         ]
-
-    async def _get_primary_keys(self, table_name: str) -> list[str]:
-        """Get primary key column names for a table."""
-        async with self._pool.acquire() as conn:
-            query = """
-                SELECT kcu.column_name
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                    AND tc.table_schema = kcu.table_schema
-                WHERE tc.constraint_type = 'PRIMARY KEY'
-                    AND tc.table_schema = $1
-                    AND tc.table_name = $2
-                ORDER BY kcu.ordinal_position
-            """
-            rows: list[Record] = await conn.fetch(query, self._schema_name, table_name)
-
-        return [row["column_name"] for row in rows]
-
-    async def _get_row_count(self, table_name: str) -> int | None:
-        """Get approximate row count for a table using pg_class.reltuples.
-
-        This is fast but may be slightly out of date. For exact counts,
-        VACUUM ANALYZE should be run periodically.
-        """
-        async with self._pool.acquire() as conn:
-            query = """
-                SELECT reltuples::bigint AS row_count
-                FROM pg_class c
-                JOIN pg_namespace n ON n.oid = c.relnamespace
-                WHERE n.nspname = $1
-                    AND c.relname = $2
-                    AND c.relkind = 'r'
-            """
-            row = await conn.fetchrow(query, self._schema_name, table_name)
-
-        if row is None:
-            return None
-
-        # reltuples can be -1 if never analyzed, treat as 0
-        count = row["row_count"]
-        return max(0, count) if count is not None else None
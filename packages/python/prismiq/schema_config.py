@@ -7,8 +7,9 @@ hidden columns, and formatting hints.
 
 from __future__ import annotations
 
-import json
-from typing import Any
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Final
 
 from pydantic import BaseModel, ConfigDict
 
@@ -18,7 +19,7 @@ from prismiq.types import DatabaseSchema
 class ColumnConfig(BaseModel):
     """Configuration for a single column."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
 
     display_name: str | None = None
     """Friendly name for UI display."""
@@ -39,7 +40,7 @@ class ColumnConfig(BaseModel):
 class TableConfig(BaseModel):
     """Configuration for a single table."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
 
     display_name: str | None = None
     """Friendly name for UI display."""
@@ -54,10 +55,16 @@ class TableConfig(BaseModel):
     """Column-specific configurations."""
 
 
+# Shared defaults returned for unconfigured tables and columns. The models are
+# frozen, so handing out one instance is safe and avoids a construction per miss.
+_EMPTY_TABLE_CONFIG: Final[TableConfig] = TableConfig()
+_EMPTY_COLUMN_CONFIG: Final[ColumnConfig] = ColumnConfig()
+
+
 class SchemaConfig(BaseModel):
     """Complete schema customization configuration."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
 
     tables: dict[str, TableConfig] = {}
     """Table-specific configurations."""
@@ -71,7 +78,7 @@ class SchemaConfig(BaseModel):
         Returns:
             TableConfig for the table (may be default/empty).
         """
-        return self.tables.get(table_name, TableConfig())
+        return self.tables.get(table_name, _EMPTY_TABLE_CONFIG)
 
     def get_column_config(self, table_name: str, column_name: str) -> ColumnConfig:
         """Get config for a column, with defaults if not configured.
@@ -83,8 +90,10 @@ class SchemaConfig(BaseModel):
         Returns:
             ColumnConfig for the column (may be default/empty).
         """
-        table_config = self.get_table_config(table_name)
-        return table_config.columns.get(column_name, ColumnConfig())
+        table_config = self.tables.get(table_name)
+        if table_config is None:
+            return _EMPTY_COLUMN_CONFIG
+        return table_config.columns.get(column_name, _EMPTY_COLUMN_CONFIG)
 
     def get_display_name(self, table_name: str, column_name: str | None = None) -> str:
         """Get display name for table or column, falling back to actual name.
@@ -96,26 +105,35 @@ class SchemaConfig(BaseModel):
         Returns:
             The display name, or the actual name if no display name is configured.
         """
+        table_config = self.tables.get(table_name)
         if column_name is None:
-            table_config = self.get_table_config(table_name)
-            return table_config.display_name or table_name
-        else:
-            column_config = self.get_column_config(table_name, column_name)
-            return column_config.display_name or column_name
+            if table_config is not None and table_config.display_name:
+                return table_config.display_name
+            return table_name
+
+        column_config = table_config.columns.get(column_name) if table_config else None
+        if column_config is not None and column_config.display_name:
+            return column_config.display_name
+        return column_name
 
     def is_table_hidden(self, table_name: str) -> bool:
         """Check if a table is hidden."""
-        return self.get_table_config(table_name).hidden
+        table_config = self.tables.get(table_name)
+        return table_config is not None and table_config.hidden
 
     def is_column_hidden(self, table_name: str, column_name: str) -> bool:
         """Check if a column is hidden."""
-        return self.get_column_config(table_name, column_name).hidden
+        table_config = self.tables.get(table_name)
+        if table_config is None:
+            return False
+        column_config = table_config.columns.get(column_name)
+        return column_config is not None and column_config.hidden
 
 
 class EnhancedColumnSchema(BaseModel):
     """Column schema with configuration-based enhancements."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True)
 
     name: str
     """Column name in the database."""
@@ -148,7 +166,7 @@ class EnhancedColumnSchema(BaseModel):
 class EnhancedTableSchema(BaseModel):
     """Table schema with configuration-based enhancements."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True)
 
     name: str
     """Table name in the database."""
@@ -165,22 +183,36 @@ class EnhancedTableSchema(BaseModel):
     description: str | None = None
     """Description from configuration."""
 
+    @cached_property
+    def _columns_by_name(self) -> dict[str, EnhancedColumnSchema]:
+        """Columns keyed by name, built on first lookup (first match wins)."""
+        return {col.name: col for col in reversed(self.columns)}
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> EnhancedTableSchema:
+        """Copy the table, dropping the cached column index.
+
+        model_copy copies ``__dict__`` (including cached_property values), so the
+        index would otherwise keep describing the original columns.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        vars(copied).pop("_columns_by_name", None)
+        return copied
+
     def get_column(self, column_name: str) -> EnhancedColumnSchema | None:
         """Get a column by name, or None if not found."""
-        for col in self.columns:
-            if col.name == column_name:
-                return col
-        return None
+        return self._columns_by_name.get(column_name)
 
     def has_column(self, column_name: str) -> bool:
         """Check if the table has a column with the given name."""
-        return self.get_column(column_name) is not None
+        return column_name in self._columns_by_name
 
 
 class EnhancedDatabaseSchema(BaseModel):
     """Database schema with configuration-based enhancements."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True)
 
     tables: list[EnhancedTableSchema]
     """Enhanced table schemas."""
@@ -188,16 +220,26 @@ class EnhancedDatabaseSchema(BaseModel):
     relationships: list[Any]  # Using Any to avoid circular import
     """Foreign key relationships."""
 
+    @cached_property
+    def _tables_by_name(self) -> dict[str, EnhancedTableSchema]:
+        """Tables keyed by name, built on first lookup (first match wins)."""
+        return {table.name: table for table in reversed(self.tables)}
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> EnhancedDatabaseSchema:
+        """Copy the schema, dropping the cached table index (see EnhancedTableSchema)."""
+        copied = super().model_copy(update=update, deep=deep)
+        vars(copied).pop("_tables_by_name", None)
+        return copied
+
     def get_table(self, table_name: str) -> EnhancedTableSchema | None:
         """Get a table by name, or None if not found."""
-        for table in self.tables:
-            if table.name == table_name:
-                return table
-        return None
+        return self._tables_by_name.get(table_name)
 
     def has_table(self, table_name: str) -> bool:
         """Check if the schema contains a table with the given name."""
-        return self.get_table(table_name) is not None
+        return table_name in self._tables_by_name
 
     def table_names(self) -> list[str]:
         """Get list of all table names."""
@@ -218,6 +260,7 @@ class SchemaConfigManager:
             config: Initial configuration. If None, an empty config is used.
         """
         self._config = config or SchemaConfig()
+        self._display_name_cache: dict[tuple[str, str | None], str] = {}
 
     def get_config(self) -> SchemaConfig:
         """Get current configuration.
@@ -227,6 +270,25 @@ class SchemaConfigManager:
         """
         return self._config
 
+    def get_display_name(self, table_name: str, column_name: str | None = None) -> str:
+        """Get display name for table or column, memoized per name pair.
+
+        Resolved names are cached until the configuration is next updated.
+
+        Args:
+            table_name: The table name.
+            column_name: Optional column name. If None, returns table display name.
+
+        Returns:
+            The display name, or the actual name if no display name is configured.
+        """
+        key = (table_name, column_name)
+        name = self._display_name_cache.get(key)
+        if name is None:
+            name = self._config.get_display_name(table_name, column_name)
+            self._display_name_cache[key] = name
+        return name
+
     def update_table_config(self, table_name: str, config: TableConfig) -> None:
         """Update configuration for a table.
 
@@ -238,7 +300,8 @@ class SchemaConfigManager:
         """
         new_tables = dict(self._config.tables)
         new_tables[table_name] = config
-        self._config = SchemaConfig(tables=new_tables)
+        self._config = self._config.model_copy(update={"tables": new_tables})
+        self._display_name_cache.clear()
 
     def update_column_config(self, table_name: str, column_name: str, config: ColumnConfig) -> None:
         """Update configuration for a column.
@@ -256,12 +319,7 @@ class SchemaConfigManager:
         new_columns[column_name] = config
 
         # Create new table config with updated columns
-        new_table_config = TableConfig(
-            display_name=table_config.display_name,
-            description=table_config.description,
-            hidden=table_config.hidden,
-            columns=new_columns,
-        )
+        new_table_config = table_config.model_copy(update={"columns": new_columns})
 
         # Update via table config
         self.update_table_config(table_name, new_table_config)
@@ -278,55 +336,63 @@ class SchemaConfigManager:
         Returns:
             Enhanced schema with configuration applied and hidden items removed.
         """
+        # Every field is copied from an already-validated schema or config,
+        # so the enhanced models are built without re-validation.
         enhanced_tables: list[EnhancedTableSchema] = []
+        visible_table_names: set[str] = set()
+        table_configs = self._config.tables
 
         for table in schema.tables:
+            # Resolve the table's config once; unconfigured tables have none
+            table_config = table_configs.get(table.name)
+
             # Skip hidden tables
-            if self._config.is_table_hidden(table.name):
+            if table_config is not None and table_config.hidden:
                 continue
 
-            table_config = self._config.get_table_config(table.name)
+            column_configs = table_config.columns if table_config is not None else {}
             enhanced_columns: list[EnhancedColumnSchema] = []
 
             for column in table.columns:
+                column_config = column_configs.get(column.name)
+
                 # Skip hidden columns
-                if self._config.is_column_hidden(table.name, column.name):
+                if column_config is not None and column_config.hidden:
                     continue
 
-                column_config = self._config.get_column_config(table.name, column.name)
                 enhanced_columns.append(
-                    EnhancedColumnSchema(
+                    EnhancedColumnSchema.model_construct(
                         name=column.name,
                         data_type=column.data_type,
                         is_nullable=column.is_nullable,
                         is_primary_key=column.is_primary_key,
                         default_value=column.default_value,
-                        display_name=column_config.display_name,
-                        description=column_config.description,
-                        format=column_config.format,
-                        date_format=column_config.date_format,
+                        display_name=column_config.display_name if column_config else None,
+                        description=column_config.description if column_config else None,
+                        format=column_config.format if column_config else None,
+                        date_format=column_config.date_format if column_config else None,
                     )
                 )
 
             enhanced_tables.append(
-                EnhancedTableSchema(
+                EnhancedTableSchema.model_construct(
                     name=table.name,
                     schema_name=table.schema_name,
                     columns=enhanced_columns,
-                    display_name=table_config.display_name,
-                    description=table_config.description,
+                    display_name=table_config.display_name if table_config else None,
+                    description=table_config.description if table_config else None,
                 )
             )
+            visible_table_names.add(table.name)
 
         # Filter relationships to only include visible tables
-        visible_table_names = {t.name for t in enhanced_tables}
         visible_relationships = [
             rel
             for rel in schema.relationships
             if rel.from_table in visible_table_names and rel.to_table in visible_table_names
         ]
 
-        return EnhancedDatabaseSchema(
+        return EnhancedDatabaseSchema.model_construct(
             tables=enhanced_tables,
             relationships=visible_relationships,
         )
@@ -349,6 +415,4 @@ class SchemaConfigManager:
         Returns:
             New SchemaConfigManager with the parsed configuration.
         """
-        data = json.loads(json_str)
-        config = SchemaConfig.model_validate(data)
-        return cls(config)
+        return cls(SchemaConfig.model_validate_json(json_str))
@@ -7,7 +7,9 @@ generating time buckets, and filling missing data points.
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from decimal import Decimal
 from enum import Enum
+from itertools import islice, pairwise
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict
@@ -40,6 +42,23 @@ class TimeBucket(BaseModel):
     """Human-readable label like 'Jan 2024'."""
 
 
+_DATE_TRUNC_TEMPLATES: dict[TimeInterval, str] = {
+    interval: f"date_trunc('{interval.value}', \"%s\")" for interval in TimeInterval
+}
+"""date_trunc expression per interval, with a placeholder for the quoted column."""
+
+_INTERVAL_FORMATS: dict[TimeInterval, str] = {
+    TimeInterval.MINUTE: "%Y-%m-%d %H:%M",
+    TimeInterval.HOUR: "%Y-%m-%d %H:00",
+    TimeInterval.DAY: "%Y-%m-%d",
+    TimeInterval.WEEK: "%Y-W%W",
+    TimeInterval.MONTH: "%Y-%m",
+    TimeInterval.QUARTER: "%Y-Q%q",  # Special marker, needs post-processing
+    TimeInterval.YEAR: "%Y",
+}
+"""strftime format for each interval, built once at import time."""
+
+
 def get_date_trunc_sql(interval: TimeInterval, column: str) -> str:
     """Generate PostgreSQL date_trunc expression.
 
@@ -55,10 +74,7 @@ def get_date_trunc_sql(interval: TimeInterval, column: str) -> str:
         'date_trunc(\\'day\\', "order_date")'
     """
     # Quote the column name to prevent SQL injection
-    escaped_column = column.replace('"', '""')
-    quoted_column = f'"{escaped_column}"'
-
-    return f"date_trunc('{interval.value}', {quoted_column})"
+    return _DATE_TRUNC_TEMPLATES[interval] % column.replace('"', '""')
 
 
 def get_interval_format(interval: TimeInterval) -> str:
@@ -75,16 +91,16 @@ def get_interval_format(interval: TimeInterval) -> str:
         >>> get_interval_format(TimeInterval.DAY)
         '%Y-%m-%d'
     """
-    format_map = {
-        TimeInterval.MINUTE: "%Y-%m-%d %H:%M",
-        TimeInterval.HOUR: "%Y-%m-%d %H:00",
-        TimeInterval.DAY: "%Y-%m-%d",
-        TimeInterval.WEEK: "%Y-W%W",
-        TimeInterval.MONTH: "%Y-%m",
-        TimeInterval.QUARTER: "%Y-Q%q",  # Special marker, needs post-processing
-        TimeInterval.YEAR: "%Y",
-    }
-    return format_map[interval]
+    return _INTERVAL_FORMATS[interval]
+
+
+_LABEL_FORMATS: dict[TimeInterval, str] = {
+    TimeInterval.MINUTE: "%b %d, %H:%M",
+    TimeInterval.HOUR: "%b %d, %H:00",
+    TimeInterval.DAY: "%b %d",
+    TimeInterval.MONTH: "%b %Y",
+}
+"""Bucket label formats for intervals that strftime can render directly."""
 
 
 def _format_bucket_label(dt: datetime, interval: TimeInterval) -> str:
@@ -97,23 +113,15 @@ def _format_bucket_label(dt: datetime, interval: TimeInterval) -> str:
     Returns:
         Human-readable label.
     """
-    if interval == TimeInterval.MINUTE:
-        return dt.strftime("%b %d, %H:%M")
-
-    if interval == TimeInterval.HOUR:
-        return dt.strftime("%b %d, %H:00")
-
-    if interval == TimeInterval.DAY:
-        return dt.strftime("%b %d")
+    label_format = _LABEL_FORMATS.get(interval)
+    if label_format is not None:
+        return dt.strftime(label_format)
 
     if interval == TimeInterval.WEEK:
         # ISO week number
         week_num = dt.isocalendar()[1]
         return f"Week {week_num}, {dt.year}"
 
-    if interval == TimeInterval.MONTH:
-        return dt.strftime("%b %Y")
-
     if interval == TimeInterval.QUARTER:
         quarter = (dt.month - 1) // 3 + 1
         return f"Q{quarter} {dt.year}"
@@ -170,60 +178,62 @@ def _truncate_datetime(dt: datetime, interval: TimeInterval) -> datetime:
     return dt
 
 
-def _get_next_bucket_start(dt: datetime, interval: TimeInterval) -> datetime:
-    """Get the start of the next bucket after the given datetime.
-
-    Args:
-        dt: Current bucket start.
-        interval: Time interval.
+_ONE_MICROSECOND = timedelta(microseconds=1)
 
-    Returns:
-        Start of the next bucket.
-    """
-    if interval == TimeInterval.MINUTE:
-        return dt + timedelta(minutes=1)
+_FIXED_DELTAS: dict[TimeInterval, timedelta] = {
+    TimeInterval.MINUTE: timedelta(minutes=1),
+    TimeInterval.HOUR: timedelta(hours=1),
+    TimeInterval.DAY: timedelta(days=1),
+    TimeInterval.WEEK: timedelta(weeks=1),
+}
+"""Bucket length for intervals with a fixed duration."""
 
-    if interval == TimeInterval.HOUR:
-        return dt + timedelta(hours=1)
+_MONTH_STEPS: dict[TimeInterval, int] = {
+    TimeInterval.MONTH: 1,
+    TimeInterval.QUARTER: 3,
+    TimeInterval.YEAR: 12,
+}
+"""Bucket length in calendar months for the remaining intervals."""
 
-    if interval == TimeInterval.DAY:
-        return dt + timedelta(days=1)
 
-    if interval == TimeInterval.WEEK:
-        return dt + timedelta(weeks=1)
+def _count_buckets(first: datetime, end: datetime, interval: TimeInterval) -> int:
+    """Count the buckets from a truncated start up to and including end.
 
-    if interval == TimeInterval.MONTH:
-        # Move to next month
-        if dt.month == 12:
-            return dt.replace(year=dt.year + 1, month=1)
-        return dt.replace(month=dt.month + 1)
-
-    if interval == TimeInterval.QUARTER:
-        # Move to next quarter (3 months)
-        new_month = dt.month + 3
-        if new_month > 12:
-            return dt.replace(year=dt.year + 1, month=new_month - 12)
-        return dt.replace(month=new_month)
+    Args:
+        first: Start of the first bucket (already truncated).
+        end: End datetime (inclusive).
+        interval: Time interval.
 
-    if interval == TimeInterval.YEAR:
-        return dt.replace(year=dt.year + 1)
+    Returns:
+        Number of buckets whose start is not after end.
+    """
+    step = _MONTH_STEPS.get(interval)
+    if step is None:
+        if end < first:
+            return 0
+        return (end - first) // _FIXED_DELTAS[interval] + 1
 
-    return dt + timedelta(days=1)
+    months = (end.year - first.year) * 12 + end.month - first.month
+    return months // step + 1 if months >= 0 else 0
 
 
-def _get_bucket_end(bucket_start: datetime, interval: TimeInterval) -> datetime:
-    """Get the end datetime for a bucket (last moment before next bucket).
+def _nth_bucket_start(first: datetime, interval: TimeInterval, index: int) -> datetime:
+    """Get the start of the bucket ``index`` intervals after ``first``.
 
     Args:
-        bucket_start: Start of the bucket.
+        first: Start of the first bucket (already truncated).
         interval: Time interval.
+        index: Zero-based bucket offset.
 
     Returns:
-        End of the bucket (last microsecond before next bucket).
+        Start of the requested bucket.
     """
-    next_start = _get_next_bucket_start(bucket_start, interval)
-    # End is one microsecond before the next bucket starts
-    return next_start - timedelta(microseconds=1)
+    step = _MONTH_STEPS.get(interval)
+    if step is None:
+        return first + _FIXED_DELTAS[interval] * index
+
+    months = first.month - 1 + index * step
+    return first.replace(year=first.year + months // 12, month=months % 12 + 1)
 
 
 def generate_time_buckets(
@@ -249,32 +259,66 @@ def generate_time_buckets(
         >>> len(buckets)
         3
     """
-    # Handle timezone-aware datetimes by converting to naive
-    if start.tzinfo is not None:
-        start = start.replace(tzinfo=None)
+    # Handle timezone-aware datetimes by converting to naive; truncation
+    # already strips the start's tzinfo, so only the end needs it here
     if end.tzinfo is not None:
         end = end.replace(tzinfo=None)
 
     # Truncate start to the beginning of its interval
-    current = _truncate_datetime(start, interval)
+    first = _truncate_datetime(start, interval)
+    count = _count_buckets(first, end, interval)
+    # One extra boundary so each bucket's end is the next start minus 1us
+    boundaries = [_nth_bucket_start(first, interval, i) for i in range(count + 1)]
+
+    # Pick the label format once rather than re-dispatching on every bucket
+    label_format = _LABEL_FORMATS.get(interval)
+    if label_format is not None:
+        labels = [bucket_start.strftime(label_format) for bucket_start in islice(boundaries, count)]
+    else:
+        labels = [
+            _format_bucket_label(bucket_start, interval)
+            for bucket_start in islice(boundaries, count)
+        ]
+
+    # Starts, ends and labels are built here from validated datetimes, so
+    # skip re-validating each bucket
+    return [
+        TimeBucket.model_construct(
+            start=bucket_start,
+            end=next_start - _ONE_MICROSECOND,
+            label=label,
+        )
+        for (bucket_start, next_start), label in zip(pairwise(boundaries), labels, strict=True)
+    ]
 
-    buckets: list[TimeBucket] = []
 
-    while current <= end:
-        bucket_end = _get_bucket_end(current, interval)
-        label = _format_bucket_label(current, interval)
+def _is_numeric(value: Any) -> bool:
+    """Check whether a sample cell holds a number (bools excluded)."""
+    return isinstance(value, int | float | Decimal) and not isinstance(value, bool)
 
-        buckets.append(
-            TimeBucket(
-                start=current,
-                end=bucket_end,
-                label=label,
-            )
-        )
 
-        current = _get_next_bucket_start(current, interval)
+def _infer_interval(diff: timedelta) -> TimeInterval:
+    """Guess the bucketing interval from the spacing between buckets.
 
-    return buckets
+    Args:
+        diff: Distance between consecutive bucket starts (or a bucket's span).
+
+    Returns:
+        The smallest interval that covers the given distance.
+    """
+    if diff <= timedelta(minutes=1):
+        return TimeInterval.MINUTE
+    if diff <= timedelta(hours=1):
+        return TimeInterval.HOUR
+    if diff <= timedelta(days=1):
+        return TimeInterval.DAY
+    if diff <= timedelta(weeks=1):
+        return TimeInterval.WEEK
+    if diff <= timedelta(days=32):
+        return TimeInterval.MONTH
+    if diff <= timedelta(days=100):
+        return TimeInterval.QUARTER
+    return TimeInterval.YEAR
 
 
 def fill_missing_buckets(
@@ -319,45 +363,13 @@ def fill_missing_buckets(
     # Build a map of bucket start -> existing data rows
     bucket_data: dict[datetime, list[dict[str, Any]]] = {}
 
-    # Get all columns from first data row for template
-    template_row = data[0]
-    all_columns = list(template_row.keys())
-
     # Determine which interval we're using based on bucket size
     # (we need this to truncate data dates properly)
     if len(buckets) >= 2:
-        diff = buckets[1].start - buckets[0].start
-        if diff <= timedelta(minutes=1):
-            interval = TimeInterval.MINUTE
-        elif diff <= timedelta(hours=1):
-            interval = TimeInterval.HOUR
-        elif diff <= timedelta(days=1):
-            interval = TimeInterval.DAY
-        elif diff <= timedelta(weeks=1):
-            interval = TimeInterval.WEEK
-        elif diff <= timedelta(days=32):
-            interval = TimeInterval.MONTH
-        elif diff <= timedelta(days=100):
-            interval = TimeInterval.QUARTER
-        else:
-            interval = TimeInterval.YEAR
+        interval = _infer_interval(buckets[1].start - buckets[0].start)
     else:
         # Single bucket, guess from bucket duration
-        diff = buckets[0].end - buckets[0].start
-        if diff <= timedelta(minutes=1):
-            interval = TimeInterval.MINUTE
-        elif diff <= timedelta(hours=1):
-            interval = TimeInterval.HOUR
-        elif diff <= timedelta(days=1):
-            interval = TimeInterval.DAY
-        elif diff <= timedelta(weeks=1):
-            interval = TimeInterval.WEEK
-        elif diff <= timedelta(days=32):
-            interval = TimeInterval.MONTH
-        elif diff <= timedelta(days=100):
-            interval = TimeInterval.QUARTER
-        else:
-            interval = TimeInterval.YEAR
+        interval = _infer_interval(buckets[0].end - buckets[0].start)
 
     # Map existing data to buckets
     for row in data:
@@ -372,39 +384,33 @@ def fill_missing_buckets(
             # It's a date, convert to datetime
             dt = datetime.combine(date_val, datetime.min.time())
 
-        # Handle timezone
-        if hasattr(dt, "tzinfo") and dt.tzinfo is not None:
-            dt = dt.replace(tzinfo=None)
-
-        # Truncate to bucket start
+        # Truncate to bucket start (this also drops any timezone)
         bucket_start = _truncate_datetime(dt, interval)
+        bucket_data.setdefault(bucket_start, []).append(row)
 
-        if bucket_start not in bucket_data:
-            bucket_data[bucket_start] = []
-        bucket_data[bucket_start].append(row)
+    # Build the filler once from the first row's columns: numeric columns
+    # (including asyncpg's Decimal for NUMERIC, but not bools) get
+    # fill_value, everything else None
+    template_row = data[0]
+    fill_template: dict[str, Any] = {
+        col: fill_value if _is_numeric(value) else None for col, value in template_row.items()
+    }
+    has_date_column = date_column in fill_template
 
     # Build result with all buckets
     result: list[dict[str, Any]] = []
 
     for bucket in buckets:
-        existing_rows = bucket_data.get(bucket.start, [])
+        existing_rows = bucket_data.get(bucket.start)
 
         if existing_rows:
             # Use existing data
             result.extend(existing_rows)
         else:
             # Create a filled row
-            filled_row: dict[str, Any] = {}
-            for col in all_columns:
-                if col == date_column:
-                    filled_row[col] = bucket.start
-                else:
-                    # Check if original column was numeric
-                    sample_value = template_row.get(col)
-                    if isinstance(sample_value, int | float):
-                        filled_row[col] = fill_value
-                    else:
-                        filled_row[col] = None
+            filled_row = fill_template.copy()
+            if has_date_column:
+                filled_row[date_column] = bucket.start
             result.append(filled_row)
 
     return result
@@ -2,18 +2,45 @@
 
 This module provides functions for transforming query results including
 pivot, transpose, null filling, running totals, and percentage
-calculations.
+calculations. Inputs are already-validated results, so outputs are built
+with QueryResult.model_construct rather than validated again.
 """
 
 from __future__ import annotations
 
-import contextlib
 from collections import defaultdict
+from collections.abc import Callable, Iterable
+from itertools import accumulate, chain, repeat, zip_longest
+from operator import add, itemgetter
 from typing import Any
 
+from prismiq._cells import as_float, as_float_or_none
 from prismiq.types import QueryResult
 
 
+def _column_indices(result: QueryResult) -> dict[str, int]:
+    """Map column names to positions in one pass (first occurrence wins)."""
+    indices: dict[str, int] = {}
+    for i, name in enumerate(result.columns):
+        indices.setdefault(name, i)
+    return indices
+
+
+def _count_step(count: float, _value: float) -> float:
+    """Fold step for 'count': ignore the value and add one."""
+    return count + 1
+
+
+_PIVOT_FOLDS: dict[str, Callable[[float, float], float]] = {
+    "sum": add,
+    "avg": add,  # Summed here, divided by the cell's count afterwards
+    "min": min,
+    "max": max,
+    "count": _count_step,
+}
+"""Fold steps for pivot cells, combining the running cell value with the next value."""
+
+
 def pivot_data(
     result: QueryResult,
     row_column: str,
@@ -46,84 +73,79 @@ def pivot_data(
           West   | 200 | None
     """
     if not result.rows:
-        return QueryResult(
+        return QueryResult.model_construct(
             columns=[row_column],
             column_types=["text"],
             rows=[],
             row_count=0,
             truncated=False,
-            execution_time_ms=0,
+            execution_time_ms=0.0,
         )
 
     # Find column indices
+    indices = _column_indices(result)
     try:
-        row_idx = result.columns.index(row_column)
-        pivot_idx = result.columns.index(pivot_column)
-        value_idx = result.columns.index(value_column)
-    except ValueError as e:
+        row_idx = indices[row_column]
+        pivot_idx = indices[pivot_column]
+        value_idx = indices[value_column]
+    except KeyError as e:
         raise ValueError(f"Column not found in result: {e}") from e
 
-    # Get unique pivot values (these become new columns)
-    pivot_values: list[Any] = []
-    seen_values: set[Any] = set()
-    for row in result.rows:
-        val = row[pivot_idx]
-        if val not in seen_values:
-            pivot_values.append(val)
-            seen_values.add(val)
+    # Resolve the aggregation once; unknown names default to sum
+    fold = _PIVOT_FOLDS.get(aggregation, add)
+    counting = aggregation == "count"
+    averaging = aggregation == "avg"
 
-    # Group data by row_column
-    data_map: dict[Any, dict[Any, list[float]]] = defaultdict(lambda: defaultdict(list))
+    # Single pass: collect unique pivot values (these become new columns) in
+    # first-seen order, and fold each (row, pivot) cell into one running value
+    # rather than collecting a list of values per cell
+    pivot_values: dict[Any, None] = {}
+    data_map: dict[Any, dict[Any, float]] = {}
+    cell_counts: dict[tuple[Any, Any], int] = defaultdict(int)
 
     for row in result.rows:
-        row_val = row[row_idx]
         pivot_val = row[pivot_idx]
+        pivot_values[pivot_val] = None
+
         value = row[value_idx]
+        if value is None:
+            continue
 
-        if value is not None:
-            try:
-                data_map[row_val][pivot_val].append(float(value))
-            except (ValueError, TypeError):
-                # Non-numeric value, skip aggregation
-                data_map[row_val][pivot_val].append(0)
-
-    # Apply aggregation
-    def aggregate(values: list[float]) -> float | None:
-        if not values:
-            return None
-        if aggregation == "sum":
-            return sum(values)
-        if aggregation == "avg":
-            return sum(values) / len(values)
-        if aggregation == "min":
-            return min(values)
-        if aggregation == "max":
-            return max(values)
-        if aggregation == "count":
-            return float(len(values))
-        # Default to sum
-        return sum(values)
-
-    # Build output rows
-    output_rows: list[list[Any]] = []
-    for row_val in data_map:
-        output_row: list[Any] = [row_val]
-        for pivot_val in pivot_values:
-            values = data_map[row_val].get(pivot_val, [])
-            output_row.append(aggregate(values))
-        output_rows.append(output_row)
+        # Non-numeric values count as 0
+        number = as_float(value)
+        row_val = row[row_idx]
+        cells = data_map.get(row_val)
+        if cells is None:
+            cells = data_map[row_val] = {}
+
+        current = cells.get(pivot_val)
+        if current is None:
+            cells[pivot_val] = 1.0 if counting else number
+        else:
+            cells[pivot_val] = fold(current, number)
+        if averaging:
+            cell_counts[row_val, pivot_val] += 1
+
+    for (row_val, pivot_val), count in cell_counts.items():
+        data_map[row_val][pivot_val] /= count
+
+    # Build output rows, gathering each row's cells in pivot-column order
+    # (missing cells come back as None from dict.get)
+    output_rows: list[list[Any]] = [
+        [row_val, *map(cells.get, pivot_values)] for row_val, cells in data_map.items()
+    ]
 
     # Build column names and types
     output_columns = [row_column] + [str(v) for v in pivot_values]
     output_types = [result.column_types[row_idx]] + ["numeric"] * len(pivot_values)
 
-    return QueryResult(
+    return QueryResult.model_construct(
         columns=output_columns,
         column_types=output_types,
         rows=output_rows,
         row_count=len(output_rows),
         truncated=False,
-        execution_time_ms=0,
+        execution_time_ms=0.0,
     )
 
 
@@ -140,13 +162,13 @@ def transpose_data(result: QueryResult) -> QueryResult:
         New QueryResult with transposed data.
     """
     if not result.rows:
-        return QueryResult(
+        return QueryResult.model_construct(
             columns=["Column"],
             column_types=["text"],
             rows=[[col] for col in result.columns],
             row_count=len(result.columns),
             truncated=False,
-            execution_time_ms=0,
+            execution_time_ms=0.0,
         )
 
     # Use original column names as first column
@@ -157,24 +179,30 @@ def transpose_data(result: QueryResult) -> QueryResult:
     output_columns = ["Column"] + [f"Row {i + 1}" for i in range(num_rows)]
     output_types = ["text"] * len(output_columns)
 
-    # Each original column becomes a row
-    output_rows: list[list[Any]] = []
-    for col_idx, col_name in enumerate(result.columns):
-        row: list[Any] = [col_name]
-        for result_row in result.rows:
-            row.append(result_row[col_idx] if col_idx < len(result_row) else None)
-        output_rows.append(row)
-
-    return QueryResult(
+    # Each original column becomes a row. zip_longest transposes in C and
+    # pads short rows with None; columns past the widest row are all None.
+    cells_by_column = chain(zip_longest(*result.rows), repeat((None,) * num_rows))
+    output_rows = [
+        [col_name, *cells] for col_name, cells in zip(result.columns, cells_by_column, strict=False)
+    ]
+
+    return QueryResult.model_construct(
         columns=output_columns,
         column_types=output_types,
         rows=output_rows,
         row_count=len(output_rows),
         truncated=False,
-        execution_time_ms=0,
+        execution_time_ms=0.0,
     )
 
 
+def _with_cell(row: list[Any], index: int, value: Any) -> list[Any]:
+    """Return a copy of a row with one cell replaced."""
+    new_row = list(row)
+    new_row[index] = value
+    return new_row
+
+
 def fill_nulls(
     result: QueryResult,
     column: str | None = None,
@@ -195,9 +223,6 @@ def fill_nulls(
     if not result.rows:
         return result
 
-    # Deep copy rows
-    output_rows = [list(row) for row in result.rows]
-
     # Determine which columns to process
     if column is not None:
         try:
@@ -207,36 +232,49 @@ def fill_nulls(
     else:
         col_indices = list(range(len(result.columns)))
 
-    for col_idx in col_indices:
-        if method == "ffill":
-            # Forward fill - use previous non-null value
-            last_value: Any = value
-            for row in output_rows:
-                if row[col_idx] is None:
-                    row[col_idx] = last_value
-                else:
-                    last_value = row[col_idx]
-        elif method == "bfill":
-            # Backward fill - use next non-null value
-            last_value = value
-            for row in reversed(output_rows):
-                if row[col_idx] is None:
-                    row[col_idx] = last_value
-                else:
-                    last_value = row[col_idx]
+    if method not in ("ffill", "bfill"):
+        # Static fill: copy only the rows that have something to fill and
+        # share the rest, as sort_result and limit_result do
+        if column is None:
+            output_rows = [
+                [value if cell is None else cell for cell in row] if None in row else row
+                for row in result.rows
+            ]
         else:
-            # Static fill
-            for row in output_rows:
-                if row[col_idx] is None:
-                    row[col_idx] = value
-
-    return QueryResult(
+            col_idx = col_indices[0]
+            output_rows = [
+                row if row[col_idx] is not None else _with_cell(row, col_idx, value)
+                for row in result.rows
+            ]
+    else:
+        # Deep copy rows
+        output_rows = [list(row) for row in result.rows]
+
+        for col_idx in col_indices:
+            if method == "ffill":
+                # Forward fill - use previous non-null value
+                last_value: Any = value
+                for row in output_rows:
+                    if row[col_idx] is None:
+                        row[col_idx] = last_value
+                    else:
+                        last_value = row[col_idx]
+            else:
+                # Backward fill - use next non-null value
+                last_value = value
+                for row in reversed(output_rows):
+                    if row[col_idx] is None:
+                        row[col_idx] = last_value
+                    else:
+                        last_value = row[col_idx]
+
+    return QueryResult.model_construct(
         columns=result.columns,
         column_types=result.column_types,
         rows=output_rows,
         row_count=result.row_count,
         truncated=result.truncated,
-        execution_time_ms=0,
+        execution_time_ms=0.0,
     )
 
 
@@ -258,67 +296,69 @@ def calculate_running_total(
         New QueryResult with running total column added.
     """
     if not result.rows:
-        return QueryResult(
+        return QueryResult.model_construct(
             columns=[*result.columns, f"{value_column}_running_total"],
             column_types=[*result.column_types, "numeric"],
             rows=[],
             row_count=0,
             truncated=False,
-            execution_time_ms=0,
+            execution_time_ms=0.0,
         )
 
+    indices = _column_indices(result)
     try:
-        value_idx = result.columns.index(value_column)
-    except ValueError as e:
+        value_idx = indices[value_column]
+    except KeyError as e:
         raise ValueError(f"Column '{value_column}' not found in result") from e
 
     group_idx = None
     if group_column is not None:
         try:
-            group_idx = result.columns.index(group_column)
-        except ValueError as e:
+            group_idx = indices[group_column]
+        except KeyError as e:
             raise ValueError(f"Group column '{group_column}' not found") from e
 
     order_idx = None
     if order_column is not None:
         try:
-            order_idx = result.columns.index(order_column)
-        except ValueError as e:
+            order_idx = indices[order_column]
+        except KeyError as e:
             raise ValueError(f"Order column '{order_column}' not found") from e
 
-    # Create indexed rows for sorting
-    indexed_rows = list(enumerate(result.rows))
+    rows = result.rows
 
-    # Sort by order column if specified
+    # Visit rows in order-column order if specified, otherwise as given
     if order_idx is not None:
-        indexed_rows.sort(key=lambda x: (x[1][order_idx] or 0))
-
-    # Calculate running totals
-    running_totals: dict[Any, float] = defaultdict(float)
-    row_totals: dict[int, float] = {}
-
-    for original_idx, row in indexed_rows:
-        group_key = row[group_idx] if group_idx is not None else "__all__"
-        val = row[value_idx]
+        order: Iterable[int] = sorted(range(len(rows)), key=lambda i: rows[i][order_idx] or 0)
+    else:
+        order = range(len(rows))
 
-        if val is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                running_totals[group_key] += float(val)
+    # Calculate running totals, stored by original row position
+    row_totals: list[float] = [0.0] * len(rows)
 
-        row_totals[original_idx] = running_totals[group_key]
+    if group_idx is None:
+        # A single running sum: accumulate folds the values in C
+        values = (as_float(rows[i][value_idx]) for i in order)
+        for i, total in zip(order, accumulate(values), strict=True):
+            row_totals[i] = total
+    else:
+        running_totals: dict[Any, float] = defaultdict(float)
+        for i in order:
+            row = rows[i]
+            group_key = row[group_idx]
+            running_totals[group_key] += as_float(row[value_idx])
+            row_totals[i] = running_totals[group_key]
 
     # Build output with running totals in original order
-    output_rows: list[list[Any]] = []
-    for i, row in enumerate(result.rows):
-        output_rows.append([*row, row_totals.get(i, 0)])
+    output_rows = [[*row, total] for row, total in zip(rows, row_totals, strict=True)]
 
-    return QueryResult(
+    return QueryResult.model_construct(
         columns=[*result.columns, f"{value_column}_running_total"],
         column_types=[*result.column_types, "numeric"],
         rows=output_rows,
         row_count=result.row_count,
         truncated=result.truncated,
-        execution_time_ms=0,
+        execution_time_ms=0.0,
     )
 
 
@@ -338,62 +378,67 @@ def calculate_percent_of_total(
         New QueryResult with percentage column added.
     """
     if not result.rows:
-        return QueryResult(
+        return QueryResult.model_construct(
             columns=[*result.columns, f"{value_column}_pct"],
             column_types=[*result.column_types, "numeric"],
             rows=[],
             row_count=0,
             truncated=False,
-            execution_time_ms=0,
+            execution_time_ms=0.0,
         )
 
+    indices = _column_indices(result)
     try:
-        value_idx = result.columns.index(value_column)
-    except ValueError as e:
+        value_idx = indices[value_column]
+    except KeyError as e:
         raise ValueError(f"Column '{value_column}' not found in result") from e
 
     group_idx = None
     if group_column is not None:
         try:
-            group_idx = result.columns.index(group_column)
-        except ValueError as e:
+            group_idx = indices[group_column]
+        except KeyError as e:
             raise ValueError(f"Group column '{group_column}' not found") from e
 
-    # Calculate totals per group
-    group_totals: dict[Any, float] = defaultdict(float)
-
-    for row in result.rows:
-        group_key = row[group_idx] if group_idx is not None else "__all__"
-        val = row[value_idx]
-
-        if val is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                group_totals[group_key] += float(val)
+    # Coerce values once; both passes below reuse them
+    values = [as_float_or_none(row[value_idx]) for row in result.rows]
 
-    # Calculate percentages
-    output_rows: list[list[Any]] = []
-    for row in result.rows:
-        group_key = row[group_idx] if group_idx is not None else "__all__"
-        val = row[value_idx]
-        total = group_totals[group_key]
-
-        if val is not None and total > 0:
-            try:
-                pct = (float(val) / total) * 100
-            except (ValueError, TypeError):
-                pct = None
+    # Percentages are None wherever the (group) total is not positive. That
+    # is decided once per total, not once per row.
+    pcts: list[float | None]
+    if group_idx is None:
+        total = sum(val for val in values if val is not None)
+        if total > 0:
+            pcts = [(val / total) * 100 if val is not None else None for val in values]
         else:
-            pct = None
-
-        output_rows.append([*row, pct])
-
-    return QueryResult(
+            pcts = [None] * len(values)
+    else:
+        group_keys = [row[group_idx] for row in result.rows]
+
+        # Calculate totals per group
+        group_totals: dict[Any, float] = defaultdict(float)
+        for group_key, val in zip(group_keys, values, strict=True):
+            if val is not None:
+                group_totals[group_key] += val
+        positive_totals = {key: total for key, total in group_totals.items() if total > 0}
+
+        pcts = []
+        for group_key, val in zip(group_keys, values, strict=True):
+            group_total = positive_totals.get(group_key)
+            if val is None or group_total is None:
+                pcts.append(None)
+            else:
+                pcts.append((val / group_total) * 100)
+
+    output_rows = [[*row, pct] for row, pct in zip(result.rows, pcts, strict=True)]
+
+    return QueryResult.model_construct(
         columns=[*result.columns, f"{value_column}_pct"],
         column_types=[*result.column_types, "numeric"],
         rows=output_rows,
         row_count=result.row_count,
         truncated=result.truncated,
-        execution_time_ms=0,
+        execution_time_ms=0.0,
     )
 
 
@@ -420,21 +465,22 @@ def sort_result(
     except ValueError as e:
         raise ValueError(f"Column '{column}' not found in result") from e
 
-    # Sort with None values at the end
-    def sort_key(row: list[Any]) -> tuple[bool, Any]:
-        val = row[col_idx]
-        # Put None values last
-        return (val is None, val or 0)
+    # Sort non-null rows on the bare cell value and keep nulls apart, so the
+    # key needs no per-row None check or tuple; nulls go last ascending and
+    # first descending, in their original order
+    non_null_rows = [row for row in result.rows if row[col_idx] is not None]
+    null_rows = [row for row in result.rows if row[col_idx] is None]
+    non_null_rows.sort(key=itemgetter(col_idx), reverse=descending)
 
-    sorted_rows = sorted(result.rows, key=sort_key, reverse=descending)
+    sorted_rows = null_rows + non_null_rows if descending else non_null_rows + null_rows
 
-    return QueryResult(
+    return QueryResult.model_construct(
         columns=result.columns,
         column_types=result.column_types,
         rows=sorted_rows,
         row_count=result.row_count,
         truncated=result.truncated,
-        execution_time_ms=0,
+        execution_time_ms=0.0,
     )
 
 
@@ -461,11 +507,11 @@ def limit_result(
     sliced_rows = result.rows[offset : offset + limit]
     truncated = (offset + limit) < len(result.rows) or result.truncated
 
-    return QueryResult(
+    return QueryResult.model_construct(
         columns=result.columns,
         column_types=result.column_types,
         rows=sliced_rows,
         row_count=len(sliced_rows),
         truncated=truncated,
-        execution_time_ms=0,
+        execution_time_ms=0.0,
     )
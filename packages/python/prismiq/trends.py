@@ -6,14 +6,17 @@ period comparisons, and moving averages.
 
 from __future__ import annotations
 
-import contextlib
-from collections import defaultdict
-from datetime import date, datetime, timedelta
-from enum import Enum
+from calendar import monthrange
+from collections import deque
+from collections.abc import Callable, Iterable
+from datetime import date, timedelta
+from enum import Enum, unique
+from math import fsum
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict
 
+from prismiq._cells import as_float_or_none
 from prismiq.types import QueryResult
 
 
@@ -46,6 +49,7 @@ class TrendResult(BaseModel):
     """Direction of the trend."""
 
 
+@unique
 class ComparisonPeriod(str, Enum):
     """Period for comparison."""
 
@@ -55,6 +59,15 @@ class ComparisonPeriod(str, Enum):
     PREVIOUS_WEEK = "previous_week"
 
 
+def _percent_change(current: float, previous: float) -> float:
+    """Percent change from previous to current, treating a move off zero as +/-100%."""
+    if previous == 0:
+        if current == 0:
+            return 0.0
+        return 100.0 if current > 0 else -100.0
+    return ((current - previous) / abs(previous)) * 100
+
+
 def calculate_trend(
     current: float | None,
     previous: float | None,
@@ -92,17 +105,7 @@ def calculate_trend(
         )
 
     absolute_change = current - previous
-
-    # Calculate percent change (handle division by zero)
-    if previous == 0:
-        if current == 0:
-            percent_change = 0.0
-        elif current > 0:
-            percent_change = 100.0  # Treat as 100% increase from zero
-        else:
-            percent_change = -100.0  # Treat as 100% decrease
-    else:
-        percent_change = (absolute_change / abs(previous)) * 100
+    percent_change = _percent_change(current, previous)
 
     # Determine direction
     if abs(percent_change) < threshold * 100:  # threshold is a ratio, not percent
@@ -121,6 +124,50 @@ def calculate_trend(
     )
 
 
+def _previous_period_range(current_start: date, current_end: date) -> tuple[date, date]:
+    """Same length, immediately before."""
+    prev_end = current_start - timedelta(days=1)
+    prev_start = current_start - timedelta(days=(current_end - current_start).days + 1)
+    return prev_start, prev_end
+
+
+def _one_year_earlier(day: date) -> date:
+    """Same date one year earlier, with Feb 29 mapping to Feb 28."""
+    try:
+        return day.replace(year=day.year - 1)
+    except ValueError:
+        return day.replace(year=day.year - 1, day=28)
+
+
+def _one_month_earlier(day: date) -> date:
+    """Same day one month earlier, clamped to the end of that month (Mar 31 -> Feb 28)."""
+    year, month = (day.year - 1, 12) if day.month == 1 else (day.year, day.month - 1)
+    return day.replace(year=year, month=month, day=min(day.day, monthrange(year, month)[1]))
+
+
+def _previous_year_range(current_start: date, current_end: date) -> tuple[date, date]:
+    """Same dates, one year earlier."""
+    return _one_year_earlier(current_start), _one_year_earlier(current_end)
+
+
+def _previous_month_range(current_start: date, current_end: date) -> tuple[date, date]:
+    """Same dates, one month earlier."""
+    return _one_month_earlier(current_start), _one_month_earlier(current_end)
+
+
+def _previous_week_range(current_start: date, current_end: date) -> tuple[date, date]:
+    """Same dates, one week earlier."""
+    return current_start - timedelta(weeks=1), current_end - timedelta(weeks=1)
+
+
+_COMPARISON_RANGES: dict[ComparisonPeriod, Callable[[date, date], tuple[date, date]]] = {
+    ComparisonPeriod.PREVIOUS_PERIOD: _previous_period_range,
+    ComparisonPeriod.PREVIOUS_YEAR: _previous_year_range,
+    ComparisonPeriod.PREVIOUS_MONTH: _previous_month_range,
+    ComparisonPeriod.PREVIOUS_WEEK: _previous_week_range,
+}
+
+
 def _get_comparison_date_range(
     current_start: date,
     current_end: date,
@@ -136,75 +183,14 @@ def _get_comparison_date_range(
     Returns:
         Tuple of (previous_start, previous_end).
     """
-    period_length = (current_end - current_start).days + 1
-
-    if comparison == ComparisonPeriod.PREVIOUS_PERIOD:
-        # Same length, immediately before
-        prev_end = current_start - timedelta(days=1)
-        prev_start = prev_end - timedelta(days=period_length - 1)
-        return prev_start, prev_end
-
-    if comparison == ComparisonPeriod.PREVIOUS_YEAR:
-        # Same dates, one year earlier
-        try:
-            prev_start = current_start.replace(year=current_start.year - 1)
-            prev_end = current_end.replace(year=current_end.year - 1)
-        except ValueError:
-            # Handle Feb 29 in non-leap year
-            prev_start = current_start.replace(year=current_start.year - 1, day=28)
-            prev_end = current_end.replace(year=current_end.year - 1, day=28)
-        return prev_start, prev_end
-
-    if comparison == ComparisonPeriod.PREVIOUS_MONTH:
-        # One month earlier
-        if current_start.month == 1:
-            prev_start = current_start.replace(year=current_start.year - 1, month=12)
-        else:
-            # Handle day overflow (e.g., Mar 31 -> Feb 28)
-            try:
-                prev_start = current_start.replace(month=current_start.month - 1)
-            except ValueError:
-                # Day doesn't exist in previous month
-                prev_start = current_start.replace(month=current_start.month - 1, day=1)
-                # Move to last day of that month
-                if prev_start.month == 12:
-                    next_month = prev_start.replace(year=prev_start.year + 1, month=1)
-                else:
-                    next_month = prev_start.replace(month=prev_start.month + 1)
-                prev_start = next_month - timedelta(days=1)
-
-        if current_end.month == 1:
-            prev_end = current_end.replace(year=current_end.year - 1, month=12)
-        else:
-            try:
-                prev_end = current_end.replace(month=current_end.month - 1)
-            except ValueError:
-                prev_end = current_end.replace(month=current_end.month - 1, day=1)
-                if prev_end.month == 12:
-                    next_month = prev_end.replace(year=prev_end.year + 1, month=1)
-                else:
-                    next_month = prev_end.replace(month=prev_end.month + 1)
-                prev_end = next_month - timedelta(days=1)
-
-        return prev_start, prev_end
-
-    if comparison == ComparisonPeriod.PREVIOUS_WEEK:
-        # One week earlier
-        prev_start = current_start - timedelta(weeks=1)
-        prev_end = current_end - timedelta(weeks=1)
-        return prev_start, prev_end
-
-    # Default to previous period
-    prev_end = current_start - timedelta(days=1)
-    prev_start = prev_end - timedelta(days=period_length - 1)
-    return prev_start, prev_end
+    return _COMPARISON_RANGES[comparison](current_start, current_end)
 
 
 def calculate_period_comparison(
     result: QueryResult,
     date_column: str,
     value_column: str,
-    comparison: ComparisonPeriod,
+    comparison: ComparisonPeriod | str,
     current_start: date,
     current_end: date,
 ) -> TrendResult:
@@ -214,16 +200,19 @@ def calculate_period_comparison(
         result: Query result containing date and value columns.
         date_column: Name of the date column.
         value_column: Name of the value column.
-        comparison: Type of period comparison.
+        comparison: Type of period comparison, or its string value.
         current_start: Start of current period.
         current_end: End of current period.
 
     Returns:
         TrendResult with period comparison.
     """
+    if not isinstance(comparison, ComparisonPeriod):
+        comparison = ComparisonPeriod(comparison)
+
     if not result.rows:
-        return TrendResult(
-            current_value=0,
+        return TrendResult.model_construct(
+            current_value=0.0,
             previous_value=None,
             absolute_change=None,
             percent_change=None,
@@ -239,33 +228,25 @@ def calculate_period_comparison(
     # Calculate comparison period
     prev_start, prev_end = _get_comparison_date_range(current_start, current_end, comparison)
 
+    # Compare day ordinals rather than date objects; datetime.toordinal() drops the time
+    current_lo, current_hi = current_start.toordinal(), current_end.toordinal()
+    prev_lo, prev_hi = prev_start.toordinal(), prev_end.toordinal()
+
     # Sum values for each period
     current_sum = 0.0
     previous_sum = 0.0
 
     for row in result.rows:
         date_val = row[date_idx]
-        value = row[value_idx]
+        float_value = as_float_or_none(row[value_idx])
 
-        if date_val is None or value is None:
-            continue
-
-        # Convert to date if datetime
-        if isinstance(date_val, datetime):
-            row_date = date_val.date()
-        elif isinstance(date_val, date):
-            row_date = date_val
-        else:
+        if float_value is None or not isinstance(date_val, date):
             continue
 
-        try:
-            float_value = float(value)
-        except (ValueError, TypeError):
-            continue
-
-        if current_start <= row_date <= current_end:
+        ordinal = date_val.toordinal()
+        if current_lo <= ordinal <= current_hi:
             current_sum += float_value
-        elif prev_start <= row_date <= prev_end:
+        elif prev_lo <= ordinal <= prev_hi:
             previous_sum += float_value
 
     return calculate_trend(current_sum, previous_sum if previous_sum != 0 else None)
@@ -288,10 +269,12 @@ def add_trend_column(
         group_column: Column to group by (calculate trends within groups).
 
     Returns:
-        New QueryResult with trend columns added.
+        New QueryResult with trend columns added. It is built with
+        model_construct: the rows come from an already-validated result, so
+        they are not re-validated or copied again.
     """
     if not result.rows:
-        return QueryResult(
+        return QueryResult.model_construct(
             columns=[
                 *result.columns,
                 f"{value_column}_prev",
@@ -302,7 +285,7 @@ def add_trend_column(
             rows=[],
             row_count=0,
             truncated=False,
-            execution_time_ms=0,
+            execution_time_ms=0.0,
         )
 
     try:
@@ -318,51 +301,36 @@ def add_trend_column(
         except ValueError as e:
             raise ValueError(f"Group column not found: {e}") from e
 
-    # Create indexed rows and sort
-    indexed_rows = list(enumerate(result.rows))
-    indexed_rows.sort(key=lambda x: (x[1][order_idx] or 0))
+    rows = result.rows
+    order = sorted(range(len(rows)), key=lambda i: rows[i][order_idx] or 0)
 
     # Calculate previous values per group
-    previous_values: dict[Any, float | None] = defaultdict(lambda: None)
-    row_trends: dict[int, tuple[float | None, float | None, float | None]] = {}
-
-    for original_idx, row in indexed_rows:
-        group_key = row[group_idx] if group_idx is not None else "__all__"
-        current = row[value_idx]
-        previous = previous_values[group_key]
-
-        if current is not None:
-            try:
-                current_float = float(current)
-            except (ValueError, TypeError):
-                current_float = None
-        else:
-            current_float = None
+    previous_values: dict[Any, float] = {}
+    row_trends: list[tuple[float | None, float | None, float | None]]
+    row_trends = [(None, None, None)] * len(rows)
+
+    for original_idx in order:
+        row = rows[original_idx]
+        group_key = row[group_idx] if group_idx is not None else None
+        current_float = as_float_or_none(row[value_idx])
+        previous = previous_values.get(group_key)
+
+        if current_float is None:
+            row_trends[original_idx] = (previous, None, None)
+            continue
 
         # Calculate trend
-        if current_float is not None and previous is not None:
+        if previous is not None:
             change = current_float - previous
-            if previous != 0:
-                pct_change = (change / abs(previous)) * 100
-            else:
-                pct_change = 100.0 if current_float > 0 else (-100.0 if current_float < 0 else 0.0)
-        else:
-            change = None
-            pct_change = None
-
-        row_trends[original_idx] = (previous, change, pct_change)
+            row_trends[original_idx] = (previous, change, _percent_change(current_float, previous))
 
         # Update previous value for group
-        if current_float is not None:
-            previous_values[group_key] = current_float
+        previous_values[group_key] = current_float
 
     # Build output with trend columns in original order
-    output_rows: list[list[Any]] = []
-    for i, row in enumerate(result.rows):
-        prev, change, pct = row_trends.get(i, (None, None, None))
-        output_rows.append([*row, prev, change, pct])
+    output_rows = [[*row, *trend] for row, trend in zip(rows, row_trends, strict=True)]
 
-    return QueryResult(
+    return QueryResult.model_construct(
         columns=[
             *result.columns,
             f"{value_column}_prev",
@@ -373,7 +341,7 @@ def add_trend_column(
         rows=output_rows,
         row_count=result.row_count,
         truncated=result.truncated,
-        execution_time_ms=0,
+        execution_time_ms=0.0,
     )
 
 
@@ -392,16 +360,20 @@ def calculate_moving_average(
         order_column: Column to order by (uses existing order if None).
 
     Returns:
-        New QueryResult with moving average column added.
+        New QueryResult with moving average column added (built with
+        model_construct, since its rows derive from a validated result).
     """
+    if window < 1:
+        raise ValueError(f"Window must be at least 1, got {window}")
+
     if not result.rows:
-        return QueryResult(
+        return QueryResult.model_construct(
             columns=[*result.columns, f"{value_column}_ma{window}"],
             column_types=[*result.column_types, "numeric"],
             rows=[],
             row_count=0,
             truncated=False,
-            execution_time_ms=0,
+            execution_time_ms=0.0,
         )
 
     try:
@@ -416,45 +388,36 @@ def calculate_moving_average(
         except ValueError as e:
             raise ValueError(f"Order column '{order_column}' not found") from e
 
-    # Create indexed rows and optionally sort
-    indexed_rows = list(enumerate(result.rows))
+    rows = result.rows
     if order_idx is not None:
-        indexed_rows.sort(key=lambda x: (x[1][order_idx] or 0))
-
-    # Calculate moving averages
-    values: list[float] = []
-    row_averages: dict[int, float | None] = {}
-
-    for original_idx, row in indexed_rows:
-        val = row[value_idx]
-
-        if val is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                values.append(float(val))
-
-        # Calculate moving average for this position
-        if len(values) >= window:
-            window_values = values[-window:]
-            row_averages[original_idx] = sum(window_values) / len(window_values)
-        elif values:
-            # Partial window
-            row_averages[original_idx] = sum(values) / len(values)
-        else:
-            row_averages[original_idx] = None
+        order: Iterable[int] = sorted(range(len(rows)), key=lambda i: rows[i][order_idx] or 0)
+    else:
+        order = range(len(rows))
+
+    # The deque drops the oldest value as the window slides; each average is
+    # re-summed with fsum, since a running sum leaves float residue behind
+    window_values: deque[float] = deque(maxlen=window)
+    row_averages: list[float | None] = [None] * len(rows)
+
+    for original_idx in order:
+        float_value = as_float_or_none(rows[original_idx][value_idx])
+        if float_value is not None:
+            window_values.append(float_value)
+
+        # Partial windows average over the values seen so far
+        if window_values:
+            row_averages[original_idx] = fsum(window_values) / len(window_values)
 
     # Build output in original order
-    output_rows: list[list[Any]] = []
-    for i, row in enumerate(result.rows):
-        ma = row_averages.get(i)
-        output_rows.append([*row, ma])
+    output_rows = [[*row, ma] for row, ma in zip(rows, row_averages, strict=True)]
 
-    return QueryResult(
+    return QueryResult.model_construct(
         columns=[*result.columns, f"{value_column}_ma{window}"],
         column_types=[*result.column_types, "numeric"],
         rows=output_rows,
         row_count=result.row_count,
         truncated=result.truncated,
-        execution_time_ms=0,
+        execution_time_ms=0.0,
     )
 
 
@@ -473,10 +436,11 @@ def calculate_year_over_year(
         value_column: Column containing values.
 
     Returns:
-        New QueryResult with YoY comparison columns.
+        New QueryResult with YoY comparison columns, constructed without
+        re-validating the input rows.
     """
     if not result.rows:
-        return QueryResult(
+        return QueryResult.model_construct(
             columns=[
                 *result.columns,
                 f"{value_column}_prev_year",
@@ -487,7 +451,7 @@ def calculate_year_over_year(
             rows=[],
             row_count=0,
             truncated=False,
-            execution_time_ms=0,
+            execution_time_ms=0.0,
         )
 
     try:
@@ -496,69 +460,37 @@ def calculate_year_over_year(
     except ValueError as e:
         raise ValueError(f"Column not found: {e}") from e
 
-    # Build a map of (month, day or period) -> value for previous year
-    # We'll use (month, day) as key for matching
-    year_data: dict[int, dict[tuple[int, int], float]] = defaultdict(dict)
+    # Project each row to its (year, month, day) key and numeric value once. datetime
+    # subclasses date, so both expose the calendar fields without a .date() call.
+    rows = result.rows
+    row_days: list[tuple[int, int, int] | None] = []
+    row_values: list[float | None] = []
 
-    for row in result.rows:
+    # Map (year, month, day) -> value so each row finds last year's value with one probe
+    day_values: dict[tuple[int, int, int], float] = {}
+
+    for row in rows:
         date_val = row[date_idx]
-        value = row[value_idx]
+        day = (date_val.year, date_val.month, date_val.day) if isinstance(date_val, date) else None
+        value = as_float_or_none(row[value_idx])
+        row_days.append(day)
+        row_values.append(value)
+        if day is not None and value is not None:
+            day_values[day] = value
 
-        if date_val is None or value is None:
-            continue
+    # Calculate YoY for each row
+    output_rows: list[list[Any]] = []
+    for row, day, value in zip(rows, row_days, row_values, strict=True):
+        prev_year_val = day_values.get((day[0] - 1, day[1], day[2])) if day is not None else None
 
-        if isinstance(date_val, datetime):
-            row_date = date_val.date()
-        elif isinstance(date_val, date):
-            row_date = date_val
+        if prev_year_val is not None and value is not None:
+            yoy_change = value - prev_year_val
+            yoy_pct = _percent_change(value, prev_year_val)
+            output_rows.append([*row, prev_year_val, yoy_change, yoy_pct])
         else:
-            continue
+            output_rows.append([*row, prev_year_val, None, None])
 
-        try:
-            float_value = float(value)
-        except (ValueError, TypeError):
-            continue
-
-        key = (row_date.month, row_date.day)
-        year_data[row_date.year][key] = float_value
-
-    # Calculate YoY for each row
-    output_rows: list[list[Any]] = []
-    for row in result.rows:
-        date_val = row[date_idx]
-        value = row[value_idx]
-
-        prev_year_val: float | None = None
-        yoy_change: float | None = None
-        yoy_pct: float | None = None
-
-        if date_val is not None:
-            if isinstance(date_val, datetime):
-                row_date = date_val.date()
-            elif isinstance(date_val, date):
-                row_date = date_val
-            else:
-                row_date = None  # type: ignore[assignment]
-
-            if row_date is not None:
-                key = (row_date.month, row_date.day)
-                prev_year = row_date.year - 1
-                prev_year_val = year_data.get(prev_year, {}).get(key)
-
-                if prev_year_val is not None and value is not None:
-                    try:
-                        current_float = float(value)
-                        yoy_change = current_float - prev_year_val
-                        if prev_year_val != 0:
-                            yoy_pct = (yoy_change / abs(prev_year_val)) * 100
-                        else:
-                            yoy_pct = 100.0 if current_float > 0 else 0.0
-                    except (ValueError, TypeError):
-                        pass
-
-        output_rows.append([*row, prev_year_val, yoy_change, yoy_pct])
-
-    return QueryResult(
+    return QueryResult.model_construct(
         columns=[
             *result.columns,
             f"{value_column}_prev_year",
@@ -569,5 +501,5 @@ def calculate_year_over_year(
         rows=output_rows,
         row_count=result.row_count,
         truncated=result.truncated,
-        execution_time_ms=0,
+        execution_time_ms=0.0,
     )
@@ -22,7 +22,7 @@ if TYPE_CHECKING:
 class ColumnSchema(BaseModel):
     """Schema information for a single database column."""
 
-    model_config = ConfigDict()
+    model_config = ConfigDict(frozen=True)
 
     name: str
     """Column name."""
@@ -43,7 +43,7 @@ class ColumnSchema(BaseModel):
 class TableSchema(BaseModel):
     """Schema information for a database table."""
 
-    model_config = ConfigDict()
+    model_config = ConfigDict(frozen=True)
 
     name: str
     """Table name."""
@@ -72,7 +72,7 @@ class TableSchema(BaseModel):
 class Relationship(BaseModel):
     """Foreign key relationship between two tables."""
 
-    model_config = ConfigDict()
+    model_config = ConfigDict(frozen=True)
 
     from_table: str
     """Name of the table containing the foreign key."""
@@ -517,11 +517,11 @@ class QueryDefinition(BaseModel):
 
     def has_aggregations(self) -> bool:
         """Check if any column has an aggregation."""
-        return any(col.aggregation != AggregationType.NONE for col in self.columns)
+        return any(col.aggregation is not AggregationType.NONE for col in self.columns)
 
     def get_non_aggregated_columns(self) -> list[ColumnSelection]:
         """Get columns that don't have aggregations applied."""
-        return [col for col in self.columns if col.aggregation == AggregationType.NONE]
+        return [col for col in self.columns if col.aggregation is AggregationType.NONE]
 
     def derive_group_by(self) -> list[GroupByDefinition]:
         """Auto-derive GROUP BY from non-aggregated columns.
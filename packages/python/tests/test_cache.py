@@ -216,6 +216,52 @@ class TestInMemoryCacheClear:
         assert await cache.get("key") == "value"
 
 
+class TestInMemoryCacheEviction:
+    """Tests for LRU eviction and prefix-indexed clearing."""
+
+    @pytest.mark.asyncio
+    async def test_max_size_evicts_least_recently_used(self) -> None:
+        """Exceeding max_size evicts the entry that was used longest ago."""
+        cache = InMemoryCache(max_size=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert await cache.get("c") == 3
+
+    @pytest.mark.asyncio
+    async def test_clear_prefix_pattern_uses_index(self) -> None:
+        """Prefix patterns only clear keys under that colon-delimited prefix."""
+        cache = InMemoryCache()
+        await cache.set("schema:org_1:full", "a")
+        await cache.set("schema:org_1:table:users", "b")
+        await cache.set("schema:org_10:full", "c")
+
+        count = await cache.clear("schema:org_1:*")
+
+        assert count == 2
+        assert await cache.get("schema:org_10:full") == "c"
+        assert cache._prefix_index == {
+            "schema:": {"schema:org_10:full"},
+            "schema:org_10:": {"schema:org_10:full"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_overwrite_keeps_new_deadline(self) -> None:
+        """A stale heap deadline does not expire an entry that was re-set."""
+        cache = InMemoryCache()
+        await cache.set("key", "old", ttl=0)
+        await cache.set("key", "new", ttl=60)
+        await asyncio.sleep(0.01)
+
+        cache._cleanup_expired()
+
+        assert await cache.get("key") == "new"
+
+
 class TestInMemoryCacheCleanup:
     """Tests for expired entry cleanup."""
 
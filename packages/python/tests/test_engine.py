@@ -175,6 +175,7 @@ class TestLifecycle:
             with patch("prismiq.engine.SchemaIntrospector") as mock_introspector_class:
                 mock_introspector = MagicMock()
                 mock_introspector.get_schema = AsyncMock(return_value=sample_schema)
+                mock_introspector.close = AsyncMock()
                 mock_introspector_class.return_value = mock_introspector
 
                 engine = PrismiqEngine(database_url="postgresql://localhost/test")
@@ -182,6 +183,7 @@ class TestLifecycle:
                 await engine.shutdown()
 
                 mock_pool.close.assert_called_once()
+                mock_introspector.close.assert_awaited_once()
 
     async def test_shutdown_clears_components(
         self, mock_pool: MagicMock, sample_schema: DatabaseSchema
@@ -193,6 +195,7 @@ class TestLifecycle:
             with patch("prismiq.engine.SchemaIntrospector") as mock_introspector_class:
                 mock_introspector = MagicMock()
                 mock_introspector.get_schema = AsyncMock(return_value=sample_schema)
+                mock_introspector.close = AsyncMock()
                 mock_introspector_class.return_value = mock_introspector
 
                 engine = PrismiqEngine(database_url="postgresql://localhost/test")
@@ -198,6 +198,17 @@ class TestSimpleQueries:
         assert sql == 'SELECT "users"."email" FROM "users"'
         assert params == []
 
+    def test_parameterless_builds_return_independent_params(self, builder: QueryBuilder) -> None:
+        """Test that appending to one build's params doesn't leak into the next."""
+        query = QueryDefinition(
+            tables=[QueryTable(id="t1", name="users")],
+            columns=[ColumnSelection(table_id="t1", column="email")],
+        )
+        _, params = builder.build(query)
+        params.append(100)
+
+        assert builder.build(query)[1] == []
+
     def test_select_multiple_columns(self, builder: QueryBuilder) -> None:
         """Test SELECT with multiple columns."""
         query = QueryDefinition(
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from prismiq.cache import InMemoryCache
+from prismiq.cache import InMemoryCache, SchemaCache
 from prismiq.schema import SchemaIntrospector
 from prismiq.types import TableNotFoundError
 
@@ -28,9 +30,6 @@ def mock_pool() -> MagicMock:
     mock_context.__aexit__.return_value = None
     pool.acquire.return_value = mock_context
 
-    # Mock fetchrow for row count queries (returns a record with row_count)
-    mock_connection.fetchrow.return_value = make_record({"row_count": 100})
-
     return pool
 
 
@@ -43,11 +42,70 @@ def mock_connection(mock_pool: MagicMock) -> AsyncMock:
 def make_record(data: dict[str, Any]) -> MagicMock:
     """Create a mock asyncpg Record."""
     record = MagicMock()
-    record.__getitem__ = lambda self, key: data[key]
+    record.__getitem__ = lambda self, key: (
+        data[key] if isinstance(key, str) else list(data.values())[key]
+    )
+    record.__iter__ = lambda self: iter(data.values())
     record.keys.return_value = data.keys()
     return record
 
 
+def catalog_row(kind: str, table_name: str, **values: Any) -> dict[str, Any]:
+    """Describe one catalog fact (table, column, primary_key, row_count, relationship)."""
+    return {"kind": kind, "table_name": table_name, **values}
+
+
+def column_row(table_name: str, column_name: str, data_type: str = "integer") -> dict[str, Any]:
+    """Describe a NOT NULL column catalog fact."""
+    return catalog_row(
+        "column", table_name, column_name=column_name, data_type=data_type, is_nullable="NO"
+    )
+
+
+def users_catalog() -> list[dict[str, Any]]:
+    """Catalog facts for a single "users" table keyed on "id"."""
+    return [
+        catalog_row("table", "users"),
+        column_row("users", "id"),
+        catalog_row("primary_key", "users", column_name="id"),
+    ]
+
+
+def catalog_result(facts: list[dict[str, Any]]) -> list[MagicMock]:
+    """Create the single-row result of the catalog query from catalog facts."""
+    catalog: dict[str, list[Any]] = {
+        "tables": [],
+        "columns": [],
+        "primary_keys": [],
+        "relationships": [],
+    }
+    row_counts: list[list[Any]] = []
+    for fact in facts:
+        table_name = fact["table_name"]
+        kind = fact["kind"]
+        if kind == "table":
+            catalog["tables"].append(table_name)
+        elif kind == "column":
+            catalog["columns"].append(
+                [
+                    table_name,
+                    fact["column_name"],
+                    fact["data_type"],
+                    fact["is_nullable"],
+                    fact.get("column_default"),
+                ]
+            )
+        elif kind == "primary_key":
+            catalog["primary_keys"].append([table_name, fact["column_name"]])
+        elif kind == "row_count":
+            row_counts.append([table_name, fact["row_count"]])
+        elif kind == "relationship":
+            catalog["relationships"].append(
+                [table_name, fact["column_name"], fact["ref_table"], fact["ref_column"]]
+            )
+    return [make_record({"catalog": json.dumps(catalog), "row_counts": json.dumps(row_counts)})]
+
+
 # ============================================================================
 # Tests
 # ============================================================================
@@ -90,34 +148,15 @@ class TestGetSchema:
         self, mock_pool: MagicMock, mock_connection: AsyncMock
     ) -> None:
         """Test that get_schema returns a DatabaseSchema."""
-        # Mock table names query
-        mock_connection.fetch.side_effect = [
-            # Tables query
-            [make_record({"table_name": "users"})],
-            # Columns query for users
+        mock_connection.fetch.return_value = catalog_result(
             [
-                make_record(
-                    {
-                        "column_name": "id",
-                        "data_type": "integer",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-                make_record(
-                    {
-                        "column_name": "email",
-                        "data_type": "text",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-            ],
-            # Primary keys query for users
-            [make_record({"column_name": "id"})],
-            # Relationships query
-            [],
-        ]
+                catalog_row("table", "users"),
+                column_row("users", "id"),
+                column_row("users", "email", "text"),
+                catalog_row("primary_key", "users", column_name="id"),
+                catalog_row("row_count", "users", row_count=42),
+            ]
+        )
 
         introspector = SchemaIntrospector(mock_pool)
         schema = await introspector.get_schema()
@@ -126,41 +165,64 @@ class TestGetSchema:
         assert schema.tables[0].name == "users"
         assert len(schema.tables[0].columns) == 2
         assert schema.tables[0].columns[0].is_primary_key is True
+        assert schema.tables[0].columns[1].is_primary_key is False
+        assert schema.tables[0].row_count == 42
 
-    async def test_get_schema_filters_exposed_tables(
+    async def test_get_schema_uses_single_round_trip(
         self, mock_pool: MagicMock, mock_connection: AsyncMock
     ) -> None:
-        """Test that get_schema respects exposed_tables filter."""
-        # Mock returns all tables, but we only expose "users"
-        mock_connection.fetch.side_effect = [
-            # Tables query returns multiple tables
-            [
-                make_record({"table_name": "orders"}),
-                make_record({"table_name": "users"}),
-            ],
-            # Columns for users only (orders filtered out)
+        """Test that get_schema fetches the whole catalog with one query."""
+        mock_connection.fetch.return_value = catalog_result(
             [
-                make_record(
-                    {
-                        "column_name": "id",
-                        "data_type": "integer",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
+                *users_catalog(),
+                catalog_row("table", "orders"),
+                column_row("orders", "id"),
+                column_row("orders", "user_id"),
+                catalog_row(
+                    "relationship",
+                    "orders",
+                    column_name="user_id",
+                    ref_table="users",
+                    ref_column="id",
                 ),
-            ],
-            # Primary keys for users
-            [make_record({"column_name": "id"})],
-            # Relationships
-            [],
-        ]
+            ]
+        )
+
+        introspector = SchemaIntrospector(mock_pool)
+        schema = await introspector.get_schema()
+
+        assert mock_connection.fetch.call_count == 1
+        assert mock_pool.acquire.call_count == 1
+        assert schema.table_names() == ["users", "orders"]
+        assert len(schema.relationships) == 1
+        assert schema.relationships[0].from_table == "orders"
+        assert schema.relationships[0].to_table == "users"
+
+    async def test_get_schema_filters_exposed_tables(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that get_schema pushes the exposed_tables filter into the query."""
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
 
         introspector = SchemaIntrospector(mock_pool, exposed_tables=["users"])
         schema = await introspector.get_schema()
 
-        # Only users table should be returned
         assert len(schema.tables) == 1
         assert schema.tables[0].name == "users"
+        _, schema_name, exposed = mock_connection.fetch.call_args.args
+        assert schema_name == "public"
+        assert exposed == ["users"]
+
+    async def test_get_schema_without_filter_passes_null(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that all tables are requested when exposed_tables is None."""
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+
+        introspector = SchemaIntrospector(mock_pool)
+        await introspector.get_schema()
+
+        assert mock_connection.fetch.call_args.args[2] is None
 
 
 class TestGetTable:
@@ -170,23 +232,7 @@ class TestGetTable:
         self, mock_pool: MagicMock, mock_connection: AsyncMock
     ) -> None:
         """Test that get_table returns a TableSchema."""
-        mock_connection.fetch.side_effect = [
-            # Tables query
-            [make_record({"table_name": "users"})],
-            # Columns query
-            [
-                make_record(
-                    {
-                        "column_name": "id",
-                        "data_type": "integer",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-            ],
-            # Primary keys query
-            [make_record({"column_name": "id"})],
-        ]
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
 
         introspector = SchemaIntrospector(mock_pool)
         table = await introspector.get_table("users")
@@ -194,6 +240,150 @@ class TestGetTable:
         assert table.name == "users"
         assert len(table.columns) == 1
 
+    async def test_get_table_reuses_catalog_bundle(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that get_table slices every table from one schema-wide catalog scan."""
+        mock_connection.fetch.return_value = catalog_result(
+            [
+                *users_catalog(),
+                catalog_row("table", "orders"),
+                column_row("orders", "id"),
+            ]
+        )
+
+        introspector = SchemaIntrospector(mock_pool)
+        users = await introspector.get_table("users")
+        orders = await introspector.get_table("orders")
+
+        assert users.name == "users"
+        assert orders.name == "orders"
+        assert mock_connection.fetch.call_count == 1
+
+    async def test_get_table_rejects_unknown_table_without_lookup(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that misses are answered from the known-tables set while it is fresh."""
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+        cache = AsyncMock()
+        cache.get.return_value = None
+
+        introspector = SchemaIntrospector(mock_pool, cache=cache)
+        await introspector.get_table("users")
+        cache.get.reset_mock()
+
+        with pytest.raises(TableNotFoundError):
+            await introspector.get_table("nonexistent")
+
+        cache.get.assert_not_called()
+        assert mock_connection.fetch.call_count == 1
+
+    async def test_unchanged_catalog_reuses_built_models(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that a refresh returning identical catalog rows skips the rebuild."""
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+
+        introspector = SchemaIntrospector(mock_pool)
+        schema1 = await introspector.get_schema()
+        schema2 = await introspector.get_schema(force_refresh=True)
+        table = await introspector.get_table("users", force_refresh=True)
+
+        assert mock_connection.fetch.call_count == 3
+        assert schema2 is schema1
+        assert table is schema1.tables[0]
+
+        mock_connection.fetch.return_value = catalog_result(
+            [
+                *users_catalog(),
+                column_row("users", "email", "text"),
+            ]
+        )
+        schema3 = await introspector.get_schema(force_refresh=True)
+
+        assert schema3 is not schema1
+        assert len(schema3.tables[0].columns) == 2
+
+    async def test_row_count_drift_refreshes_counts_without_eviction(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that changed row counts alone keep cached tables and unchanged models."""
+        cache = InMemoryCache()
+        introspector = SchemaIntrospector(mock_pool, cache=cache)
+        orders = [catalog_row("table", "orders"), column_row("orders", "id")]
+        mock_connection.fetch.return_value = catalog_result(
+            [*users_catalog(), *orders, catalog_row("row_count", "users", row_count=10)]
+        )
+        await introspector.get_table("users")
+        schema1 = await introspector.get_schema()
+
+        mock_connection.fetch.return_value = catalog_result(
+            [*users_catalog(), *orders, catalog_row("row_count", "users", row_count=25)]
+        )
+        schema2 = await introspector.get_schema(force_refresh=True)
+
+        assert schema2.tables[0].row_count == 25
+        assert schema2.tables[1] is schema1.tables[1]
+        assert await cache.exists("schema-v2:public:table:users")
+
+    async def test_concurrent_misses_share_one_catalog_scan(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that concurrent cache misses coalesce into a single query."""
+
+        async def slow_fetch(*_args: Any) -> list[MagicMock]:
+            await asyncio.sleep(0.01)
+            return catalog_result(users_catalog())
+
+        mock_connection.fetch.side_effect = slow_fetch
+
+        introspector = SchemaIntrospector(mock_pool)
+        schema, table, again = await asyncio.gather(
+            introspector.get_schema(),
+            introspector.get_table("users"),
+            introspector.get_schema(force_refresh=True),
+        )
+
+        assert schema.tables[0] is table
+        assert again is schema
+        assert mock_connection.fetch.call_count == 1
+
+    async def test_failed_catalog_scan_propagates_to_all_waiters(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that a failed coalesced query raises for every waiter and is retried."""
+
+        async def failing_fetch(*_args: Any) -> list[MagicMock]:
+            await asyncio.sleep(0.01)
+            raise ConnectionError("lost connection")
+
+        mock_connection.fetch.side_effect = failing_fetch
+
+        introspector = SchemaIntrospector(mock_pool)
+        results = await asyncio.gather(
+            introspector.get_schema(), introspector.get_table("users"), return_exceptions=True
+        )
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert mock_connection.fetch.call_count == 1
+
+        mock_connection.fetch.side_effect = None
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+        schema = await introspector.get_schema()
+        assert schema.table_names() == ["users"]
+
+    async def test_invalidate_cache_drops_catalog_bundle(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that invalidate_cache forces the next get_table to rescan."""
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+
+        introspector = SchemaIntrospector(mock_pool)
+        await introspector.get_table("users")
+        await introspector.invalidate_cache()
+        await introspector.get_table("users")
+
+        assert mock_connection.fetch.call_count == 2
+
     async def test_get_table_raises_for_unexposed_table(self, mock_pool: MagicMock) -> None:
         """Test that get_table raises TableNotFoundError for unexposed tables."""
         introspector = SchemaIntrospector(mock_pool, exposed_tables=["users"])
@@ -207,8 +397,8 @@ class TestGetTable:
         self, mock_pool: MagicMock, mock_connection: AsyncMock
     ) -> None:
         """Test that get_table raises TableNotFoundError for nonexistent tables."""
-        # Tables query returns empty
-        mock_connection.fetch.return_value = []
+        # Catalog has no tables
+        mock_connection.fetch.return_value = catalog_result([])
 
         introspector = SchemaIntrospector(mock_pool)
 
@@ -248,7 +438,7 @@ class TestDetectRelationships:
     async def test_detect_relationships_filters_by_exposed_tables(
         self, mock_pool: MagicMock, mock_connection: AsyncMock
     ) -> None:
-        """Test that relationships are filtered by exposed_tables."""
+        """Test that the exposed_tables filter is passed to the query."""
         mock_connection.fetch.return_value = [
             make_record(
                 {
@@ -258,24 +448,53 @@ class TestDetectRelationships:
                     "to_column": "id",
                 }
             ),
-            make_record(
-                {
-                    "from_table": "items",
-                    "from_column": "order_id",
-                    "to_table": "orders",
-                    "to_column": "id",
-                }
-            ),
         ]
 
         # Only expose users and orders (not items)
         introspector = SchemaIntrospector(mock_pool, exposed_tables=["users", "orders"])
         relationships = await introspector.detect_relationships()
 
-        # Only orders->users relationship should be included
-        # items->orders is excluded because items is not exposed
         assert len(relationships) == 1
         assert relationships[0].from_table == "orders"
+        exposed = mock_connection.fetch.call_args.args[2]
+        assert sorted(exposed) == ["orders", "users"]
+
+    async def test_detect_relationships_skips_query_when_nothing_exposed(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that an empty exposed_tables list returns no relationships."""
+        introspector = SchemaIntrospector(mock_pool, exposed_tables=[])
+        relationships = await introspector.detect_relationships()
+
+        assert relationships == []
+        mock_connection.fetch.assert_not_called()
+
+    async def test_relationship_adjacency_lookups(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that relationships can be looked up by either endpoint table."""
+        mock_connection.fetch.return_value = catalog_result(
+            [
+                *users_catalog(),
+                catalog_row("table", "orders"),
+                catalog_row(
+                    "relationship",
+                    "orders",
+                    column_name="user_id",
+                    ref_table="users",
+                    ref_column="id",
+                ),
+            ]
+        )
+
+        introspector = SchemaIntrospector(mock_pool)
+        from_orders = await introspector.get_relationships_from("orders")
+        to_users = await introspector.get_relationships_to("users")
+
+        assert from_orders == to_users
+        assert from_orders[0].from_column == "user_id"
+        assert await introspector.get_relationships_from("users") == ()
+        assert mock_connection.fetch.call_count == 1
 
     async def test_detect_relationships_empty_when_no_fks(
         self, mock_pool: MagicMock, mock_connection: AsyncMock
@@ -296,31 +515,12 @@ class TestPrimaryKeyDetection:
         self, mock_pool: MagicMock, mock_connection: AsyncMock
     ) -> None:
         """Test that primary key columns are marked correctly."""
-        mock_connection.fetch.side_effect = [
-            # Tables query
-            [make_record({"table_name": "users"})],
-            # Columns query
+        mock_connection.fetch.return_value = catalog_result(
             [
-                make_record(
-                    {
-                        "column_name": "id",
-                        "data_type": "integer",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-                make_record(
-                    {
-                        "column_name": "email",
-                        "data_type": "text",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-            ],
-            # Primary keys query - id is primary key
-            [make_record({"column_name": "id"})],
-        ]
+                *users_catalog(),
+                column_row("users", "email", "text"),
+            ]
+        )
 
         introspector = SchemaIntrospector(mock_pool)
         table = await introspector.get_table("users")
@@ -336,42 +536,17 @@ class TestPrimaryKeyDetection:
         self, mock_pool: MagicMock, mock_connection: AsyncMock
     ) -> None:
         """Test handling of composite primary keys."""
-        mock_connection.fetch.side_effect = [
-            # Tables query
-            [make_record({"table_name": "order_items"})],
-            # Columns query
+        mock_connection.fetch.return_value = catalog_result(
             [
-                make_record(
-                    {
-                        "column_name": "order_id",
-                        "data_type": "integer",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-                make_record(
-                    {
-                        "column_name": "product_id",
-                        "data_type": "integer",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-                make_record(
-                    {
-                        "column_name": "quantity",
-                        "data_type": "integer",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-            ],
-            # Composite primary key
-            [
-                make_record({"column_name": "order_id"}),
-                make_record({"column_name": "product_id"}),
-            ],
-        ]
+                catalog_row("table", "order_items"),
+                column_row("order_items", "order_id"),
+                column_row("order_items", "product_id"),
+                column_row("order_items", "quantity"),
+                # Composite primary key
+                catalog_row("primary_key", "order_items", column_name="order_id"),
+                catalog_row("primary_key", "order_items", column_name="product_id"),
+            ]
+        )
 
         introspector = SchemaIntrospector(mock_pool)
         table = await introspector.get_table("order_items")
@@ -401,28 +576,13 @@ class TestSchemaCaching:
         introspector = SchemaIntrospector(mock_pool, cache=cache)
 
         # First call: mock database response
-        mock_connection.fetch.side_effect = [
-            [make_record({"table_name": "users"})],
-            [
-                make_record(
-                    {
-                        "column_name": "id",
-                        "data_type": "integer",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-            ],
-            [make_record({"column_name": "id"})],
-            [],
-        ]
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
 
         schema1 = await introspector.get_schema()
         assert len(schema1.tables) == 1
 
         # Reset mock to track second call
         mock_connection.fetch.reset_mock()
-        mock_connection.fetch.side_effect = None
 
         # Second call should use cache (no DB calls)
         schema2 = await introspector.get_schema()
@@ -437,35 +597,17 @@ class TestSchemaCaching:
         cache = InMemoryCache()
         introspector = SchemaIntrospector(mock_pool, cache=cache)
 
-        # Setup database responses for both calls
-        def setup_mock() -> None:
-            mock_connection.fetch.side_effect = [
-                [make_record({"table_name": "users"})],
-                [
-                    make_record(
-                        {
-                            "column_name": "id",
-                            "data_type": "integer",
-                            "is_nullable": "NO",
-                            "column_default": None,
-                        }
-                    ),
-                ],
-                [make_record({"column_name": "id"})],
-                [],
-            ]
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
 
         # First call populates cache
-        setup_mock()
         await introspector.get_schema()
 
         # Second call with force_refresh
-        setup_mock()
         schema = await introspector.get_schema(force_refresh=True)
 
-        # Should have made database calls
+        # Should have made database calls both times
         assert schema.tables[0].name == "users"
-        assert mock_connection.fetch.call_count > 0
+        assert mock_connection.fetch.call_count == 2
 
     async def test_get_table_uses_cache(
         self, mock_pool: MagicMock, mock_connection: AsyncMock
@@ -475,27 +617,13 @@ class TestSchemaCaching:
         introspector = SchemaIntrospector(mock_pool, cache=cache)
 
         # First call: mock database response
-        mock_connection.fetch.side_effect = [
-            [make_record({"table_name": "users"})],
-            [
-                make_record(
-                    {
-                        "column_name": "id",
-                        "data_type": "integer",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-            ],
-            [make_record({"column_name": "id"})],
-        ]
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
 
         table1 = await introspector.get_table("users")
         assert table1.name == "users"
 
         # Reset mock to track second call
         mock_connection.fetch.reset_mock()
-        mock_connection.fetch.side_effect = None
 
         # Second call should use cache
         table2 = await introspector.get_table("users")
@@ -503,6 +631,48 @@ class TestSchemaCaching:
         assert table2.name == table1.name
         mock_connection.fetch.assert_not_called()
 
+    async def test_get_table_reads_cached_full_schema(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that get_table is served from a warm full-schema cache entry."""
+        cache = InMemoryCache()
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+        await SchemaIntrospector(mock_pool, cache=cache).get_schema()
+
+        # A fresh introspector has no catalog bundle, only the shared cache
+        introspector = SchemaIntrospector(mock_pool, cache=cache)
+        table = await introspector.get_table("users")
+
+        assert table.name == "users"
+        assert table.columns[0].is_primary_key
+        assert mock_connection.fetch.call_count == 1
+
+        # A miss in the full entry isn't authoritative: the catalog decides
+        with pytest.raises(TableNotFoundError):
+            await introspector.get_table("orders")
+        assert mock_connection.fetch.call_count == 2
+
+    async def test_full_schema_entries_are_scoped_by_exposure(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that a restricted introspector's full entry isn't served to others."""
+        cache = InMemoryCache()
+        orders = [catalog_row("table", "orders"), column_row("orders", "id")]
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+        restricted = SchemaIntrospector(mock_pool, exposed_tables=["users"], cache=cache)
+        assert (await restricted.get_schema()).table_names() == ["users"]
+
+        mock_connection.fetch.return_value = catalog_result([*users_catalog(), *orders])
+        unrestricted = SchemaIntrospector(mock_pool, cache=cache)
+        assert (await unrestricted.get_table("orders")).name == "orders"
+        assert (await unrestricted.get_schema()).table_names() == ["users", "orders"]
+
+        # Each exposure keeps reading its own full entry
+        fetches = mock_connection.fetch.call_count
+        fresh = SchemaIntrospector(mock_pool, exposed_tables=["users"], cache=cache)
+        assert (await fresh.get_schema()).table_names() == ["users"]
+        assert mock_connection.fetch.call_count == fetches
+
     async def test_get_table_force_refresh_bypasses_cache(
         self, mock_pool: MagicMock, mock_connection: AsyncMock
     ) -> None:
@@ -510,32 +680,85 @@ class TestSchemaCaching:
         cache = InMemoryCache()
         introspector = SchemaIntrospector(mock_pool, cache=cache)
 
-        def setup_mock() -> None:
-            mock_connection.fetch.side_effect = [
-                [make_record({"table_name": "users"})],
-                [
-                    make_record(
-                        {
-                            "column_name": "id",
-                            "data_type": "integer",
-                            "is_nullable": "NO",
-                            "column_default": None,
-                        }
-                    ),
-                ],
-                [make_record({"column_name": "id"})],
-            ]
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
 
         # First call populates cache
-        setup_mock()
         await introspector.get_table("users")
 
         # Second call with force_refresh
-        setup_mock()
         table = await introspector.get_table("users", force_refresh=True)
 
         assert table.name == "users"
-        assert mock_connection.fetch.call_count > 0
+        assert mock_connection.fetch.call_count == 2
+
+    async def test_get_schema_refreshes_ahead_of_expiry(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that a cache hit near the TTL triggers one background refresh."""
+        cache = InMemoryCache()
+        introspector = SchemaIntrospector(mock_pool, cache=cache, cache_ttl=100)
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+
+        await introspector.get_schema()
+        assert introspector._full_cached_at is not None
+        introspector._full_cached_at -= 90
+
+        schema = await introspector.get_schema()
+        await introspector.get_schema()
+        assert schema.tables[0].name == "users"
+        assert introspector._refresh_task is not None
+        await introspector._refresh_task
+
+        assert mock_connection.fetch.call_count == 2
+
+    async def test_get_schema_fresh_cache_does_not_refresh(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that a recently cached schema is served without a refresh."""
+        cache = InMemoryCache()
+        introspector = SchemaIntrospector(mock_pool, cache=cache, cache_ttl=100)
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+
+        await introspector.get_schema()
+        await introspector.get_schema()
+
+        assert introspector._refresh_task is None
+        assert mock_connection.fetch.call_count == 1
+
+    async def test_cached_schema_uses_compact_json_layout(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that cached schemas round-trip through JSON in the compact layout."""
+        cache = InMemoryCache()
+        introspector = SchemaIntrospector(mock_pool, cache=cache)
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+        schema = await introspector.get_schema()
+
+        cached = await cache.get("schema-v2:public:full:all")
+        assert cached == [[["users", "public", None, [["id", "integer", False, True, None]]]], []]
+
+        # Simulate a JSON-serializing backend such as Redis
+        await cache.set("schema-v2:public:full:all", json.loads(json.dumps(cached)))
+        assert await SchemaIntrospector(mock_pool, cache=cache).get_schema() == schema
+
+    async def test_compact_entries_leave_schema_cache_dicts_alone(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that compact entries don't share keys with SchemaCache's dict entries."""
+        cache = InMemoryCache()
+        schema_cache = SchemaCache(cache)
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+        schema = await SchemaIntrospector(mock_pool).get_schema()
+        await schema_cache.set_schema(schema.model_dump())
+        await schema_cache.set_table("users", schema.tables[0].model_dump())
+
+        introspector = SchemaIntrospector(mock_pool, cache=cache)
+        assert await introspector.get_schema() == schema
+        assert await introspector.get_table("users") == schema.tables[0]
+        await introspector.invalidate_cache()
+
+        assert await schema_cache.get_schema() == schema.model_dump()
+        assert await schema_cache.get_table("users") == schema.tables[0].model_dump()
 
     async def test_invalidate_cache_clears_schema(
         self, mock_pool: MagicMock, mock_connection: AsyncMock
@@ -545,21 +768,7 @@ class TestSchemaCaching:
         introspector = SchemaIntrospector(mock_pool, cache=cache)
 
         # Populate cache
-        mock_connection.fetch.side_effect = [
-            [make_record({"table_name": "users"})],
-            [
-                make_record(
-                    {
-                        "column_name": "id",
-                        "data_type": "integer",
-                        "is_nullable": "NO",
-                        "column_default": None,
-                    }
-                ),
-            ],
-            [make_record({"column_name": "id"})],
-            [],
-        ]
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
         await introspector.get_schema()
 
         # Invalidate cache
@@ -568,11 +777,188 @@ class TestSchemaCaching:
         assert count >= 1
 
         # Verify cache is empty for schema
-        cached = await cache.get("schema:full")
+        cached = await cache.get("schema-v2:public:full:all")
         assert cached is None
 
+    async def test_invalidate_table_evicts_only_that_table(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that invalidate_table leaves other tables cached."""
+        cache = InMemoryCache()
+        introspector = SchemaIntrospector(mock_pool, cache=cache)
+        mock_connection.fetch.return_value = catalog_result(
+            [*users_catalog(), catalog_row("table", "orders"), column_row("orders", "id")]
+        )
+        await introspector.get_table("users")
+        await introspector.get_table("orders")
+        await introspector.get_schema()
+
+        count = await introspector.invalidate_table("orders")
+
+        assert count == 2  # table:orders and full
+        assert await cache.exists("schema-v2:public:table:users")
+        assert not await cache.exists("schema-v2:public:table:orders")
+        assert not await cache.exists("schema-v2:public:full:all")
+
     async def test_invalidate_cache_without_cache_returns_zero(self, mock_pool: MagicMock) -> None:
         """Test that invalidate_cache returns 0 when no cache is configured."""
         introspector = SchemaIntrospector(mock_pool)
         count = await introspector.invalidate_cache()
         assert count == 0
+
+
+class TestPoolSharedCache:
+    """Tests for sharing one schema cache across introspectors on a pool."""
+
+    async def test_introspectors_share_bound_pool_cache(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that introspectors on a bound pool reuse each other's results."""
+        cache = SchemaIntrospector.bind_to_pool(mock_pool)
+        try:
+            assert SchemaIntrospector.bind_to_pool(mock_pool) is cache
+            mock_connection.fetch.return_value = catalog_result(users_catalog())
+
+            await SchemaIntrospector(mock_pool).get_schema()
+            schema = await SchemaIntrospector(mock_pool).get_schema()
+
+            assert schema.table_names() == ["users"]
+            assert mock_connection.fetch.call_count == 1
+        finally:
+            SchemaIntrospector.unbind_pool(mock_pool)
+
+        assert SchemaIntrospector(mock_pool)._cache is None
+
+    async def test_bound_pool_keeps_exposures_apart(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that introspectors with different exposures on one pool get their own schema."""
+        orders = [catalog_row("table", "orders"), column_row("orders", "id")]
+        SchemaIntrospector.bind_to_pool(mock_pool)
+        try:
+            mock_connection.fetch.return_value = catalog_result([*users_catalog(), *orders])
+            everything = await SchemaIntrospector(mock_pool).get_schema()
+
+            mock_connection.fetch.return_value = catalog_result(users_catalog())
+            restricted = await SchemaIntrospector(mock_pool, exposed_tables=["users"]).get_schema()
+
+            assert everything.table_names() == ["users", "orders"]
+            assert restricted.table_names() == ["users"]
+            assert (await SchemaIntrospector(mock_pool).get_schema()).table_names() == [
+                "users",
+                "orders",
+            ]
+            assert mock_connection.fetch.call_count == 2
+        finally:
+            SchemaIntrospector.unbind_pool(mock_pool)
+
+    def test_explicit_cache_overrides_pool_cache(self, mock_pool: MagicMock) -> None:
+        """Test that an explicitly passed cache wins over the pool's cache."""
+        SchemaIntrospector.bind_to_pool(mock_pool)
+        try:
+            cache = InMemoryCache()
+            assert SchemaIntrospector(mock_pool, cache=cache)._cache is cache
+        finally:
+            SchemaIntrospector.unbind_pool(mock_pool)
+
+
+class TestDedicatedConnection:
+    """Tests for running catalog queries on one held connection."""
+
+    async def test_dedicated_connection_is_reused_until_close(self, mock_pool: MagicMock) -> None:
+        """Test that queries share one acquired connection released by close()."""
+        meta_conn = AsyncMock()
+        meta_conn.fetch.side_effect = [catalog_result(users_catalog()), []]
+        mock_pool.acquire = AsyncMock(return_value=meta_conn)
+        mock_pool.release = AsyncMock()
+
+        introspector = SchemaIntrospector(mock_pool, dedicated_connection=True)
+        await introspector.get_schema()
+        await introspector.detect_relationships()
+
+        assert mock_pool.acquire.await_count == 1
+        assert meta_conn.fetch.await_count == 2
+
+        await introspector.close()
+        mock_pool.release.assert_awaited_once_with(meta_conn)
+
+    async def test_dedicated_connection_reconnects_after_it_dies(
+        self, mock_pool: MagicMock
+    ) -> None:
+        """Test that a closed held connection is replaced and the query retried."""
+        dead_conn = AsyncMock()
+        dead_conn.fetch.side_effect = ConnectionError("connection was closed")
+        dead_conn.is_closed = MagicMock(return_value=True)
+        live_conn = AsyncMock()
+        live_conn.fetch.return_value = catalog_result(users_catalog())
+        mock_pool.acquire = AsyncMock(side_effect=[dead_conn, live_conn])
+        mock_pool.release = AsyncMock()
+
+        introspector = SchemaIntrospector(mock_pool, dedicated_connection=True)
+        schema = await introspector.get_schema()
+
+        assert schema.table_names() == ["users"]
+        mock_pool.release.assert_awaited_once_with(dead_conn)
+
+
+class TestSchemaChangeNotifications:
+    """Tests for LISTEN-driven schema cache invalidation."""
+
+    async def test_notification_forces_reintrospection(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that a schema-change notification bypasses cached entries."""
+        cache = InMemoryCache()
+        introspector = SchemaIntrospector(mock_pool, cache=cache)
+        mock_connection.fetch.return_value = catalog_result(users_catalog())
+
+        await introspector.get_schema()
+        await introspector.get_table("users")
+        assert mock_connection.fetch.call_count == 1
+
+        introspector._on_schema_change(mock_connection, 1, "prismiq_schema_changed", "public")
+
+        await introspector.get_schema()
+        await introspector.get_table("users")
+        assert mock_connection.fetch.call_count == 2
+
+    async def test_notification_evicts_only_changed_tables(
+        self, mock_pool: MagicMock, mock_connection: AsyncMock
+    ) -> None:
+        """Test that a schema change keeps unchanged tables cached."""
+        cache = InMemoryCache()
+        introspector = SchemaIntrospector(mock_pool, cache=cache)
+        orders = [catalog_row("table", "orders"), column_row("orders", "id")]
+        mock_connection.fetch.return_value = catalog_result([*users_catalog(), *orders])
+        await introspector.get_table("users")
+        await introspector.get_table("orders")
+
+        # orders gains a column
+        mock_connection.fetch.return_value = catalog_result(
+            [*users_catalog(), *orders, column_row("orders", "total", "numeric")]
+        )
+        introspector._on_schema_change(mock_connection, 1, "prismiq_schema_changed", "public")
+        orders_table = await introspector.get_table("orders")
+
+        assert len(orders_table.columns) == 2
+        assert await cache.exists("schema-v2:public:table:users")
+        assert mock_connection.fetch.call_count == 2
+
+    async def test_listen_and_stop_listening(self, mock_pool: MagicMock) -> None:
+        """Test that listening holds one connection until stop_listening."""
+        listen_conn = AsyncMock()
+        mock_pool.acquire = AsyncMock(return_value=listen_conn)
+        mock_pool.release = AsyncMock()
+        introspector = SchemaIntrospector(mock_pool)
+
+        await introspector.listen_for_schema_changes("ddl_events")
+        await introspector.listen_for_schema_changes("ddl_events")
+        listen_conn.add_listener.assert_awaited_once_with(
+            "ddl_events", introspector._on_schema_change
+        )
+
+        await introspector.stop_listening()
+        listen_conn.remove_listener.assert_awaited_once_with(
+            "ddl_events", introspector._on_schema_change
+        )
+        mock_pool.release.assert_awaited_once_with(listen_conn)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 
 import pytest
+from pydantic import ValidationError
 
 from prismiq.schema_config import (
     ColumnConfig,
@@ -107,6 +108,14 @@ class TestSchemaConfig:
         column_config = config.get_column_config("users", "id")
         assert column_config.display_name is None
 
+    def test_missing_configs_share_frozen_defaults(self) -> None:
+        """Misses return one shared default instance that cannot be mutated."""
+        config = SchemaConfig(tables={"users": TableConfig()})
+        assert config.get_table_config("orders") is config.get_table_config("items")
+        assert config.get_column_config("users", "id") is config.get_column_config("orders", "id")
+        with pytest.raises(ValidationError):
+            config.get_table_config("orders").hidden = True  # type: ignore[misc]
+
     def test_get_display_name_table(self) -> None:
         """Get display name for table."""
         config = SchemaConfig(tables={"users": TableConfig(display_name="All Users")})
@@ -144,41 +153,55 @@ class TestSchemaConfig:
         assert config.is_column_hidden("users", "email") is False
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_schema() -> DatabaseSchema:
-    """Create a sample database schema for testing."""
-    return DatabaseSchema(
+    """Create a sample database schema for testing.
+
+    Module-scoped because the tests only read it, and built with
+    model_construct since the literals below are known to be valid.
+    """
+    return DatabaseSchema.model_construct(
         tables=[
-            TableSchema(
+            TableSchema.model_construct(
                 name="users",
                 columns=[
-                    ColumnSchema(
+                    ColumnSchema.model_construct(
                         name="id", data_type="integer", is_nullable=False, is_primary_key=True
                     ),
-                    ColumnSchema(name="email", data_type="varchar", is_nullable=False),
-                    ColumnSchema(name="password_hash", data_type="varchar", is_nullable=False),
+                    ColumnSchema.model_construct(
+                        name="email", data_type="varchar", is_nullable=False
+                    ),
+                    ColumnSchema.model_construct(
+                        name="password_hash", data_type="varchar", is_nullable=False
+                    ),
                 ],
             ),
-            TableSchema(
+            TableSchema.model_construct(
                 name="orders",
                 columns=[
-                    ColumnSchema(
+                    ColumnSchema.model_construct(
                         name="id", data_type="integer", is_nullable=False, is_primary_key=True
                     ),
-                    ColumnSchema(name="user_id", data_type="integer", is_nullable=False),
-                    ColumnSchema(name="total", data_type="numeric", is_nullable=False),
+                    ColumnSchema.model_construct(
+                        name="user_id", data_type="integer", is_nullable=False
+                    ),
+                    ColumnSchema.model_construct(
+                        name="total", data_type="numeric", is_nullable=False
+                    ),
                 ],
             ),
-            TableSchema(
+            TableSchema.model_construct(
                 name="internal_logs",
                 columns=[
-                    ColumnSchema(name="id", data_type="integer", is_nullable=False),
-                    ColumnSchema(name="message", data_type="text", is_nullable=True),
+                    ColumnSchema.model_construct(name="id", data_type="integer", is_nullable=False),
+                    ColumnSchema.model_construct(
+                        name="message", data_type="text", is_nullable=True
+                    ),
                 ],
             ),
         ],
         relationships=[
-            Relationship(
+            Relationship.model_construct(
                 from_table="orders", from_column="user_id", to_table="users", to_column="id"
             ),
         ],
@@ -219,6 +242,18 @@ class TestSchemaConfigManager:
         # Manager config should be updated
         assert manager.get_config().tables["users"].display_name == "Users"
 
+    def test_get_display_name_cached_until_update(self) -> None:
+        """Manager display names are memoized and refreshed on updates."""
+        manager = SchemaConfigManager()
+        assert manager.get_display_name("users") == "users"
+        assert manager.get_display_name("users", "email") == "email"
+
+        manager.update_table_config("users", TableConfig(display_name="Customers"))
+        manager.update_column_config("users", "email", ColumnConfig(display_name="Email"))
+
+        assert manager.get_display_name("users") == "Customers"
+        assert manager.get_display_name("users", "email") == "Email"
+
     def test_update_column_config(self) -> None:
         """Update column configuration."""
         manager = SchemaConfigManager()
@@ -305,6 +340,16 @@ class TestSchemaConfigManager:
         assert id_col.is_nullable is False
         assert id_col.is_primary_key is True
 
+    def test_apply_to_schema_builds_valid_models(self, sample_schema: DatabaseSchema) -> None:
+        """Enhanced tables survive a validation round trip unchanged."""
+        manager = SchemaConfigManager(
+            SchemaConfig(tables={"users": TableConfig(display_name="Customers")})
+        )
+        enhanced = manager.apply_to_schema(sample_schema)
+
+        for table in enhanced.tables:
+            assert EnhancedTableSchema.model_validate(table.model_dump()) == table
+
     def test_apply_to_schema_format_config(self, sample_schema: DatabaseSchema) -> None:
         """Format configuration is included in enhanced columns."""
         manager = SchemaConfigManager()
@@ -328,8 +373,8 @@ class TestSchemaConfigManagerSerialization:
         data = json.loads(json_str)
         assert data == {"tables": {}}
 
-    def test_to_json_with_data(self) -> None:
-        """Serialize config with data to JSON."""
+    def test_dump_with_data(self) -> None:
+        """Dumped config with data keeps the nested table and column structure."""
         manager = SchemaConfigManager()
         manager.update_table_config(
             "users",
@@ -340,8 +385,7 @@ class TestSchemaConfigManagerSerialization:
             ),
         )
 
-        json_str = manager.to_json()
-        data = json.loads(json_str)
+        data = manager.get_config().model_dump()
 
         assert "users" in data["tables"]
         assert data["tables"]["users"]["display_name"] == "Users"
@@ -374,6 +418,12 @@ class TestSchemaConfigManagerSerialization:
         assert config.tables["users"].display_name == "Users"
         assert config.tables["users"].columns["id"].display_name == "User ID"
 
+    def test_from_json_rejects_unknown_fields(self) -> None:
+        """Unknown keys in the config JSON are rejected."""
+        json_str = '{"tables": {"users": {"display_name": "Users", "colour": "red"}}}'
+        with pytest.raises(ValidationError):
+            SchemaConfigManager.from_json(json_str)
+
     def test_roundtrip(self) -> None:
         """Serialize and deserialize preserves data."""
         original = SchemaConfigManager()
@@ -429,6 +479,21 @@ class TestEnhancedSchemaModels:
         assert table.has_column("email") is True
         assert table.has_column("missing") is False
 
+    def test_copy_with_new_columns_rebuilds_index(self) -> None:
+        """get_column on a copy with updated columns sees the new columns."""
+        table = EnhancedTableSchema(
+            name="users",
+            columns=[EnhancedColumnSchema(name="id", data_type="integer", is_nullable=False)],
+        )
+        assert table.has_column("id") is True
+
+        email = EnhancedColumnSchema(name="email", data_type="varchar", is_nullable=False)
+        for deep in (False, True):
+            copied = table.model_copy(update={"columns": [email]}, deep=deep)
+            assert copied.get_column("email") == email
+            assert copied.get_column("id") is None
+        assert table.has_column("id") is True
+
     def test_enhanced_database_schema_get_table(self) -> None:
         """EnhancedDatabaseSchema.get_table works correctly."""
         schema = EnhancedDatabaseSchema(
@@ -443,3 +508,49 @@ class TestEnhancedSchemaModels:
         assert schema.has_table("orders") is True
         assert schema.has_table("missing") is False
         assert schema.table_names() == ["users", "orders"]
+
+    def test_copy_with_new_tables_rebuilds_index(self) -> None:
+        """get_table and table_names on a copy with updated tables see the new tables."""
+        schema = EnhancedDatabaseSchema(
+            tables=[EnhancedTableSchema(name="users", columns=[])],
+            relationships=[],
+        )
+        assert schema.has_table("users") is True
+        assert schema.table_names() == ["users"]
+
+        orders = EnhancedTableSchema(name="orders", columns=[])
+        for deep in (False, True):
+            copied = schema.model_copy(update={"tables": [orders]}, deep=deep)
+            assert copied.get_table("orders") == orders
+            assert copied.get_table("users") is None
+            assert copied.table_names() == ["orders"]
+        assert schema.has_table("users") is True
+
+    def test_table_names_returns_fresh_list(self) -> None:
+        """Mutating the returned list doesn't affect later calls."""
+        schema = EnhancedDatabaseSchema(
+            tables=[EnhancedTableSchema(name="users", columns=[])],
+            relationships=[],
+        )
+        schema.table_names().append("bogus")
+        assert schema.table_names() == ["users"]
+
+    def test_name_index_not_serialized(self) -> None:
+        """Name lookups don't leak their index into serialized output."""
+        schema = EnhancedDatabaseSchema(
+            tables=[EnhancedTableSchema(name="users", columns=[])],
+            relationships=[],
+        )
+        assert schema.get_table("users") is schema.tables[0]
+        assert schema.model_dump() == {
+            "tables": [
+                {
+                    "name": "users",
+                    "schema_name": "public",
+                    "columns": [],
+                    "display_name": None,
+                    "description": None,
+                }
+            ],
+            "relationships": [],
+        }
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 
 import pytest
 from pydantic import ValidationError
@@ -24,46 +25,32 @@ from prismiq.timeseries import (
 class TestGetDateTruncSql:
     """Tests for get_date_trunc_sql function."""
 
-    def test_day_interval(self) -> None:
-        """Test date_trunc SQL for day interval."""
-        result = get_date_trunc_sql(TimeInterval.DAY, "order_date")
-        assert result == "date_trunc('day', \"order_date\")"
-
-    def test_month_interval(self) -> None:
-        """Test date_trunc SQL for month interval."""
-        result = get_date_trunc_sql(TimeInterval.MONTH, "created_at")
-        assert result == "date_trunc('month', \"created_at\")"
-
-    def test_year_interval(self) -> None:
-        """Test date_trunc SQL for year interval."""
-        result = get_date_trunc_sql(TimeInterval.YEAR, "timestamp")
-        assert result == "date_trunc('year', \"timestamp\")"
-
-    def test_hour_interval(self) -> None:
-        """Test date_trunc SQL for hour interval."""
-        result = get_date_trunc_sql(TimeInterval.HOUR, "event_time")
-        assert result == "date_trunc('hour', \"event_time\")"
-
-    def test_minute_interval(self) -> None:
-        """Test date_trunc SQL for minute interval."""
-        result = get_date_trunc_sql(TimeInterval.MINUTE, "timestamp")
-        assert result == "date_trunc('minute', \"timestamp\")"
-
-    def test_week_interval(self) -> None:
-        """Test date_trunc SQL for week interval."""
-        result = get_date_trunc_sql(TimeInterval.WEEK, "date")
-        assert result == "date_trunc('week', \"date\")"
-
-    def test_quarter_interval(self) -> None:
-        """Test date_trunc SQL for quarter interval."""
-        result = get_date_trunc_sql(TimeInterval.QUARTER, "fiscal_date")
-        assert result == "date_trunc('quarter', \"fiscal_date\")"
+    @pytest.mark.parametrize(
+        "interval,column,expected",
+        [
+            (TimeInterval.DAY, "order_date", "date_trunc('day', \"order_date\")"),
+            (TimeInterval.MONTH, "created_at", "date_trunc('month', \"created_at\")"),
+            (TimeInterval.YEAR, "timestamp", "date_trunc('year', \"timestamp\")"),
+            (TimeInterval.HOUR, "event_time", "date_trunc('hour', \"event_time\")"),
+            (TimeInterval.MINUTE, "timestamp", "date_trunc('minute', \"timestamp\")"),
+            (TimeInterval.WEEK, "date", "date_trunc('week', \"date\")"),
+            (TimeInterval.QUARTER, "fiscal_date", "date_trunc('quarter', \"fiscal_date\")"),
+        ],
+    )
+    def test_interval(self, interval: TimeInterval, column: str, expected: str) -> None:
+        """Test date_trunc SQL for each interval."""
+        assert get_date_trunc_sql(interval, column) == expected
 
     def test_column_with_quotes_escaped(self) -> None:
         """Test that column names with quotes are properly escaped."""
         result = get_date_trunc_sql(TimeInterval.DAY, 'weird"column')
         assert result == 'date_trunc(\'day\', "weird""column")'
 
+    def test_column_with_percent_sign(self) -> None:
+        """Test that percent signs in column names pass through unchanged."""
+        result = get_date_trunc_sql(TimeInterval.MONTH, "pct%s_date")
+        assert result == "date_trunc('month', \"pct%s_date\")"
+
 
 # ============================================================================
 # get_interval_format Tests
@@ -73,33 +60,21 @@ class TestGetDateTruncSql:
 class TestGetIntervalFormat:
     """Tests for get_interval_format function."""
 
-    def test_minute_format(self) -> None:
-        """Test format string for minute interval."""
-        assert get_interval_format(TimeInterval.MINUTE) == "%Y-%m-%d %H:%M"
-
-    def test_hour_format(self) -> None:
-        """Test format string for hour interval."""
-        assert get_interval_format(TimeInterval.HOUR) == "%Y-%m-%d %H:00"
-
-    def test_day_format(self) -> None:
-        """Test format string for day interval."""
-        assert get_interval_format(TimeInterval.DAY) == "%Y-%m-%d"
-
-    def test_week_format(self) -> None:
-        """Test format string for week interval."""
-        assert get_interval_format(TimeInterval.WEEK) == "%Y-W%W"
-
-    def test_month_format(self) -> None:
-        """Test format string for month interval."""
-        assert get_interval_format(TimeInterval.MONTH) == "%Y-%m"
-
-    def test_quarter_format(self) -> None:
-        """Test format string for quarter interval (special marker)."""
-        assert get_interval_format(TimeInterval.QUARTER) == "%Y-Q%q"
-
-    def test_year_format(self) -> None:
-        """Test format string for year interval."""
-        assert get_interval_format(TimeInterval.YEAR) == "%Y"
+    @pytest.mark.parametrize(
+        "interval,expected",
+        [
+            (TimeInterval.MINUTE, "%Y-%m-%d %H:%M"),
+            (TimeInterval.HOUR, "%Y-%m-%d %H:00"),
+            (TimeInterval.DAY, "%Y-%m-%d"),
+            (TimeInterval.WEEK, "%Y-W%W"),
+            (TimeInterval.MONTH, "%Y-%m"),
+            (TimeInterval.QUARTER, "%Y-Q%q"),  # Special marker
+            (TimeInterval.YEAR, "%Y"),
+        ],
+    )
+    def test_format(self, interval: TimeInterval, expected: str) -> None:
+        """Test format string for each interval."""
+        assert get_interval_format(interval) == expected
 
 
 # ============================================================================
@@ -225,6 +200,42 @@ class TestGenerateTimeBuckets:
         # Should be converted to naive
         assert buckets[0].start.tzinfo is None
 
+    def test_generated_buckets_match_validated_models(self) -> None:
+        """Test that generated buckets equal explicitly validated ones."""
+        buckets = generate_time_buckets(
+            datetime(2024, 1, 1), datetime(2024, 1, 1), TimeInterval.DAY
+        )
+
+        assert buckets == [
+            TimeBucket(
+                start=datetime(2024, 1, 1),
+                end=datetime(2024, 1, 1, 23, 59, 59, 999999),
+                label="Jan 01",
+            )
+        ]
+        assert buckets[0].model_fields_set == {"start", "end", "label"}
+
+    def test_end_before_start_returns_no_buckets(self) -> None:
+        """Test that an inverted range yields no buckets."""
+        start = datetime(2024, 3, 1)
+        end = datetime(2023, 6, 1)
+
+        assert generate_time_buckets(start, end, TimeInterval.DAY) == []
+        assert generate_time_buckets(start, end, TimeInterval.QUARTER) == []
+
+    def test_long_monthly_range_steps_by_calendar_month(self) -> None:
+        """Test that month arithmetic stays on the first of each month."""
+        start = datetime(2015, 11, 20)
+        end = datetime(2024, 2, 1)
+
+        buckets = generate_time_buckets(start, end, TimeInterval.MONTH)
+
+        assert len(buckets) == 100
+        assert buckets[0].start == datetime(2015, 11, 1)
+        assert buckets[2].start == datetime(2016, 1, 1)
+        assert buckets[-1].start == datetime(2024, 2, 1)
+        assert all(b.start.day == 1 for b in buckets)
+
     def test_cross_month_boundary(self) -> None:
         """Test buckets crossing month boundary."""
         start = datetime(2024, 1, 30)
@@ -334,6 +345,30 @@ class TestFillMissingBuckets:
         assert filled[1]["region"] is None  # Non-numeric gets None
         assert filled[1]["count"] == 0
 
+    def test_filled_rows_are_independent(self) -> None:
+        """Test that each filled row is its own dict in column order."""
+        data = [{"region": "East", "date": datetime(2024, 1, 1), "sales": 100}]
+        buckets = generate_time_buckets(
+            datetime(2024, 1, 1), datetime(2024, 1, 3), TimeInterval.DAY
+        )
+        filled = fill_missing_buckets(data, "date", buckets)
+
+        assert list(filled[1]) == ["region", "date", "sales"]
+        assert filled[1]["date"] == datetime(2024, 1, 2)
+        assert filled[2]["date"] == datetime(2024, 1, 3)
+        filled[1]["sales"] = 5
+        assert filled[2]["sales"] == 0
+
+    def test_fill_decimal_and_bool_columns(self) -> None:
+        """Test Decimal columns count as numeric and bools do not."""
+        data = [{"date": datetime(2024, 1, 1), "revenue": Decimal("9.50"), "active": True}]
+        buckets = generate_time_buckets(
+            datetime(2024, 1, 1), datetime(2024, 1, 2), TimeInterval.DAY
+        )
+        filled = fill_missing_buckets(data, "date", buckets)
+
+        assert filled[1] == {"date": datetime(2024, 1, 2), "revenue": 0, "active": None}
+
     def test_empty_buckets_list(self) -> None:
         """Test handling of empty buckets list."""
         data = [
@@ -162,6 +162,23 @@ class TestPivotData:
         east_row = pivoted.rows[0]
         assert east_row[1] == 3.0
 
+    def test_pivot_avg_skips_nulls_and_zeroes_text(self) -> None:
+        """Test avg ignores nulls and counts non-numeric values as 0."""
+        result = make_result(
+            columns=["region", "month", "sales"],
+            rows=[
+                ["East", "Jan", 10],
+                ["East", "Jan", None],
+                ["East", "Jan", "n/a"],
+                ["West", "Feb", None],
+            ],
+        )
+
+        pivoted = pivot_data(result, "region", "month", "sales", aggregation="avg")
+
+        assert pivoted.columns == ["region", "Jan", "Feb"]
+        assert pivoted.rows == [["East", 5.0, None]]
+
     def test_pivot_empty_result(self) -> None:
         """Test pivot with empty result."""
         result = make_result(columns=["region", "month", "sales"], rows=[])
@@ -217,6 +234,17 @@ class TestTransposeData:
         assert transposed.columns == ["Column"]
         assert transposed.rows == [["a"], ["b"], ["c"]]
 
+    def test_transpose_ragged_rows(self) -> None:
+        """Test transpose pads short rows and ignores extra cells."""
+        result = make_result(
+            columns=["a", "b", "c"],
+            rows=[[1], [2, 3, 4, 5]],
+        )
+
+        transposed = transpose_data(result)
+
+        assert transposed.rows == [["a", 1, 2], ["b", None, 3], ["c", None, 4]]
+
     def test_transpose_single_row(self) -> None:
         """Test transpose with single row."""
         result = make_result(
@@ -312,6 +340,21 @@ class TestFillNulls:
         assert filled.rows[3] == [20]  # Backward filled
         assert filled.rows[4] == [20]
 
+    def test_static_fill_leaves_input_untouched(self) -> None:
+        """Test static fill copies only the rows it changes."""
+        result = make_result(
+            columns=["a", "b"],
+            rows=[[1, 2], [None, 4], [5, None]],
+        )
+
+        filled = fill_nulls(result, value=0)
+        filled_b = fill_nulls(result, column="b", value=0)
+
+        assert filled.rows == [[1, 2], [0, 4], [5, 0]]
+        assert filled_b.rows == [[1, 2], [None, 4], [5, 0]]
+        assert result.rows == [[1, 2], [None, 4], [5, None]]
+        assert filled.rows[0] is result.rows[0]
+
     def test_fill_nulls_empty_result(self) -> None:
         """Test fill_nulls with empty result."""
         result = make_result(columns=["a"], rows=[])
@@ -395,6 +438,21 @@ class TestCalculateRunningTotal:
         assert with_totals.rows[1][-1] == 100  # Null skipped
         assert with_totals.rows[2][-1] == 300
 
+    def test_running_total_with_order_column(self) -> None:
+        """Test running total follows the order column but keeps row order."""
+        result = make_result(
+            columns=["day", "sales"],
+            rows=[
+                [3, 200],
+                [1, 100],
+                [2, "n/a"],
+            ],
+        )
+
+        with_totals = calculate_running_total(result, "sales", order_column="day")
+
+        assert [r[-1] for r in with_totals.rows] == [300, 100, 100]
+
     def test_running_total_empty_result(self) -> None:
         """Test running total with empty result."""
         result = make_result(columns=["sales"], rows=[])
@@ -497,6 +555,22 @@ class TestCalculatePercentOfTotal:
         assert with_pct.rows[0][-1] is None
         assert with_pct.rows[1][-1] is None
 
+    def test_percent_of_total_zero_total_in_one_group(self) -> None:
+        """Test a group with a zero total gets None while others compute."""
+        result = make_result(
+            columns=["region", "value"],
+            rows=[
+                ["East", 0],
+                ["West", 30],
+                ["East", 0],
+                ["West", 10],
+            ],
+        )
+
+        with_pct = calculate_percent_of_total(result, "value", group_column="region")
+
+        assert [r[-1] for r in with_pct.rows] == [None, 75.0, None, 25.0]
+
     def test_percent_of_total_empty_result(self) -> None:
         """Test percentage with empty result."""
         result = make_result(columns=["value"], rows=[])
@@ -571,6 +645,17 @@ class TestSortResult:
         assert sorted_result.rows[3][0] is None
         assert sorted_result.rows[4][0] is None
 
+    def test_sort_descending_with_nulls_and_text(self) -> None:
+        """Test descending sort puts nulls first and handles empty strings."""
+        result = make_result(
+            columns=["name"],
+            rows=[["b"], [None], [""], ["a"]],
+        )
+
+        sorted_result = sort_result(result, "name", descending=True)
+
+        assert [r[0] for r in sorted_result.rows] == [None, "b", "a", ""]
+
     def test_sort_empty_result(self) -> None:
         """Test sort with empty result."""
         result = make_result(columns=["a"], rows=[])
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 from datetime import date, datetime
 
 import pytest
@@ -37,6 +38,26 @@ def make_result(
     )
 
 
+@pytest.fixture(scope="module")
+def empty_sales() -> QueryResult:
+    """Empty date/sales result, module-scoped because the functions only read it."""
+    return make_result(columns=["date", "sales"], rows=[])
+
+
+@pytest.fixture(scope="module")
+def daily_sales() -> QueryResult:
+    """Two years of daily sales for two regions, shared read-only across tests."""
+    return make_result(
+        columns=["region", "date", "sales"],
+        rows=[
+            [region, date(year, 1, day), 100 * year_idx + 10 * day + (5 if region == "West" else 0)]
+            for year_idx, year in enumerate((2023, 2024), start=1)
+            for day in range(1, 11)
+            for region in ("East", "West")
+        ],
+    )
+
+
 # ============================================================================
 # calculate_trend Tests
 # ============================================================================
@@ -202,14 +223,57 @@ class TestCalculatePeriodComparison:
         assert trend.current_value == 200
         assert trend.previous_value == 150
 
-    def test_empty_result(self) -> None:
-        """Test with empty result."""
-        result = make_result(columns=["date", "sales"], rows=[])
+    def test_previous_month_clamps_to_month_end(self) -> None:
+        """Test that Mar 31 compares against the last day of February."""
+        result = make_result(
+            columns=["date", "sales"],
+            rows=[
+                [date(2023, 3, 31), 120],
+                [date(2023, 2, 28), 100],
+                [date(2023, 3, 3), 999],
+            ],
+        )
 
         trend = calculate_period_comparison(
             result,
             "date",
             "sales",
+            ComparisonPeriod.PREVIOUS_MONTH,
+            date(2023, 3, 31),
+            date(2023, 3, 31),
+        )
+
+        assert trend.current_value == 120
+        assert trend.previous_value == 100
+
+    def test_previous_year_from_leap_day(self) -> None:
+        """Test that only a Feb 29 bound is moved to Feb 28."""
+        result = make_result(
+            columns=["date", "sales"],
+            rows=[
+                [date(2024, 3, 1), 200],
+                [date(2023, 2, 28), 50],
+                [date(2023, 3, 30), 100],
+            ],
+        )
+
+        trend = calculate_period_comparison(
+            result,
+            "date",
+            "sales",
+            ComparisonPeriod.PREVIOUS_YEAR,
+            date(2024, 2, 29),
+            date(2024, 3, 31),
+        )
+
+        assert trend.previous_value == 150
+
+    def test_empty_result(self, empty_sales: QueryResult) -> None:
+        """Test with empty result."""
+        trend = calculate_period_comparison(
+            empty_sales,
+            "date",
+            "sales",
             ComparisonPeriod.PREVIOUS_PERIOD,
             date(2024, 1, 1),
             date(2024, 1, 2),
@@ -239,6 +303,32 @@ class TestCalculatePeriodComparison:
 
         assert trend.current_value == 100
 
+    def test_period_bounds_are_inclusive_whole_days(self) -> None:
+        """Test that rows on the boundary days count, whatever their time of day."""
+        result = make_result(
+            columns=["timestamp", "value"],
+            rows=[
+                [datetime(2024, 1, 2, 23, 59), 100],
+                [datetime(2024, 1, 1, 0, 0), 50],
+                [datetime(2023, 12, 31, 23, 59), 40],
+                [datetime(2023, 12, 29, 12, 0), 20],
+                [datetime(2023, 12, 28, 12, 0), 1000],
+                ["2024-01-01", 1000],
+            ],
+        )
+
+        trend = calculate_period_comparison(
+            result,
+            "timestamp",
+            "value",
+            ComparisonPeriod.PREVIOUS_PERIOD,
+            date(2024, 1, 1),
+            date(2024, 1, 2),
+        )
+
+        assert trend.current_value == 150
+        assert trend.previous_value == 40
+
 
 # ============================================================================
 # add_trend_column Tests
@@ -302,12 +392,27 @@ class TestAddTrendColumn:
         west_rows = [r for r in with_trend.rows if r[0] == "West"]
         assert west_rows[1][-2] == -20
 
-    def test_empty_result(self) -> None:
-        """Test with empty result."""
-        result = make_result(columns=["date", "sales"], rows=[])
+    def test_trend_skips_null_values(self) -> None:
+        """Test that null values keep the previous value for the next row."""
+        result = make_result(
+            columns=["date", "sales"],
+            rows=[
+                ["2024-01-03", 120],
+                ["2024-01-01", 100],
+                ["2024-01-02", None],
+            ],
+        )
 
         with_trend = add_trend_column(result, "sales", "date")
 
+        assert with_trend.rows[0][-3:] == [100.0, 20.0, 20.0]
+        assert with_trend.rows[1][-3:] == [None, None, None]
+        assert with_trend.rows[2][-3:] == [100.0, None, None]
+
+    def test_empty_result(self, empty_sales: QueryResult) -> None:
+        """Test with empty result."""
+        with_trend = add_trend_column(empty_sales, "sales", "date")
+
         assert len(with_trend.columns) == 5  # date, sales, prev, change, pct
         assert with_trend.rows == []
 
@@ -318,6 +423,17 @@ class TestAddTrendColumn:
         with pytest.raises(ValueError, match="Column not found"):
             add_trend_column(result, "invalid", "date")
 
+    def test_builds_valid_result(self) -> None:
+        """Test that the unvalidated result matches a validated one."""
+        result = make_result(
+            columns=["date", "sales"],
+            rows=[["2024-01-01", 100], ["2024-01-02", 150]],
+        )
+
+        with_trend = add_trend_column(result, "sales", "date")
+
+        assert QueryResult.model_validate(with_trend.model_dump()) == with_trend
+
 
 # ============================================================================
 # calculate_moving_average Tests
@@ -378,6 +494,45 @@ class TestCalculateMovingAverage:
         assert "value_ma2" in with_ma.columns
         assert len(with_ma.rows) == 3
 
+    def test_moving_average_ordered_values(self) -> None:
+        """Test averages follow the order column and skip null values."""
+        result = make_result(
+            columns=["date", "value"],
+            rows=[
+                ["2024-01-04", 40],
+                ["2024-01-02", None],
+                ["2024-01-01", 10],
+                ["2024-01-03", 30],
+                ["2024-01-05", 50],
+            ],
+        )
+
+        with_ma = calculate_moving_average(result, "value", window=2, order_column="date")
+
+        assert [row[-1] for row in with_ma.rows] == [35.0, 10.0, 10.0, 20.0, 45.0]
+
+    def test_moving_average_exact_after_large_values(self) -> None:
+        """Test that large values leave no residue in later windows."""
+        result = make_result(
+            columns=["value"],
+            rows=[[19.99], [5.01], [1234567.89], [0.07], [0], [0], [0]],
+        )
+        with_ma = calculate_moving_average(result, "value", window=3)
+        assert with_ma.rows[-1][-1] == 0.0
+        assert with_ma.rows[-2][-1] == 0.07 / 3
+
+        result = make_result(columns=["value"], rows=[[1e16], [1], [1], [1]])
+        with_ma = calculate_moving_average(result, "value", window=2)
+        assert with_ma.rows[-1][-1] == 1.0
+
+    @pytest.mark.parametrize("rows", [[[10]], []], ids=["rows", "empty"])
+    def test_moving_average_invalid_window(self, rows: list[list[int]]) -> None:
+        """Test that a window smaller than one is rejected, with or without rows."""
+        result = make_result(columns=["value"], rows=rows)
+
+        with pytest.raises(ValueError, match="Window must be at least 1"):
+            calculate_moving_average(result, "value", window=0)
+
     def test_moving_average_window_7(self) -> None:
         """Test 7-day moving average (default)."""
         result = make_result(
@@ -460,6 +615,40 @@ class TestCalculateYearOverYear:
         assert with_yoy.rows[0][-2] is None
         assert with_yoy.rows[0][-1] is None
 
+    def test_yoy_matches_only_previous_year(self) -> None:
+        """Test that the same day two years back is not used as the comparison."""
+        result = make_result(
+            columns=["date", "sales"],
+            rows=[
+                [date(2022, 5, 10), 80],
+                [date(2024, 5, 10), 120],
+                [date(2023, 5, 10), 100],
+            ],
+        )
+
+        with_yoy = calculate_year_over_year(result, "date", "sales")
+
+        assert with_yoy.rows[0][-3:] == [None, None, None]
+        assert with_yoy.rows[1][-3:] == [100.0, 20.0, 20.0]
+        assert with_yoy.rows[2][-3:] == [80.0, 20.0, 25.0]
+
+    def test_yoy_from_zero_matches_calculate_trend(self) -> None:
+        """Test that a change from zero last year is reported as +/-100%."""
+        result = make_result(
+            columns=["date", "sales"],
+            rows=[
+                [date(2023, 1, 1), 0],
+                [date(2024, 1, 1), -5],
+                [date(2023, 2, 1), 0],
+                [date(2024, 2, 1), 5],
+            ],
+        )
+
+        with_yoy = calculate_year_over_year(result, "date", "sales")
+
+        assert with_yoy.rows[1][-1] == calculate_trend(-5, 0).percent_change == -100.0
+        assert with_yoy.rows[3][-1] == calculate_trend(5, 0).percent_change == 100.0
+
     def test_yoy_with_datetime(self) -> None:
         """Test YoY with datetime column."""
         result = make_result(
@@ -476,12 +665,28 @@ class TestCalculateYearOverYear:
         row_2024 = next(r for r in with_yoy.rows if r[0] == datetime(2024, 3, 1, 10, 0))
         assert row_2024[-3] == 150  # Found prev year
 
-    def test_yoy_empty_result(self) -> None:
-        """Test with empty result."""
-        result = make_result(columns=["date", "sales"], rows=[])
+    def test_yoy_mixed_date_types_and_bad_values(self) -> None:
+        """Test matching dates against datetimes, and rows with unusable values."""
+        result = make_result(
+            columns=["date", "sales"],
+            rows=[
+                [date(2023, 3, 1), 100],
+                [datetime(2024, 3, 1, 9, 30), 130],
+                [date(2024, 3, 1), "n/a"],
+                ["2024-03-01", 130],
+            ],
+        )
 
         with_yoy = calculate_year_over_year(result, "date", "sales")
 
+        assert with_yoy.rows[1][-3:] == [100.0, 30.0, 30.0]
+        assert with_yoy.rows[2][-3:] == [100.0, None, None]
+        assert with_yoy.rows[3][-3:] == [None, None, None]
+
+    def test_yoy_empty_result(self, empty_sales: QueryResult) -> None:
+        """Test with empty result."""
+        with_yoy = calculate_year_over_year(empty_sales, "date", "sales")
+
         assert len(with_yoy.columns) == 5
         assert with_yoy.rows == []
 
@@ -504,7 +709,70 @@ class TestComparisonPeriod:
         ]
         assert len(periods) == 4
 
+    def test_comparison_accepts_string_value(self) -> None:
+        """Test that calculate_period_comparison accepts a period's string value."""
+        result = make_result(
+            columns=["date", "sales"],
+            rows=[[date(2024, 1, 8), 120], [date(2024, 1, 1), 100]],
+        )
+        args = ("date", "sales")
+        bounds = (date(2024, 1, 8), date(2024, 1, 8))
+
+        by_value = calculate_period_comparison(result, *args, "previous_week", *bounds)
+        by_member = calculate_period_comparison(
+            result, *args, ComparisonPeriod.PREVIOUS_WEEK, *bounds
+        )
+
+        assert by_value == by_member
+        assert by_value.previous_value == 100
+
+    def test_comparison_rejects_unknown_string(self) -> None:
+        """Test that an unknown period string is rejected rather than defaulted."""
+        result = make_result(columns=["date", "sales"], rows=[[date(2024, 1, 8), 120]])
+
+        with pytest.raises(ValueError, match="not a valid ComparisonPeriod"):
+            calculate_period_comparison(
+                result, "date", "sales", "last_decade", date(2024, 1, 8), date(2024, 1, 8)
+            )
+
     def test_period_values(self) -> None:
         """Test period string values."""
         assert ComparisonPeriod.PREVIOUS_PERIOD.value == "previous_period"
         assert ComparisonPeriod.PREVIOUS_YEAR.value == "previous_year"
+
+
+# ============================================================================
+# Shared Fixture Tests
+# ============================================================================
+
+
+class TestSharedDailySales:
+    """Tests that run against the module-scoped daily_sales fixture."""
+
+    def test_functions_leave_input_unchanged(self, daily_sales: QueryResult) -> None:
+        """Test that sharing the fixture is safe because inputs are never mutated."""
+        snapshot = copy.deepcopy(daily_sales.rows)
+
+        add_trend_column(daily_sales, "sales", "date", group_column="region")
+        calculate_moving_average(daily_sales, "sales", window=3, order_column="date")
+        calculate_year_over_year(daily_sales, "date", "sales")
+
+        assert daily_sales.rows == snapshot
+
+    def test_grouped_trend(self, daily_sales: QueryResult) -> None:
+        """Test that each region steps by 10 per day, across the year boundary too."""
+        with_trend = add_trend_column(daily_sales, "sales", "date", group_column="region")
+
+        for region in ("East", "West"):
+            changes = [r[-2] for r in with_trend.rows if r[0] == region]
+            assert changes == [None] + [10.0] * 19
+
+    def test_year_over_year(self, daily_sales: QueryResult) -> None:
+        """Test YoY on a multi-region series: it ignores regions, so the last row per day wins."""
+        with_yoy = calculate_year_over_year(daily_sales, "date", "sales")
+
+        for row in with_yoy.rows:
+            if row[1].year == 2023:
+                assert row[-3:] == [None, None, None]
+            else:
+                assert row[-3] == 100 + 10 * row[1].day + 5  # 2023 West value
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from enum import Enum
+from typing import Any
+
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from prismiq.types import (
     AggregationType,
@@ -27,6 +30,20 @@ from prismiq.types import (
     TableSchema,
 )
 
+
+def make_query(
+    tables: list[QueryTable],
+    columns: list[ColumnSelection],
+    **fields: object,
+) -> QueryDefinition:
+    """Build a QueryDefinition without validation, for tests of its methods.
+
+    Validator behaviour is covered by the construction tests, which keep
+    using the validating constructor.
+    """
+    return QueryDefinition.model_construct(tables=tables, columns=columns, **fields)
+
+
 # ============================================================================
 # Schema Type Tests
 # ============================================================================
@@ -129,6 +146,18 @@ class TestRelationship:
         assert rel.to_table == "users"
         assert rel.to_column == "id"
 
+    def test_relationship_is_frozen_and_hashable(self) -> None:
+        """Test that relationships are immutable and usable as set members."""
+        rel = Relationship(
+            from_table="orders",
+            from_column="user_id",
+            to_table="users",
+            to_column="id",
+        )
+        with pytest.raises(ValidationError):
+            rel.to_table = "accounts"  # type: ignore[misc]
+        assert rel in {rel.model_copy()}
+
 
 class TestDatabaseSchema:
     """Tests for DatabaseSchema model."""
@@ -192,256 +221,291 @@ class TestDatabaseSchema:
 # ============================================================================
 
 
-class TestQueryTable:
-    """Tests for QueryTable model."""
-
-    def test_basic_query_table(self) -> None:
-        """Test creating a basic query table."""
-        qt = QueryTable(id="t1", name="users")
-        assert qt.id == "t1"
-        assert qt.name == "users"
-        assert qt.alias is None
+_JOIN_FIELDS = {
+    "from_table_id": "t1",
+    "from_column": "user_id",
+    "to_table_id": "t2",
+    "to_column": "id",
+}
+
+
+class TestQueryComponents:
+    """Construction tests for QueryTable, JoinDefinition and ColumnSelection."""
+
+    @pytest.mark.parametrize(
+        "model,fields,expected",
+        [
+            pytest.param(
+                QueryTable,
+                {"id": "t1", "name": "users"},
+                {"id": "t1", "name": "users", "alias": None},
+                id="basic_query_table",
+            ),
+            pytest.param(
+                QueryTable,
+                {"id": "t1", "name": "users", "alias": "u"},
+                {"alias": "u"},
+                id="query_table_with_alias",
+            ),
+            pytest.param(
+                JoinDefinition,
+                _JOIN_FIELDS,
+                {"join_type": JoinType.INNER},
+                id="inner_join",
+            ),
+            pytest.param(
+                JoinDefinition,
+                {**_JOIN_FIELDS, "join_type": JoinType.LEFT},
+                {"join_type": JoinType.LEFT},
+                id="left_join",
+            ),
+            pytest.param(
+                ColumnSelection,
+                {"table_id": "t1", "column": "email"},
+                {"aggregation": AggregationType.NONE, "alias": None},
+                id="basic_selection",
+            ),
+            pytest.param(
+                ColumnSelection,
+                {
+                    "table_id": "t1",
+                    "column": "amount",
+                    "aggregation": AggregationType.SUM,
+                    "alias": "total_amount",
+                },
+                {"aggregation": AggregationType.SUM, "alias": "total_amount"},
+                id="aggregated_selection",
+            ),
+        ],
+    )
+    def test_construct(
+        self, model: type[BaseModel], fields: dict[str, Any], expected: dict[str, Any]
+    ) -> None:
+        """Test that each model applies its defaults and keeps explicit fields."""
+        obj = model(**fields)
+        assert {name: getattr(obj, name) for name in expected} == expected
 
-    def test_query_table_with_alias(self) -> None:
-        """Test query table with alias."""
-        qt = QueryTable(id="t1", name="users", alias="u")
-        assert qt.alias == "u"
 
+class TestFilterDefinition:
+    """Tests for FilterDefinition model."""
 
-class TestJoinDefinition:
-    """Tests for JoinDefinition model."""
-
-    def test_inner_join(self) -> None:
-        """Test creating an inner join."""
-        join = JoinDefinition(
-            from_table_id="t1",
-            from_column="user_id",
-            to_table_id="t2",
-            to_column="id",
+    @pytest.mark.parametrize(
+        "operator,value",
+        [
+            (FilterOperator.EQ, "active"),
+            (FilterOperator.NEQ, "archived"),
+            (FilterOperator.GT, 5),
+            (FilterOperator.LTE, 9.5),
+            (FilterOperator.IN, ["active", "pending"]),
+            (FilterOperator.NOT_IN, ["archived"]),
+            (FilterOperator.IN_OR_NULL, ["active"]),
+            (FilterOperator.LIKE, "act%"),
+            (FilterOperator.BETWEEN, (1, 10)),
+            (FilterOperator.IS_NULL, None),
+            (FilterOperator.IS_NOT_NULL, None),
+            (FilterOperator.IN_SUBQUERY, {"sql": "SELECT id FROM users"}),
+        ],
+        ids=str,
+    )
+    def test_operator_value_shapes(self, operator: FilterOperator, value: Any) -> None:
+        """Test that each operator keeps the value shape documented for it."""
+        f = FilterDefinition(table_id="t1", column="status", operator=operator, value=value)
+        assert f.operator is operator
+        assert f.value == value
+
+    def test_value_defaults_to_none(self) -> None:
+        """Test that null checks can omit the value."""
+        f = FilterDefinition(
+            table_id="t1",
+            column="deleted_at",
+            operator=FilterOperator.IS_NULL,
         )
-        assert join.join_type == JoinType.INNER
+        assert f.value is None
 
-    def test_left_join(self) -> None:
-        """Test creating a left join."""
-        join = JoinDefinition(
-            from_table_id="t1",
-            from_column="user_id",
-            to_table_id="t2",
-            to_column="id",
-            join_type=JoinType.LEFT,
-        )
-        assert join.join_type == JoinType.LEFT
 
+@pytest.fixture(scope="module")
+def users_query_table() -> QueryTable:
+    """Query table t1 over users, shared read-only across query tests."""
+    return QueryTable(id="t1", name="users")
 
-class TestColumnSelection:
-    """Tests for ColumnSelection model."""
 
-    def test_basic_selection(self) -> None:
-        """Test basic column selection."""
-        sel = ColumnSelection(table_id="t1", column="email")
-        assert sel.aggregation == AggregationType.NONE
-        assert sel.alias is None
+@pytest.fixture(scope="module")
+def orders_query_table() -> QueryTable:
+    """Query table t1 over orders, shared read-only across query tests."""
+    return QueryTable(id="t1", name="orders")
 
-    def test_aggregated_selection(self) -> None:
-        """Test aggregated column selection."""
-        sel = ColumnSelection(
-            table_id="t1",
-            column="amount",
-            aggregation=AggregationType.SUM,
-            alias="total_amount",
-        )
-        assert sel.aggregation == AggregationType.SUM
-        assert sel.alias == "total_amount"
 
+@pytest.fixture(scope="module")
+def email_column() -> ColumnSelection:
+    """Plain selection of t1.email."""
+    return ColumnSelection(table_id="t1", column="email")
 
-class TestFilterDefinition:
-    """Tests for FilterDefinition model."""
 
-    def test_equality_filter(self) -> None:
-        """Test equality filter."""
-        f = FilterDefinition(
-            table_id="t1",
-            column="status",
-            operator=FilterOperator.EQ,
-            value="active",
-        )
-        assert f.operator == FilterOperator.EQ
-        assert f.value == "active"
+@pytest.fixture(scope="module")
+def status_column() -> ColumnSelection:
+    """Plain selection of t1.status."""
+    return ColumnSelection(table_id="t1", column="status")
 
-    def test_in_filter(self) -> None:
-        """Test IN filter."""
-        f = FilterDefinition(
-            table_id="t1",
-            column="status",
-            operator=FilterOperator.IN,
-            value=["active", "pending"],
-        )
-        assert f.value == ["active", "pending"]
 
-    def test_null_filter(self) -> None:
-        """Test IS NULL filter."""
-        f = FilterDefinition(
-            table_id="t1",
-            column="deleted_at",
-            operator=FilterOperator.IS_NULL,
-        )
-        assert f.value is None
+@pytest.fixture(scope="module")
+def amount_sum_column() -> ColumnSelection:
+    """SUM(t1.amount) selection."""
+    return ColumnSelection(table_id="t1", column="amount", aggregation=AggregationType.SUM)
 
 
 class TestQueryDefinition:
     """Tests for QueryDefinition model."""
 
-    def test_simple_query(self) -> None:
+    def test_simple_query(
+        self, users_query_table: QueryTable, email_column: ColumnSelection
+    ) -> None:
         """Test creating a simple query."""
-        query = QueryDefinition(
-            tables=[QueryTable(id="t1", name="users")],
-            columns=[ColumnSelection(table_id="t1", column="email")],
+        query = QueryDefinition(tables=[users_query_table], columns=[email_column])
+        assert (query.tables, query.columns, query.joins, query.filters) == (
+            [users_query_table],
+            [email_column],
+            [],
+            [],
         )
-        assert len(query.tables) == 1
-        assert len(query.columns) == 1
-        assert query.joins == []
-        assert query.filters == []
 
     def test_query_with_join(self) -> None:
         """Test query with join."""
+        join = JoinDefinition(
+            from_table_id="t1",
+            from_column="user_id",
+            to_table_id="t2",
+            to_column="id",
+        )
         query = QueryDefinition(
             tables=[
                 QueryTable(id="t1", name="orders"),
                 QueryTable(id="t2", name="users"),
             ],
-            joins=[
-                JoinDefinition(
-                    from_table_id="t1",
-                    from_column="user_id",
-                    to_table_id="t2",
-                    to_column="id",
-                ),
-            ],
+            joins=[join],
             columns=[
                 ColumnSelection(table_id="t1", column="total"),
                 ColumnSelection(table_id="t2", column="email"),
             ],
         )
-        assert len(query.joins) == 1
-
-    def test_empty_tables_raises_error(self) -> None:
-        """Test that empty tables raises validation error."""
-        with pytest.raises(ValidationError, match="At least one table must be specified"):
-            QueryDefinition(
-                tables=[],
-                columns=[ColumnSelection(table_id="t1", column="email")],
-            )
-
-    def test_empty_columns_raises_error(self) -> None:
-        """Test that empty columns raises validation error."""
-        with pytest.raises(ValidationError, match="At least one column must be selected"):
-            QueryDefinition(
-                tables=[QueryTable(id="t1", name="users")],
-                columns=[],
-            )
-
-    def test_invalid_table_reference_in_join(self) -> None:
-        """Test that invalid table reference in join raises error."""
-        with pytest.raises(ValidationError, match="unknown table_id"):
-            QueryDefinition(
-                tables=[QueryTable(id="t1", name="users")],
-                joins=[
-                    JoinDefinition(
-                        from_table_id="t1",
-                        from_column="id",
-                        to_table_id="t99",  # Invalid
-                        to_column="user_id",
-                    ),
-                ],
-                columns=[ColumnSelection(table_id="t1", column="email")],
-            )
-
-    def test_invalid_table_reference_in_column(self) -> None:
-        """Test that invalid table reference in column raises error."""
-        with pytest.raises(ValidationError, match="unknown table_id"):
-            QueryDefinition(
-                tables=[QueryTable(id="t1", name="users")],
-                columns=[ColumnSelection(table_id="t99", column="email")],  # Invalid
-            )
-
-    def test_invalid_table_reference_in_filter(self) -> None:
-        """Test that invalid table reference in filter raises error."""
-        with pytest.raises(ValidationError, match="unknown table_id"):
-            QueryDefinition(
-                tables=[QueryTable(id="t1", name="users")],
-                columns=[ColumnSelection(table_id="t1", column="email")],
-                filters=[
-                    FilterDefinition(
-                        table_id="t99",  # Invalid
-                        column="status",
-                        operator=FilterOperator.EQ,
-                        value="active",
-                    )
-                ],
-            )
-
-    def test_has_aggregations_false(self) -> None:
+        assert (query.joins, query.filters) == ([join], [])
+
+    @pytest.mark.parametrize(
+        "fields,message",
+        [
+            pytest.param(
+                {"tables": [], "columns": [{"table_id": "t1", "column": "email"}]},
+                "At least one table must be specified",
+                id="empty_tables",
+            ),
+            pytest.param(
+                {"tables": [{"id": "t1", "name": "users"}], "columns": []},
+                "At least one column must be selected",
+                id="empty_columns",
+            ),
+            pytest.param(
+                {
+                    "tables": [{"id": "t1", "name": "users"}],
+                    "joins": [
+                        {
+                            "from_table_id": "t1",
+                            "from_column": "id",
+                            "to_table_id": "t99",
+                            "to_column": "user_id",
+                        }
+                    ],
+                    "columns": [{"table_id": "t1", "column": "email"}],
+                },
+                "Join references unknown table_id: t99",
+                id="unknown_table_in_join",
+            ),
+            pytest.param(
+                {
+                    "tables": [{"id": "t1", "name": "users"}],
+                    "columns": [{"table_id": "t99", "column": "email"}],
+                },
+                "Column selection references unknown table_id: t99",
+                id="unknown_table_in_column",
+            ),
+            pytest.param(
+                {
+                    "tables": [{"id": "t1", "name": "users"}],
+                    "columns": [{"table_id": "t1", "column": "email"}],
+                    "filters": [
+                        {"table_id": "t99", "column": "status", "operator": "eq", "value": "active"}
+                    ],
+                },
+                "Filter references unknown table_id: t99",
+                id="unknown_table_in_filter",
+            ),
+        ],
+    )
+    def test_invalid_query_raises_error(self, fields: dict[str, Any], message: str) -> None:
+        """Test that each invalid query shape raises exactly the expected validation error."""
+        with pytest.raises(ValidationError) as exc_info:
+            QueryDefinition.model_validate(fields)
+
+        errors = exc_info.value.errors()
+        assert [(e["type"], e["msg"]) for e in errors] == [
+            ("value_error", f"Value error, {message}")
+        ]
+
+    def test_has_aggregations_false(
+        self, users_query_table: QueryTable, email_column: ColumnSelection
+    ) -> None:
         """Test has_aggregations returns False when no aggregations."""
-        query = QueryDefinition(
-            tables=[QueryTable(id="t1", name="users")],
-            columns=[ColumnSelection(table_id="t1", column="email")],
-        )
+        query = make_query(tables=[users_query_table], columns=[email_column])
         assert query.has_aggregations() is False
 
-    def test_has_aggregations_true(self) -> None:
+    def test_has_aggregations_true(
+        self, orders_query_table: QueryTable, amount_sum_column: ColumnSelection
+    ) -> None:
         """Test has_aggregations returns True with aggregations."""
-        query = QueryDefinition(
-            tables=[QueryTable(id="t1", name="orders")],
-            columns=[
-                ColumnSelection(table_id="t1", column="amount", aggregation=AggregationType.SUM),
-            ],
-        )
+        query = make_query(tables=[orders_query_table], columns=[amount_sum_column])
         assert query.has_aggregations() is True
 
-    def test_derive_group_by_empty_when_no_aggregations(self) -> None:
+    def test_derive_group_by_empty_when_no_aggregations(
+        self, users_query_table: QueryTable, email_column: ColumnSelection
+    ) -> None:
         """Test derive_group_by returns empty when no aggregations."""
-        query = QueryDefinition(
-            tables=[QueryTable(id="t1", name="users")],
-            columns=[ColumnSelection(table_id="t1", column="email")],
-        )
+        query = make_query(tables=[users_query_table], columns=[email_column])
         assert query.derive_group_by() == []
 
-    def test_derive_group_by_auto_derives(self) -> None:
+    def test_derive_group_by_auto_derives(
+        self,
+        orders_query_table: QueryTable,
+        status_column: ColumnSelection,
+        amount_sum_column: ColumnSelection,
+    ) -> None:
         """Test derive_group_by auto-derives from non-aggregated columns."""
-        query = QueryDefinition(
-            tables=[QueryTable(id="t1", name="orders")],
-            columns=[
-                ColumnSelection(table_id="t1", column="status"),
-                ColumnSelection(table_id="t1", column="amount", aggregation=AggregationType.SUM),
-            ],
-        )
+        query = make_query(tables=[orders_query_table], columns=[status_column, amount_sum_column])
         group_by = query.derive_group_by()
         assert len(group_by) == 1
         assert group_by[0].table_id == "t1"
         assert group_by[0].column == "status"
 
-    def test_derive_group_by_uses_explicit(self) -> None:
+    def test_derive_group_by_uses_explicit(
+        self,
+        orders_query_table: QueryTable,
+        status_column: ColumnSelection,
+        amount_sum_column: ColumnSelection,
+    ) -> None:
         """Test derive_group_by uses explicit group_by if provided."""
-        query = QueryDefinition(
-            tables=[QueryTable(id="t1", name="orders")],
-            columns=[
-                ColumnSelection(table_id="t1", column="status"),
-                ColumnSelection(table_id="t1", column="amount", aggregation=AggregationType.SUM),
-            ],
+        query = make_query(
+            tables=[orders_query_table],
+            columns=[status_column, amount_sum_column],
             group_by=[GroupByDefinition(table_id="t1", column="category")],
         )
         group_by = query.derive_group_by()
         assert len(group_by) == 1
         assert group_by[0].column == "category"
 
-    def test_get_table_by_id(self) -> None:
+    def test_get_table_by_id(
+        self, users_query_table: QueryTable, email_column: ColumnSelection
+    ) -> None:
         """Test get_table_by_id method."""
-        query = QueryDefinition(
-            tables=[
-                QueryTable(id="t1", name="users"),
-                QueryTable(id="t2", name="orders"),
-            ],
-            columns=[ColumnSelection(table_id="t1", column="email")],
+        query = make_query(
+            tables=[users_query_table, QueryTable(id="t2", name="orders")],
+            columns=[email_column],
         )
         assert query.get_table_by_id("t1") is not None
         assert query.get_table_by_id("t1").name == "users"  # type: ignore[union-attr]
@@ -525,24 +589,22 @@ class TestExceptions:
 class TestEnums:
     """Tests for enum types."""
 
-    def test_aggregation_type_values(self) -> None:
-        """Test AggregationType enum values."""
-        assert AggregationType.NONE.value == "none"
-        assert AggregationType.SUM.value == "sum"
-        assert AggregationType.COUNT_DISTINCT.value == "count_distinct"
-
-    def test_filter_operator_values(self) -> None:
-        """Test FilterOperator enum values."""
-        assert FilterOperator.EQ.value == "eq"
-        assert FilterOperator.IN.value == "in_"
-        assert FilterOperator.IS_NULL.value == "is_null"
-
-    def test_join_type_values(self) -> None:
-        """Test JoinType enum values."""
-        assert JoinType.INNER.value == "INNER"
-        assert JoinType.LEFT.value == "LEFT"
-
-    def test_sort_direction_values(self) -> None:
-        """Test SortDirection enum values."""
-        assert SortDirection.ASC.value == "ASC"
-        assert SortDirection.DESC.value == "DESC"
+    @pytest.mark.parametrize(
+        "member,expected",
+        [
+            (AggregationType.NONE, "none"),
+            (AggregationType.SUM, "sum"),
+            (AggregationType.COUNT_DISTINCT, "count_distinct"),
+            (FilterOperator.EQ, "eq"),
+            (FilterOperator.IN, "in_"),
+            (FilterOperator.IS_NULL, "is_null"),
+            (JoinType.INNER, "INNER"),
+            (JoinType.LEFT, "LEFT"),
+            (SortDirection.ASC, "ASC"),
+            (SortDirection.DESC, "DESC"),
+        ],
+        ids=str,
+    )
+    def test_enum_values(self, member: Enum, expected: str) -> None:
+        """Test the wire value of each enum member."""
+        assert member.value == expected
@@ -159,6 +159,29 @@ class TestColumnNotFound:
         assert result.errors[0].suggestion is not None
         assert "email" in result.errors[0].suggestion
 
+    def test_suggestion_keeps_original_case(self) -> None:
+        """Suggestions use the schema's spelling and list case variants once."""
+        schema = DatabaseSchema(
+            tables=[
+                TableSchema(
+                    name="accounts",
+                    columns=[
+                        ColumnSchema(name="Email", data_type="varchar", is_nullable=False),
+                        ColumnSchema(name="email", data_type="varchar", is_nullable=False),
+                    ],
+                )
+            ],
+            relationships=[],
+        )
+        builder = QueryBuilder(schema)
+        query = QueryDefinition(
+            tables=[QueryTable(id="t1", name="accounts")],
+            columns=[ColumnSelection(table_id="t1", column="EMAILS")],
+        )
+
+        result = builder.validate_detailed(query)
+        assert result.errors[0].suggestion == "Did you mean 'Email'?"
+
     def test_filter_column_not_found(self, sample_schema: DatabaseSchema) -> None:
         """Missing filter column produces error."""
         builder = QueryBuilder(sample_schema)
@@ -416,6 +439,33 @@ class TestInvalidAggregation:
         result = builder.validate_detailed(query)
         assert result.valid is True
 
+    @pytest.mark.parametrize("data_type", ["numeric(10,2)", "DOUBLE PRECISION", "bigint"])
+    def test_sum_on_numeric_type_spellings(self, data_type: str) -> None:
+        """Numeric types are matched case-insensitively, including parameterized ones."""
+        schema = DatabaseSchema(
+            tables=[
+                TableSchema(
+                    name="items",
+                    columns=[ColumnSchema(name="amount", data_type=data_type, is_nullable=True)],
+                )
+            ],
+            relationships=[],
+        )
+        builder = QueryBuilder(schema)
+        query = QueryDefinition(
+            tables=[QueryTable(id="t1", name="items")],
+            columns=[
+                ColumnSelection(table_id="t1", column="amount", aggregation=AggregationType.SUM)
+            ],
+            filters=[
+                FilterDefinition(
+                    table_id="t1", column="amount", operator=FilterOperator.GT, value=1.5
+                )
+            ],
+        )
+
+        assert builder.validate_detailed(query).valid is True
+
     def test_count_on_any_column(self, sample_schema: DatabaseSchema) -> None:
         """COUNT is valid on any column."""
         builder = QueryBuilder(sample_schema)